@@ -228,6 +228,11 @@ def register():
 
     if link_reconnect not in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.append(link_reconnect)
+    for handler in [bpy.app.handlers.undo_post, bpy.app.handlers.redo_post]:
+        if link_index_invalidate not in handler:
+            handler.append(link_index_invalidate)
+    if link_index_update not in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.append(link_index_update)
 
 
 def unregister():
@@ -247,9 +252,24 @@ def unregister():
 
     if link_reconnect in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.remove(link_reconnect)
+    for handler in [bpy.app.handlers.undo_post, bpy.app.handlers.redo_post]:
+        if link_index_invalidate in handler:
+            handler.remove(link_index_invalidate)
+    if link_index_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(link_index_update)
 
 
 @persistent
 def link_reconnect(file_path):
+    link.invalidate_link_index(clear_alias=True)
     link.reconnect()
 
+
+@persistent
+def link_index_invalidate(*args):
+    link.invalidate_link_index()
+
+
+@persistent
+def link_index_update(scene, depsgraph=None):
+    link.update_link_index()
@@ -16,6 +16,7 @@
 
 import bpy
 import os
+import numpy as np
 from mathutils import Vector
 from . import normal, colorspace, imageutils, wrinkle, nodeutils, properties, utils, params, vars
 from .exporter import get_export_objects
@@ -418,6 +419,48 @@ def bake_bsdf_normal(bsdf_node, mat, channel_id, bake_dir, name_prefix = "", ove
     return image
 
 
+def get_image_pixels(image: bpy.types.Image):
+    """Returns the image pixels as a float32 [pixels, 4] RGBA array."""
+    channels = image.channels
+    pixels = np.empty(len(image.pixels), dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    pixels = pixels.reshape((-1, channels))
+    if channels == 4:
+        return pixels
+    rgba = np.ones((len(pixels), 4), dtype=np.float32)
+    if channels >= 3:
+        rgba[:, 0:channels] = pixels[:, 0:channels]
+    else:
+        rgba[:, 0:3] = pixels[:, 0:1]
+        if channels == 2:
+            rgba[:, 3] = pixels[:, 1]
+    return rgba
+
+
+def set_image_pixels(image: bpy.types.Image, pixels):
+    """Writes a float32 [pixels, 4] RGBA array into the image pixels."""
+    channels = image.channels
+    if channels != 4:
+        pixels = pixels[:, 0:channels]
+    image.pixels.foreach_set(np.ascontiguousarray(pixels, dtype=np.float32).ravel())
+
+
+def smoothness_from_roughness(roughness, smoothness_mapping):
+    """Converts roughness values (or arrays) to smoothness with the bake smoothness mapping."""
+    if smoothness_mapping == "SIR":
+        return np.power(1 - roughness, 2)
+    elif smoothness_mapping == "IRS":
+        return 1 - np.power(roughness, 2)
+    elif smoothness_mapping == "IRSR":
+        return 1 - np.power(np.maximum(roughness, 0), 0.5)
+    elif smoothness_mapping == "SRIR":
+        return np.power(np.maximum(1 - roughness, 0), 0.5)
+    elif smoothness_mapping == "SRIRS":
+        return np.power(np.maximum(1 - np.power(roughness, 2), 0), 0.5)
+    else: # IR
+        return 1 - roughness
+
+
 def pack_value_image(value, mat, channel_id, bake_dir, name_prefix = "", size = 64):
     """Generates a 64 x 64 texture of a single value. Linear or sRGB depending on channel id.\n
        Image name and path is determined by the texture channel id, material name, bake dir and name prefix."""
@@ -426,17 +469,11 @@ def pack_value_image(value, mat, channel_id, bake_dir, name_prefix = "", size =
     height = size
     image, image_name, exists = get_bake_image(mat, channel_id, width, height, None, "", bake_dir, name_prefix = name_prefix)
 
-    image_pixels = list(image.pixels)
+    image_pixels = np.empty((width * height, 4), dtype=np.float32)
+    image_pixels[:, 0:3] = value
+    image_pixels[:, 3] = 1
 
-    l = len(image_pixels)
-    for i in range(0, l, 4):
-        image_pixels[i + 0] = value
-        image_pixels[i + 1] = value
-        image_pixels[i + 2] = value
-        image_pixels[i + 3] = 1
-
-    # replace-in-place all the pixels from the list:
-    image.pixels[:] = image_pixels
+    set_image_pixels(image, image_pixels)
     image.update()
     image.save()
     return image
@@ -505,59 +542,31 @@ def pack_RGBA(mat, channel_id, pack_mode, bake_dir,
         image_a.scale(width, height)
         remove_after.append(image_a)
 
-    r_data = None
-    g_data = None
-    b_data = None
-    a_data = None
-
-    if image_r:
-        r_data = image_r.pixels[:]
-    if image_g:
-        g_data = image_g.pixels[:]
-    if image_b:
-        b_data = image_b.pixels[:]
-    if image_a:
-        a_data = image_a.pixels[:]
-
-    image_pixels = list(image.pixels)
+    r_data = get_image_pixels(image_r) if image_r else None
+    g_data = get_image_pixels(image_g) if image_g else None
+    b_data = get_image_pixels(image_b) if image_b else None
+    a_data = get_image_pixels(image_a) if image_a else None
 
-    l = len(image_pixels)
+    image_pixels = get_image_pixels(image)
 
     if pack_mode == "RGB_A":
-        for i in range(0, l, 4):
-            if r_data:
-                image_pixels[i] = r_data[i]
-                image_pixels[i + 1] = r_data[i + 1]
-                image_pixels[i + 2] = r_data[i + 2]
-            else:
-                image_pixels[i] = value_r
-                image_pixels[i + 1] = value_g
-                image_pixels[i + 2] = value_b
-            if a_data:
-                image_pixels[i + 3] = a_data[i]
-            else:
-                image_pixels[i + 2] = value_a
+        if r_data is not None:
+            image_pixels[:, 0:3] = r_data[:, 0:3]
+        else:
+            image_pixels[:, 0:3] = (value_r, value_g, value_b)
+        if a_data is not None:
+            image_pixels[:, 3] = a_data[:, 0]
+        else:
+            image_pixels[:, 3] = value_a
 
     elif pack_mode == "R_G_B_A":
-        for i in range(0, l, 4):
-            if r_data:
-                image_pixels[i] = r_data[i]
-            else:
-                image_pixels[i] = value_r
-            if g_data:
-                image_pixels[i + 1] = g_data[i]
+        for c, data, value in [ (0, r_data, value_r), (1, g_data, value_g), (2, b_data, value_b), (3, a_data, value_a) ]:
+            if data is not None:
+                image_pixels[:, c] = data[:, 0]
             else:
-                image_pixels[i + 1] = value_g
-            if b_data:
-                image_pixels[i + 2] = b_data[i]
-            else:
-                image_pixels[i + 2] = value_b
-            if a_data:
-                image_pixels[i + 3] = a_data[i]
-            else:
-                image_pixels[i + 3] = value_a
+                image_pixels[:, c] = value
 
-    image.pixels[:] = image_pixels
+    set_image_pixels(image, image_pixels)
     image.update()
     image.save()
 
@@ -894,41 +903,31 @@ def bake_flow_to_normal(chr_cache, mat_cache):
 
 def convert_flow_to_normal(flow_image: bpy.types.Image, normal_image: bpy.types.Image, tangent, flip_y):
 
-    # fetching a copy of the normal pixels as a list gives us the fastest write speed:
-    normal_pixels = list(normal_image.pixels)
-    # fetching the flow pixels as a tuple with slice notation gives the fastest read speed:
-    flow_pixels = flow_image.pixels[:]
-
-    #tangent_vector = Vector(tangent)
+    flow_pixels = get_image_pixels(flow_image)
 
     if flip_y:
         flip = -1
     else:
         flip = 1
 
-    l = len(flow_pixels)
-    for i in range(0, l, 4):
-
-        # rgb -> flow_vector
-        flow_vector = Vector((flow_pixels[i + 0] * 2 - 1,
-                             (flow_pixels[i + 1] * 2 - 1) * flip,
-                              flow_pixels[i + 2] * 2 - 1))
-        tangent_vector = Vector((-flow_vector.y, flow_vector.x, 0))
-
-        # calculate normal vector
-        normal_vector = flow_vector.cross(tangent_vector)
-        normal_vector.x *= 0.35
-        normal_vector.y *= 0.35
-        normal_vector.normalize()
-
-        # normal_vector -> rgb
-        normal_pixels[i + 0] = (normal_vector[0] + 1) / 2
-        normal_pixels[i + 1] = (normal_vector[1] + 1) / 2
-        normal_pixels[i + 2] = (normal_vector[2] + 1) / 2
-        normal_pixels[i + 3] = 1
-
-    # replace-in-place all the pixels from the list:
-    normal_image.pixels[:] = normal_pixels
+    # rgb -> flow vector
+    fx = flow_pixels[:, 0] * 2 - 1
+    fy = (flow_pixels[:, 1] * 2 - 1) * flip
+    fz = flow_pixels[:, 2] * 2 - 1
+
+    # normal = flow x tangent, where tangent = (-flow.y, flow.x, 0)
+    normal_pixels = np.empty((len(flow_pixels), 4), dtype=np.float32)
+    normal_pixels[:, 0] = -fz * fx * 0.35
+    normal_pixels[:, 1] = -fz * fy * 0.35
+    normal_pixels[:, 2] = fx * fx + fy * fy
+    length = np.linalg.norm(normal_pixels[:, 0:3], axis=1)
+    length[length == 0] = 1
+
+    # normal vector -> rgb
+    normal_pixels[:, 0:3] = (normal_pixels[:, 0:3] / length[:, None] + 1) / 2
+    normal_pixels[:, 3] = 1
+
+    set_image_pixels(normal_image, normal_pixels)
     normal_image.update()
     normal_image.save()
 
@@ -1412,6 +1411,7 @@ def copy_image_target(image_node, name, width, height, data = True, alpha = Fals
     dir = os.path.join(bpy.path.abspath("//"), path)
     os.makedirs(dir, exist_ok=True)
     img.filepath_raw = os.path.join(dir, name + ext)
+    imageutils.add_image_path(img)
     img.save()
 
     return img
@@ -1547,6 +1547,7 @@ def can_bake_shader_node(shader_node, bsdf_node, bsdf_socket):
     return nodeutils.get_node_connected_to_input(bsdf_node, bsdf_socket) == shader_node
 
 
+@utils.profiled("Bake Export Material")
 def bake_export_material(mat, source_mat, source_mat_cache):
     props = bpy.context.scene.CCICBakeProps
     nodes = mat.node_tree.nodes
@@ -1877,9 +1878,10 @@ def fetch_pack_image_data(width, height, *nodes, no_rescale = False):
                 utils.log_info(f" - Scaling tex image: {width} x {height}")
                 scaled_image = image.copy()
                 scaled_image.scale(width, height)
-                pixels = list(scaled_image.pixels)
+                pixels = get_image_pixels(scaled_image)
+                bpy.data.images.remove(scaled_image)
             else:
-                pixels = list(image.pixels)
+                pixels = get_image_pixels(image)
         data.append(pixels)
 
     return data
@@ -1910,27 +1912,20 @@ def combine_diffuse_tex(nodes, source_mat, source_mat_cache, mat, diffuse_node,
     image_node = nodeutils.make_image_node(nodes, image, image_node_name)
     image_node.select = True
     nodes.active = image_node
-    # writeable list copy for fastest write speed
-    image_data = list(image.pixels)
-    l = len(image_data)
-
-    for i in range(0, l, 4):
-        if diffuse_data:
-            image_data[i+0] = diffuse_data[i+0]
-            image_data[i+1] = diffuse_data[i+1]
-            image_data[i+2] = diffuse_data[i+2]
-        else:
-            image_data[i+0] = diffuse_value[0]
-            image_data[i+1] = diffuse_value[1]
-            image_data[i+2] = diffuse_value[2]
+    image_data = get_image_pixels(image)
 
-        if alpha_data:
-            image_data[i+3] = alpha_data[i]
-        else:
-            image_data[i+3] = 1
+    if diffuse_data is not None:
+        image_data[:, 0:3] = diffuse_data[:, 0:3]
+    else:
+        image_data[:, 0:3] = diffuse_value[0:3]
+
+    if alpha_data is not None:
+        image_data[:, 3] = alpha_data[:, 0]
+    else:
+        image_data[:, 3] = 1
 
     # replace in-place in one go.
-    image.pixels[:] = image_data
+    set_image_pixels(image, image_data)
     image.update()
     image.save()
 
@@ -1969,52 +1964,16 @@ def combine_hdrp_mask_tex(nodes, source_mat, source_mat_cache, mat,
     image_node = nodeutils.make_image_node(nodes, image, image_node_name)
     image_node.select = True
     nodes.active = image_node
-    image_data = list(image.pixels)
-    l = len(image_data)
+    image_data = get_image_pixels(image)
 
     # Mask: R: Metallic, G: AO, B: Micro-Normal Mask, A: Smoothness = 0.5 + 0.5*(1-Roughess)^2
-    for i in range(0, l, 4):
+    image_data[:, 0] = metallic_data[:, 0] if metallic_data is not None else metallic_value
+    image_data[:, 1] = ao_data[:, 0] if ao_data is not None else ao_value
+    image_data[:, 2] = mask_data[:, 0] if mask_data is not None else mask_value
+    roughness = roughness_data[:, 0] if roughness_data is not None else roughness_value
+    image_data[:, 3] = smoothness_from_roughness(roughness, props.smoothness_mapping)
 
-        # Red
-        if metallic_data:
-            image_data[i] = metallic_data[i]
-        else:
-            image_data[i] = metallic_value
-
-        # Green
-        if ao_data:
-            image_data[i+1] = ao_data[i]
-        else:
-            image_data[i+1] = ao_value
-
-        # Blue
-        if mask_data:
-            image_data[i+2] = mask_data[i]
-        else:
-            image_data[i+2] = mask_value
-
-        # Alpha
-        if roughness_data:
-            roughness = roughness_data[i]
-        else:
-            roughness = roughness_value
-
-        if props.smoothness_mapping == "SIR":
-            smoothness = pow(1 - roughness, 2)
-        elif props.smoothness_mapping == "IRS":
-            smoothness = 1 - pow(roughness, 2)
-        elif props.smoothness_mapping == "IRSR":
-            smoothness = 1 - pow(roughness, 0.5)
-        elif props.smoothness_mapping == "SRIR":
-            smoothness = pow(1 - roughness, 0.5)
-        elif props.smoothness_mapping == "SRIRS":
-            smoothness = pow(1 - pow(roughness, 2), 0.5)
-        else: # IR
-            smoothness = 1 - roughness
-
-        image_data[i+3] = smoothness
-
-    image.pixels[:] = image_data
+    set_image_pixels(image, image_data)
     image.update()
     image.save()
 
@@ -2028,9 +1987,9 @@ def combine_hdrp_detail_tex(nodes, source_mat, source_mat_cache, mat,
     path = get_bake_path()
     width, height = nodeutils.get_largest_image_size(detail_normal_node)
     width, height = apply_override_size(mat, map_suffix, width, height)
-    detail_data = fetch_pack_image_data(width, height, detail_normal_node)
+    detail_data, = fetch_pack_image_data(width, height, detail_normal_node)
 
-    if not detail_data:
+    if detail_data is None:
         return
 
     utils.log_info("Combining Unity HDRP Detail Texture...")
@@ -2041,23 +2000,15 @@ def combine_hdrp_detail_tex(nodes, source_mat, source_mat_cache, mat,
     image_node = nodeutils.make_image_node(nodes, image, image_node_name)
     image_node.select = True
     nodes.active = image_node
-    image_data = list(image.pixels)
-    l = len(image_data)
+    image_data = get_image_pixels(image)
 
     # Detail: R: 0.5, G: Micro-Normal.R, B: 0.5, A: Micro-Normal.G
-    for i in range(0, l, 4):
-
-        image_data[i+0] = 0.5
-        image_data[i+2] = 0.5
+    image_data[:, 0] = 0.5
+    image_data[:, 1] = detail_data[:, 0]
+    image_data[:, 2] = 0.5
+    image_data[:, 3] = detail_data[:, 1]
 
-        if detail_data:
-            image_data[i+1] = detail_data[i+0]
-            image_data[i+3] = detail_data[i+1]
-        else:
-            image_data[i+1] = 0.5
-            image_data[i+3] = 0.5
-
-    image.pixels[:] = image_data
+    set_image_pixels(image, image_data)
     image.update()
     image.save()
 
@@ -2066,14 +2017,10 @@ def process_hdrp_subsurfaces_tex(sss_node, trans_node):
 
     if trans_node and trans_node.image:
         image = trans_node.image
-        trans_data = list(image.pixels)
-        l = len(trans_data)
-        for i in range(0, l, 4):
-            trans_data[i+0] = 1.0 - trans_data[i+0]
-            trans_data[i+1] = 1.0 - trans_data[i+1]
-            trans_data[i+2] = 1.0 - trans_data[i+2]
-
-        image.pixels[:] = trans_data
+        trans_data = get_image_pixels(image)
+        trans_data[:, 0:3] = 1.0 - trans_data[:, 0:3]
+
+        set_image_pixels(image, trans_data)
         image.update()
         image.save()
 
@@ -2108,41 +2055,15 @@ def make_metallic_smoothness_tex(nodes, source_mat, source_mat_cache, mat,
     image_node = nodeutils.make_image_node(nodes, image, image_node_name)
     image_node.select = True
     nodes.active = image_node
-    image_data = list(image.pixels)
-    l = len(image_data)
+    image_data = get_image_pixels(image)
 
-    # Mask: R: Metallic, G: AO, B: Micro-Normal Mask, A: Smoothness = 0.5 + 0.5*(1-Roughess)^2
-    for i in range(0, l, 4):
-
-        if roughness_data:
-            roughness = roughness_data[i]
-        else:
-            roughness = roughness_value
+    # Metallic Alpha: RGB: Metallic, A: Smoothness
+    roughness = roughness_data[:, 0] if roughness_data is not None else roughness_value
+    metallic = metallic_data[:, 0] if metallic_data is not None else metallic_value
+    image_data[:, 0:3] = np.reshape(metallic, (-1, 1))
+    image_data[:, 3] = smoothness_from_roughness(roughness, props.smoothness_mapping)
 
-        if metallic_data:
-            metallic = metallic_data[i]
-        else:
-            metallic = metallic_value
-
-        if props.smoothness_mapping == "SIR":
-            smoothness = pow(1 - roughness, 2)
-        elif props.smoothness_mapping == "IRS":
-            smoothness = 1 - pow(roughness, 2)
-        elif props.smoothness_mapping == "IRSR":
-            smoothness = 1 - pow(roughness, 0.5)
-        elif props.smoothness_mapping == "SRIR":
-            smoothness = pow(1 - roughness, 0.5)
-        elif props.smoothness_mapping == "SRIRS":
-            smoothness = pow(1 - pow(roughness, 2), 0.5)
-        else: # IR
-            smoothness = 1 - roughness
-
-        image_data[i+0] = metallic
-        image_data[i+1] = metallic
-        image_data[i+2] = metallic
-        image_data[i+3] = smoothness
-
-    image.pixels[:] = image_data
+    set_image_pixels(image, image_data)
     image.update()
     image.save()
 
@@ -2180,31 +2101,14 @@ def combine_gltf(nodes, source_mat, source_mat_cache, mat,
     image_node = nodeutils.make_image_node(nodes, image, image_node_name)
     image_node.select = True
     nodes.active = image_node
-    image_data = list(image.pixels)
-    l = len(image_data)
+    image_data = get_image_pixels(image)
 
     # GLTF: R: AO, G: Roughness, B: Metallic
-    for i in range(0, l, 4):
-
-        # Red
-        if ao_data:
-            image_data[i+0] = ao_data[i]
-        else:
-            image_data[i+0] = ao_value
-
-        # Green
-        if roughness_data:
-            image_data[i+1] = roughness_data[i]
-        else:
-            image_data[i+1] = roughness_value
-
-        # Blue
-        if metallic_data:
-            image_data[i+2] = metallic_data[i]
-        else:
-            image_data[i+2] = metallic_value
+    image_data[:, 0] = ao_data[:, 0] if ao_data is not None else ao_value
+    image_data[:, 1] = roughness_data[:, 0] if roughness_data is not None else roughness_value
+    image_data[:, 2] = metallic_data[:, 0] if metallic_data is not None else metallic_value
 
-    image.pixels[:] = image_data
+    set_image_pixels(image, image_data)
     image.update()
     image.save()
 
@@ -2424,6 +2328,7 @@ def reconnect_material(mat, mat_cache, ao_strength, sss_radius, bump_distance, n
     set_loc(micro_mask_mult_node, (-640,-600))
 
 
+@utils.profiled("Bake Character", operation=True)
 def bake_character(chr_cache):
     props = bpy.context.scene.CCICBakeProps
     prefs = vars.prefs()
@@ -2588,6 +2493,7 @@ def get_bake_target_material_name(name, uid):
     return text
 
 
+@utils.profiled("Bake Object")
 def bake_character_object(chr_cache, obj, bake_state, materials_done):
     props = bpy.context.scene.CCICBakeProps
 
@@ -2780,13 +2686,13 @@ class CCICBaker(bpy.types.Operator):
             self.report({"ERROR"}, "No current character!")
             return {"FINISHED"}
 
-        utils.start_timer()
+        start_time = utils.start_timer()
 
         if self.param == "BAKE":
             bake_character(chr_cache)
             utils.restore_mode_selection_state(mode_selection)
 
-        utils.log_timer("Baking Completed!", "m")
+        utils.log_timer("Baking Completed!", "m", start=start_time)
 
         return {"FINISHED"}
 
@@ -2883,12 +2789,14 @@ class CCICJpegify(bpy.types.Operator):
                         root, ext = os.path.splitext(file)
                         new_path = os.path.join(bake_path, root + ".jpg")
                         img.filepath_raw = new_path
+                        imageutils.add_image_path(img)
                         img.save()
                     else:
                         if not os.path.normcase(os.path.realpath(bake_path)) in os.path.normcase(os.path.realpath(img.filepath)):
                             dir, file = os.path.split(img.filepath)
                             new_path = os.path.join(bake_path, file)
                             img.filepath_raw = new_path
+                            imageutils.add_image_path(img)
                             img.save()
                             img.reload()
             except:
@@ -319,7 +319,7 @@ def convert_generic_to_non_standard(objects, file_path=None, type_override=None,
 
     chr_rig.name = chr_name
     chr_rig.data.name = chr_name
-    chr_cache = props.import_cache.add()
+    chr_cache = props.add_character_cache()
     chr_cache.import_file = ""
     chr_cache.character_name = chr_name
     chr_cache.import_embedded = False
@@ -1355,6 +1355,19 @@ def get_character_object_names(arm):
     return obj_names
 
 
+def parent_to_armature(arm, obj):
+    if obj.parent != arm:
+        if utils.try_select_objects([arm, obj]) and utils.set_active_object(arm):
+            bpy.ops.object.parent_set(type = "OBJECT", keep_transform = True)
+
+    # add or update armature modifier
+    arm_mod : bpy.types.ArmatureModifier = modifiers.get_armature_modifier(obj, create=True, armature=arm)
+    if arm_mod:
+        modifiers.move_mod_first(obj, arm_mod)
+        arm_mod.object = arm
+
+
+@utils.profiled("Transfer Weights", operation=True)
 def transfer_skin_weights(chr_cache, objects):
 
     if not utils.set_mode("OBJECT"):
@@ -1375,7 +1388,20 @@ def transfer_skin_weights(chr_cache, objects):
     if body in objects:
         objects.remove(body)
 
-    if arm.data.pose_position == "POSE":
+    prefs = vars.prefs()
+
+    if prefs.weight_transfer_mode == "NATIVE":
+
+        # Transfer weights directly from the (posed) body surface onto the objects,
+        # in pose mode the objects are re-bound so they stay where they are in the current pose
+        bone_names = [ bone.name for bone in arm.data.bones if bone.use_deform ]
+        posed_arm = arm if arm.data.pose_position == "POSE" else None
+        for obj in objects:
+            if obj.type == "MESH":
+                if geom.transfer_skin_weights(body, obj, bone_names, prefs.weight_transfer_max_influences, posed_arm):
+                    parent_to_armature(arm, obj)
+
+    elif arm.data.pose_position == "POSE":
 
         # Transfer weights in place (in pose mode)
 
@@ -1489,15 +1515,7 @@ def transfer_skin_weights(chr_cache, objects):
                                                 layers_select_dst='ALL',
                                                 mix_mode='REPLACE')
 
-                    if obj.parent != arm:
-                        if utils.try_select_objects([arm, obj]) and utils.set_active_object(arm):
-                            bpy.ops.object.parent_set(type = "OBJECT", keep_transform = True)
-
-                    # add or update armature modifier
-                    arm_mod : bpy.types.ArmatureModifier = modifiers.get_armature_modifier(obj, create=True, armature=arm)
-                    if arm_mod:
-                        modifiers.move_mod_first(obj, arm_mod)
-                        arm_mod.object = arm
+                    parent_to_armature(arm, obj)
 
 
 def normalize_skin_weights(chr_cache, objects):
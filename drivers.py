@@ -343,6 +343,7 @@ def clear_facial_shape_key_bone_drivers(chr_cache):
                     pose_bone.rotation_mode = "QUATERNION"
 
 
+@utils.profiled("Facial Drivers")
 def add_facial_shape_key_bone_drivers(chr_cache, jaw, eye_look, head):
     """Add drivers for the jaw, eye and head bones (optional) based on the facial
        expression shape keys.
@@ -491,6 +492,7 @@ def clear_body_shape_key_drivers(chr_cache):
                         obj_key.driver_remove("value")
 
 
+@utils.profiled("Body Drivers")
 def add_body_shape_key_drivers(chr_cache, add_drivers):
     """Drive all expression shape keys on non-body objects from the body shape keys.
     """
@@ -141,6 +141,7 @@ def restore_modifiers(chr_cache, objects):
                 modifiers.add_eye_modifiers(obj)
 
 
+@utils.profiled("Prepare Export")
 def prep_export(chr_cache, new_name, objects, json_data, old_path, new_path,
                 copy_textures, revert_duplicates, apply_fixes, as_blend_file, bake_values,
                 materials=None, sync=False):
@@ -634,6 +635,7 @@ def copy_and_update_texture_path(tex_info, path_key, old_path, new_path, old_nam
                                     utils.log_info(f"Updating .blend Image: {image.name}")
                                     utils.log_info(f"                   to: {new_abs_path}")
                                     image.filepath = new_abs_path
+                                    imageutils.add_image_path(image)
                                     images_copied.append(image)
 
 
@@ -662,9 +664,8 @@ def restore_export(export_changes : list):
 
 
 def get_prop_value(mat_cache, prop_name, default):
-    parameters = mat_cache.parameters
     try:
-        return eval("parameters." + prop_name, None, locals())
+        return shaders.get_prop_getter(prop_name)(mat_cache.parameters)
     except:
         return default
 
@@ -991,6 +992,7 @@ def try_unpack_image(image, folder, index_suffix = False):
                 os.makedirs(folder)
             image.unpack(method = "REMOVE")
             image.filepath_raw = image_path
+            imageutils.add_image_path(image)
             image.save()
             return True
     except:
@@ -1682,6 +1684,7 @@ def obj_export(file_path, use_selection=False, use_animation=False, global_scale
                                  keep_vertex_order=keep_vertex_order)
 
 
+@utils.profiled("Export Standard", operation=True)
 def export_standard(self, chr_cache, file_path, include_selected):
     """Exports standard character (not rigified, not generic) to CC3/4 with json data,
        texture paths are relative to source character, as an .fbx file.
@@ -1690,7 +1693,7 @@ def export_standard(self, chr_cache, file_path, include_selected):
     props = vars.props()
     prefs = vars.prefs()
 
-    utils.start_timer()
+    start_time = utils.start_timer()
 
     utils.log_info("")
     utils.log_info("Exporting Character Model to CC:")
@@ -1712,7 +1715,7 @@ def export_standard(self, chr_cache, file_path, include_selected):
 
     if utils.is_file_ext(ext, "FBX"):
 
-        json_data = chr_cache.get_json_data()
+        json_data = chr_cache.get_json_data(copy=True)
         if not json_data:
             json_data = jsonutils.generate_character_json_data(name)
             set_character_generation(json_data, chr_cache, name)
@@ -1751,13 +1754,14 @@ def export_standard(self, chr_cache, file_path, include_selected):
 
         # proceed with normal export
         if not custom_export:
-            bpy.ops.export_scene.fbx(filepath=file_path,
-                    use_selection = True,
-                    bake_anim = export_anim,
-                    bake_anim_simplify_factor=self.animation_simplify,
-                    add_leaf_bones = False,
-                    mesh_smooth_type = ("FACE" if self.export_face_smoothing else "OFF"),
-                    use_mesh_modifiers = False)
+            with utils.profile("FBX Export"):
+                bpy.ops.export_scene.fbx(filepath=file_path,
+                        use_selection = True,
+                        bake_anim = export_anim,
+                        bake_anim_simplify_factor=self.animation_simplify,
+                        add_leaf_bones = False,
+                        mesh_smooth_type = ("FACE" if self.export_face_smoothing else "OFF"),
+                        use_mesh_modifiers = False)
 
         utils.log_recess()
         utils.log_info("")
@@ -1818,9 +1822,10 @@ def export_standard(self, chr_cache, file_path, include_selected):
     utils.restore_mode_selection_state(mode_selection_state)
 
     utils.log_recess()
-    utils.log_timer("Done Character Export.")
+    utils.log_timer("Done Character Export.", start=start_time)
 
 
+@utils.profiled("Export Non-Standard", operation=True)
 def export_non_standard(self, file_path, include_selected):
     """Exports non-standard character (unconverted and not rigified) to CC4 with json data and textures, as an .fbx file.
     """
@@ -1828,7 +1833,7 @@ def export_non_standard(self, file_path, include_selected):
     props = vars.props()
     prefs = vars.prefs()
 
-    utils.start_timer()
+    start_time = utils.start_timer()
 
     utils.log_info("")
     utils.log_info("Exporting Non-Standard Model to CC:")
@@ -1875,14 +1880,15 @@ def export_non_standard(self, file_path, include_selected):
 
     # proceed with normal export
     if not arp_export:
-        bpy.ops.export_scene.fbx(filepath=file_path,
-                use_selection = True,
-                bake_anim = export_anim,
-                bake_anim_simplify_factor=self.animation_simplify,
-                add_leaf_bones = False,
-                use_mesh_modifiers = True,
-                mesh_smooth_type = ("FACE" if self.export_face_smoothing else "OFF"),
-                use_armature_deform_only = True)
+        with utils.profile("FBX Export"):
+            bpy.ops.export_scene.fbx(filepath=file_path,
+                    use_selection = True,
+                    bake_anim = export_anim,
+                    bake_anim_simplify_factor=self.animation_simplify,
+                    add_leaf_bones = False,
+                    use_mesh_modifiers = True,
+                    mesh_smooth_type = ("FACE" if self.export_face_smoothing else "OFF"),
+                    use_armature_deform_only = True)
 
     utils.log_recess()
     utils.log_info("")
@@ -1903,15 +1909,16 @@ def export_non_standard(self, file_path, include_selected):
 
     utils.log_recess()
     if arp_export:
-        utils.log_timer("Done Non-standard ARP Export.")
+        utils.log_timer("Done Non-standard ARP Export.", start=start_time)
         self.report({'INFO'}, "Export Non-standard (ARP) Done!")
     else:
-        utils.log_timer("Done Non-standard Export.")
+        utils.log_timer("Done Non-standard Export.", start=start_time)
         self.report({'INFO'}, "Export Non-standard Done!")
 
 
 
 
+@utils.profiled("Export Unity", operation=True)
 def export_to_unity(self, chr_cache, export_anim, file_path, include_selected):
     """Exports CC3/4 character (not rigified) for Unity with json data and textures,
        as either a .blend file or .fbx file.
@@ -1920,7 +1927,7 @@ def export_to_unity(self, chr_cache, export_anim, file_path, include_selected):
     props = vars.props()
     prefs = vars.prefs()
 
-    utils.start_timer()
+    start_time = utils.start_timer()
 
     utils.log_info("")
     utils.log_info("Exporting Character Model to UNITY:")
@@ -1939,7 +1946,7 @@ def export_to_unity(self, chr_cache, export_anim, file_path, include_selected):
     utils.log_info("Export to: " + file_path)
     utils.log_info("Exporting as: " + ext)
 
-    json_data = chr_cache.get_json_data()
+    json_data = chr_cache.get_json_data(copy=True)
     if not json_data:
         json_data = jsonutils.generate_character_json_data(name)
         set_character_generation(json_data, chr_cache, name)
@@ -1995,21 +2002,22 @@ def export_to_unity(self, chr_cache, export_anim, file_path, include_selected):
 
     if utils.is_file_ext(ext, "FBX"):
         # export as fbx
-        bpy.ops.export_scene.fbx(filepath=file_path,
-                use_selection = True,
-                bake_anim = export_anim,
-                bake_anim_use_all_actions=export_actions,
-                bake_anim_use_nla_strips=export_strips,
-                bake_anim_simplify_factor=self.animation_simplify,
-                use_armature_deform_only=True,
-                add_leaf_bones = False,
-                mesh_smooth_type = ("FACE" if self.export_face_smoothing else "OFF"),
-                use_mesh_modifiers = True,
-                #apply_scale_options="FBX_SCALE_UNITS",
-                object_types={'EMPTY', 'MESH', 'ARMATURE'},
-                use_space_transform=True,
-                #armature_nodetype="ROOT",
-                )
+        with utils.profile("FBX Export"):
+            bpy.ops.export_scene.fbx(filepath=file_path,
+                    use_selection = True,
+                    bake_anim = export_anim,
+                    bake_anim_use_all_actions=export_actions,
+                    bake_anim_use_nla_strips=export_strips,
+                    bake_anim_simplify_factor=self.animation_simplify,
+                    use_armature_deform_only=True,
+                    add_leaf_bones = False,
+                    mesh_smooth_type = ("FACE" if self.export_face_smoothing else "OFF"),
+                    use_mesh_modifiers = True,
+                    #apply_scale_options="FBX_SCALE_UNITS",
+                    object_types={'EMPTY', 'MESH', 'ARMATURE'},
+                    use_space_transform=True,
+                    #armature_nodetype="ROOT",
+                    )
 
         restore_modifiers(chr_cache, objects)
 
@@ -2047,14 +2055,14 @@ def export_to_unity(self, chr_cache, export_anim, file_path, include_selected):
         utils.restore_mode_selection_state(mode_selection_state)
 
     utils.log_recess()
-    utils.log_timer("Done Character Export.")
+    utils.log_timer("Done Character Export.", start=start_time)
 
 
 def update_to_unity(chr_cache, export_anim, include_selected):
     props = vars.props()
     prefs = vars.prefs()
 
-    utils.start_timer()
+    start_time = utils.start_timer()
 
     utils.log_info("")
     utils.log_info("Updating Character Model for UNITY:")
@@ -2082,7 +2090,7 @@ def update_to_unity(chr_cache, export_anim, include_selected):
 
     chr_cache.change_import_file(props.unity_file_path)
 
-    json_data = chr_cache.get_json_data()
+    json_data = chr_cache.get_json_data(copy=True)
 
     utils.log_info("Preparing character for export:")
     utils.log_indent()
@@ -2126,14 +2134,15 @@ def update_to_unity(chr_cache, export_anim, include_selected):
         jsonutils.write_json(json_data, new_json_path)
 
     utils.log_recess()
-    utils.log_timer("Done Character Export.")
+    utils.log_timer("Done Character Export.", start=start_time)
 
 
+@utils.profiled("Export Rigify", operation=True)
 def export_rigify(self, chr_cache, export_anim, file_path, include_selected):
     props = vars.props()
     prefs = vars.prefs()
 
-    utils.start_timer()
+    start_time = utils.start_timer()
 
     utils.log_info("")
     utils.log_info("Exporting Rigified Character Model:")
@@ -2155,7 +2164,7 @@ def export_rigify(self, chr_cache, export_anim, file_path, include_selected):
     if prefs.rigify_export_mode == "MOTION":
          include_textures = False
     else:
-        json_data = chr_cache.get_json_data()
+        json_data = chr_cache.get_json_data(copy=True)
 
     utils.log_info("Preparing character for export:")
     utils.log_indent()
@@ -2209,18 +2218,19 @@ def export_rigify(self, chr_cache, export_anim, file_path, include_selected):
     armature_object, armature_data = rigutils.rename_armature(export_rig, name)
 
     # export as fbx
-    bpy.ops.export_scene.fbx(filepath=file_path,
-            use_selection = True,
-            bake_anim = use_anim,
-            bake_anim_use_all_actions=export_actions,
-            bake_anim_use_nla_strips=export_strips,
-            bake_anim_simplify_factor=self.animation_simplify,
-            use_armature_deform_only=True,
-            add_leaf_bones = False,
-            #axis_forward = "-Y",
-            #axis_up = "Z",
-            mesh_smooth_type = ("FACE" if self.export_face_smoothing else "OFF"),
-            use_mesh_modifiers = True)
+    with utils.profile("FBX Export"):
+        bpy.ops.export_scene.fbx(filepath=file_path,
+                use_selection = True,
+                bake_anim = use_anim,
+                bake_anim_use_all_actions=export_actions,
+                bake_anim_use_nla_strips=export_strips,
+                bake_anim_simplify_factor=self.animation_simplify,
+                use_armature_deform_only=True,
+                add_leaf_bones = False,
+                #axis_forward = "-Y",
+                #axis_up = "Z",
+                mesh_smooth_type = ("FACE" if self.export_face_smoothing else "OFF"),
+                use_mesh_modifiers = True)
 
     if prefs.rigify_export_t_pose:
         bones.clear_pose(export_rig)
@@ -2271,9 +2281,10 @@ def export_rigify(self, chr_cache, export_anim, file_path, include_selected):
     utils.restore_mode_selection_state(mode_selection_state)
 
     utils.log_recess()
-    utils.log_timer("Done Rigify Export.")
+    utils.log_timer("Done Rigify Export.", start=start_time)
 
 
+@utils.profiled("Export Accessory", operation=True)
 def export_as_accessory(file_path, filename_ext):
     dir, file = os.path.split(file_path)
     name, ext = os.path.splitext(file)
@@ -2283,11 +2294,12 @@ def export_as_accessory(file_path, filename_ext):
     old_active = utils.get_active_object()
 
     if utils.is_file_ext(ext, "FBX"):
-        bpy.ops.export_scene.fbx(filepath=file_path,
-                use_selection = True,
-                bake_anim = False,
-                add_leaf_bones=False,
-                )
+        with utils.profile("FBX Export"):
+            bpy.ops.export_scene.fbx(filepath=file_path,
+                    use_selection = True,
+                    bake_anim = False,
+                    add_leaf_bones=False,
+                    )
     elif utils.is_file_ext(ext, "OBJ"):
         obj_export(file_path, use_selection=True,
                               global_scale=100,
@@ -2305,6 +2317,7 @@ def export_as_accessory(file_path, filename_ext):
     bpy.context.view_layer.objects.active = old_active
 
 
+@utils.profiled("Export Replace Mesh", operation=True)
 def export_as_replace_mesh(file_path):
     dir, file = os.path.split(file_path)
     name, ext = os.path.splitext(file)
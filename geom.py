@@ -16,9 +16,12 @@
 
 import bpy
 import math
+import hashlib
 import mathutils
 from mathutils import Vector
+from mathutils.bvhtree import BVHTree
 import bmesh
+import numpy as np
 from . import utils
 
 # Code derived from: https://blenderartists.org/t/get-3d-location-of-mesh-surface-point-from-uv-parameter/649486/2
@@ -175,8 +178,146 @@ def copy_vertex_positions_and_weights(src_obj : bpy.types.Object, dst_obj : bpy.
 
 
 
-def copy_vert_positions_by_uv_id(src_obj, dst_obj, accuracy = 5, vertex_group = None, threshold = 0.004, shape_key_name = None):
+# (mapping hash, accuracy, vertex group, threshold) -> (dst vertex indices, src vertex indices)
+VERTEX_MAPPING_CACHE = {}
+MAX_VERTEX_MAPPING_CACHE = 8
+
+
+def get_mesh_co(mesh : bpy.types.Mesh):
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    return co.reshape(-1, 3)
+
+
+def get_vertex_group_weights(obj, vertex_group):
+    """Returns the weights of all the vertices in the vertex group, or None if there is no such group.
+       Vertices not in the group have zero weight."""
+    if not vertex_group or vertex_group not in obj.vertex_groups:
+        return None
+    vg_index = obj.vertex_groups[vertex_group].index
+    weights = np.zeros(len(obj.data.vertices), dtype=np.float32)
+    for vert in obj.data.vertices:
+        for g in vert.groups:
+            if g.group == vg_index:
+                weights[vert.index] = g.weight
+                break
+    return weights
+
+
+def get_face_loops(mesh : bpy.types.Mesh):
+    """Returns the loop indices in face order, and the face index and material index of each."""
+    num_faces = len(mesh.polygons)
+    num_loops = len(mesh.loops)
+    loop_starts = np.empty(num_faces, dtype=np.int64)
+    loop_totals = np.empty(num_faces, dtype=np.int64)
+    material_indices = np.empty(num_faces, dtype=np.int64)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    mesh.polygons.foreach_get("material_index", material_indices)
+    loop_indices = (np.repeat(loop_starts - np.cumsum(loop_totals) + loop_totals, loop_totals) +
+                    np.arange(num_loops, dtype=np.int64))
+    loop_faces = np.repeat(np.arange(num_faces, dtype=np.int64), loop_totals)
+    return loop_indices, loop_faces, material_indices[loop_faces]
+
+
+def get_loop_verts_and_uvs(mesh : bpy.types.Mesh, uv_layer = 0):
+    num_loops = len(mesh.loops)
+    loop_verts = np.empty(num_loops, dtype=np.int64)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    uvs = np.empty(num_loops * 2, dtype=np.float32)
+    mesh.uv_layers[uv_layer].data.foreach_get("uv", uvs)
+    return loop_verts, uvs.reshape(-1, 2)
+
+
+def get_mesh_uv_keys(mesh : bpy.types.Mesh, accuracy, material_map = None):
+    """Returns the vertex index and uv id (u, v to <accuracy> places and material index) of every loop,
+       with the integer part of u removed. Loops of materials not in the material map are dropped."""
+    loop_indices, loop_faces, loop_materials = get_face_loops(mesh)
+    loop_verts, uvs = get_loop_verts_and_uvs(mesh)
+
+    if material_map is not None:
+        lookup = np.full(max(int(loop_materials.max(initial=0)), max(material_map, default=0)) + 1, -1, dtype=np.int64)
+        for i, j in material_map.items():
+            lookup[i] = j
+        loop_materials = lookup[loop_materials]
+        mapped = loop_materials >= 0
+        loop_indices = loop_indices[mapped]
+        loop_materials = loop_materials[mapped]
+
+    uv = uvs[loop_indices]
+    u = uv[:, 0] - np.trunc(uv[:, 0])
+    scale = 10.0 ** accuracy
+    keys = np.empty((len(loop_indices), 3), dtype=np.int64)
+    keys[:, 0] = np.rint(u.astype(np.float64) * scale)
+    keys[:, 1] = np.rint(uv[:, 1].astype(np.float64) * scale)
+    keys[:, 2] = loop_materials
+    return loop_verts[loop_indices], keys
+
+
+def last_by_index(indices, values):
+    """For each unique index, the value of its last occurrence."""
+    unique, first = np.unique(indices[::-1], return_index=True)
+    return unique, values[::-1][first]
+
+
+def map_verts_by_uv_id(src_verts, src_keys, dst_verts, dst_keys, matching_vert_count):
+    """Sorted key join of the destination loops to the source loops with the same uv id.
+       Returns the destination vertex indices and the source vertex index to copy to each."""
+    # group ids shared by the source and destination keys
+    keys = np.concatenate((src_keys, dst_keys))
+    order = np.lexsort((keys[:, 2], keys[:, 1], keys[:, 0]))
+    new_key = np.ones(len(order), dtype=bool)
+    new_key[1:] = np.any(keys[order[1:]] != keys[order[:-1]], axis=1)
+    ids = np.empty(len(order), dtype=np.int64)
+    ids[order] = np.cumsum(new_key) - 1
+    num_ids = int(ids.max(initial=-1)) + 1
+    src_ids = ids[:len(src_keys)]
+    dst_ids = ids[len(src_keys):]
+
+    # the last source vertex with each uv id, and the uv ids shared by different source vertices
+    has_src = np.zeros(num_ids, dtype=bool)
+    has_src[src_ids] = True
+    id_verts = np.zeros(num_ids, dtype=np.int64)
+    unique, verts = last_by_index(src_ids, src_verts)
+    id_verts[unique] = verts
+    min_verts = np.full(num_ids, np.iinfo(np.int64).max, dtype=np.int64)
+    max_verts = np.full(num_ids, -1, dtype=np.int64)
+    np.minimum.at(min_verts, src_ids, src_verts)
+    np.maximum.at(max_verts, src_ids, src_verts)
+    overlapping = has_src & (min_verts != max_verts)
+
+    hit = has_src[dst_ids]
+    dst_ids = dst_ids[hit]
+    dst_verts = dst_verts[hit]
+    # overlapping UV's can't be detected correctly so try to copy from just the index position
+    if matching_vert_count:
+        copy_verts = np.where(overlapping[dst_ids], dst_verts, id_verts[dst_ids])
+    else:
+        copy_verts = id_verts[dst_ids]
+    # the last loop of each destination vertex wins
+    return last_by_index(dst_verts, copy_verts)
+
+
+def get_mapping_hash(*arrays):
+    hasher = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        hasher.update(np.ascontiguousarray(array).tobytes())
+        hasher.update(str(array.shape).encode())
+    return hasher.hexdigest()
+
 
+def get_cached_mapping(key):
+    return VERTEX_MAPPING_CACHE.get(key)
+
+
+def cache_mapping(key, mapping):
+    VERTEX_MAPPING_CACHE.pop(key, None)
+    while len(VERTEX_MAPPING_CACHE) >= MAX_VERTEX_MAPPING_CACHE:
+        VERTEX_MAPPING_CACHE.pop(next(iter(VERTEX_MAPPING_CACHE)))
+    VERTEX_MAPPING_CACHE[key] = mapping
+
+
+def add_copy_shape_key(dst_obj, shape_key_name):
     mesh : bpy.types.Mesh = dst_obj.data
     if shape_key_name:
         if not mesh.shape_keys:
@@ -184,163 +325,394 @@ def copy_vert_positions_by_uv_id(src_obj, dst_obj, accuracy = 5, vertex_group =
         if shape_key_name not in mesh.shape_keys.key_blocks:
             shape_key = dst_obj.shape_key_add(name = shape_key_name)
             shape_key_name = shape_key.name
+    return shape_key_name
 
-    src_mesh = src_obj.data
-    dst_mesh = dst_obj.data
 
-    src_bm = bmesh.new()
-    dst_bm = bmesh.new()
+def set_vert_positions(dst_obj, dst_verts, positions, shape_key_name = None):
+    """Sets the positions of the vertices, or of the vertices in the shape key.
+       Like BMesh.to_mesh(), changes to the basis positions offset the shape keys relative to the basis."""
+    mesh : bpy.types.Mesh = dst_obj.data
+    if len(dst_verts) == 0:
+        return
+    if shape_key_name:
+        key_data = mesh.shape_keys.key_blocks[shape_key_name].data
+        co = np.empty(len(key_data) * 3, dtype=np.float32)
+        key_data.foreach_get("co", co)
+        co = co.reshape(-1, 3)
+        co[dst_verts] = positions
+        key_data.foreach_set("co", co.ravel())
+    else:
+        co = get_mesh_co(mesh)
+        if mesh.shape_keys:
+            basis = mesh.shape_keys.reference_key
+            basis_co = np.empty(len(basis.data) * 3, dtype=np.float32)
+            basis.data.foreach_get("co", basis_co)
+            basis_co = basis_co.reshape(-1, 3)
+            offsets = np.zeros_like(basis_co)
+            offsets[dst_verts] = positions - basis_co[dst_verts]
+            for key_block in mesh.shape_keys.key_blocks:
+                if key_block != basis and key_block.relative_key == basis:
+                    key_co = np.empty(len(key_block.data) * 3, dtype=np.float32)
+                    key_block.data.foreach_get("co", key_co)
+                    key_block.data.foreach_set("co", (key_co.reshape(-1, 3) + offsets).ravel())
+            basis_co[dst_verts] = positions
+            basis.data.foreach_set("co", basis_co.ravel())
+        co[dst_verts] = positions
+        mesh.vertices.foreach_set("co", co.ravel())
+    mesh.update()
 
-    src_bm.from_mesh(src_mesh)
-    src_bm.faces.ensure_lookup_table()
-    src_bm.verts.ensure_lookup_table()
 
-    dst_bm.from_mesh(dst_mesh)
-    dst_bm.faces.ensure_lookup_table()
-    dst_bm.verts.ensure_lookup_table()
+def copy_vert_positions_by_uv_id(src_obj, dst_obj, accuracy = 5, vertex_group = None, threshold = 0.004, shape_key_name = None):
+
+    shape_key_name = add_copy_shape_key(dst_obj, shape_key_name)
+
+    src_mesh : bpy.types.Mesh = src_obj.data
+    dst_mesh : bpy.types.Mesh = dst_obj.data
 
-    src_map = {}
     mat_map = {}
-    overlapping = {}
 
-    matching_vert_count = len(src_bm.verts) == len(dst_bm.verts)
+    matching_vert_count = len(src_mesh.vertices) == len(dst_mesh.vertices)
 
     for i, src_mat in enumerate(src_mesh.materials):
         for j, dst_mat in enumerate(dst_mesh.materials):
             if src_mat == dst_mat:
                 mat_map[i] = j
-            elif utils.strip_name(src_mat.name) == utils.strip_name(dst_mat.name):
+            elif src_mat and dst_mat and utils.strip_name(src_mat.name) == utils.strip_name(dst_mat.name):
                 mat_map[i] = j
 
     if len(src_mesh.materials) == 0:
         mat_map[0] = 0
 
-    vg_index = -1
-    if vertex_group and vertex_group in src_obj.vertex_groups:
-        vg_index = src_obj.vertex_groups[vertex_group].index
+    src_verts, src_keys = get_mesh_uv_keys(src_mesh, accuracy, mat_map)
+    weights = get_vertex_group_weights(src_obj, vertex_group)
+    if weights is not None:
+        weighted = weights[src_verts] >= threshold
+        src_verts = src_verts[weighted]
+        src_keys = src_keys[weighted]
+    dst_verts, dst_keys = get_mesh_uv_keys(dst_mesh, accuracy)
 
-    ul = src_bm.loops.layers.uv[0]
-    src_bm.verts.layers.deform.verify()
-    dl = src_bm.verts.layers.deform.active
-    face : bmesh.types.BMFace
-    loop : bmesh.types.BMLoop
-
-    for face in src_bm.faces:
-        if face.material_index in mat_map:
-            dst_material_idx = mat_map[face.material_index]
-            for loop in face.loops:
-                if vg_index >= 0:
-                    vert = src_bm.verts[loop.vert.index]
-                    weight = vert[dl][vg_index]
-                    if weight < threshold:
-                        continue
-                uv = loop[ul].uv
-                uv.x -= int(uv.x)
-                uv_id = uv.to_tuple(accuracy), dst_material_idx
-                if uv_id in src_map and src_map[uv_id] != loop.vert.index:
-                    overlapping[uv_id] = True
-                src_map[uv_id] = loop.vert.index
-
-    ul = dst_bm.loops.layers.uv[0]
-    sl = None
-    if shape_key_name:
-        sl = dst_bm.verts.layers.shape.get(shape_key_name)
-    for face in dst_bm.faces:
-        for loop in face.loops:
-            uv = loop[ul].uv
-            uv.x -= int(uv.x)
-            uv_id = uv.to_tuple(accuracy), face.material_index
-            # overlapping UV's can't be detected correctly so try to copy from just the index position
-            if matching_vert_count and uv_id in overlapping:
-                vert_index = loop.vert.index
-                src_pos = src_bm.verts[vert_index].co
-                if sl:
-                    loop.vert[sl] = src_pos
-                else:
-                    loop.vert.co = src_pos
-            elif uv_id in src_map:
-                src_vert = src_map[uv_id]
-                src_pos = src_bm.verts[src_vert].co
-                if sl:
-                    loop.vert[sl] = src_pos
-                else:
-                    loop.vert.co = src_pos
+    # reuse the mapping for the same source and destination uv topology
+    key = (get_mapping_hash(src_verts, src_keys, dst_verts, dst_keys), matching_vert_count)
+    mapping = get_cached_mapping(key)
+    if mapping is None:
+        mapping = map_verts_by_uv_id(src_verts, src_keys, dst_verts, dst_keys, matching_vert_count)
+        cache_mapping(key, mapping)
+    dst_indices, src_indices = mapping
 
-    dst_bm.to_mesh(dst_mesh)
+    src_co = get_mesh_co(src_mesh)
+    set_vert_positions(dst_obj, dst_indices, src_co[src_indices], shape_key_name)
 
 
 def copy_vert_positions_by_index(src_obj, dst_obj, vertex_group = None, threshold = 0.004, shape_key_name = None):
 
-    mesh : bpy.types.Mesh = dst_obj.data
-    if shape_key_name:
-        if not mesh.shape_keys:
-            dst_obj.shape_key_add(name = "Basis")
-        if shape_key_name not in mesh.shape_keys.key_blocks:
-            shape_key = dst_obj.shape_key_add(name = shape_key_name)
-            shape_key_name = shape_key.name
-
-    src_mesh = src_obj.data
-    dst_mesh = dst_obj.data
-
-    src_bm = bmesh.new()
-    dst_bm = bmesh.new()
-
-    src_bm.from_mesh(src_mesh)
-    src_bm.faces.ensure_lookup_table()
-    src_bm.verts.ensure_lookup_table()
-
-    dst_bm.from_mesh(dst_mesh)
-    dst_bm.faces.ensure_lookup_table()
-    dst_bm.verts.ensure_lookup_table()
+    shape_key_name = add_copy_shape_key(dst_obj, shape_key_name)
 
-    src_verts = []
+    src_mesh : bpy.types.Mesh = src_obj.data
+    dst_mesh : bpy.types.Mesh = dst_obj.data
 
-    matching_vert_count = len(src_bm.verts) == len(dst_bm.verts)
+    matching_vert_count = len(src_mesh.vertices) == len(dst_mesh.vertices)
     if not matching_vert_count:
         return
 
-    vg_index = -1
-    if vertex_group and vertex_group in src_obj.vertex_groups:
-        vg_index = src_obj.vertex_groups[vertex_group].index
+    src_co = get_mesh_co(src_mesh)
+    weights = get_vertex_group_weights(src_obj, vertex_group)
+    if weights is not None:
+        verts = np.flatnonzero(weights >= threshold)
+    else:
+        verts = np.arange(len(src_co))
 
-    src_bm.verts.layers.deform.verify()
-    dl = src_bm.verts.layers.deform.active
-    loop : bmesh.types.BMLoop
+    set_vert_positions(dst_obj, verts, src_co[verts], shape_key_name)
 
-    for vert in src_bm.verts:
-        if vg_index >= 0:
-            weight = vert[dl][vg_index]
-            if weight < threshold:
-                continue
-        src_verts.append(vert.index)
 
-    sl = None
-    if shape_key_name:
-        sl = dst_bm.verts.layers.shape.get(shape_key_name)
-    for vert in dst_bm.verts:
-        if vert.index in src_verts:
-            src_pos = src_bm.verts[vert.index].co
-            if sl:
-                vert[sl] = src_pos
-            else:
-                vert.co = src_pos
+def get_image_channel(image, channel = 0):
+    """Returns one channel of the image pixels as a [height, width] float32 array."""
+    width, height = image.size
+    pixels = np.empty(width * height * 4, dtype=np.float32)
+    image.pixels.foreach_get(pixels)
+    return pixels.reshape(height, width, 4)[:, :, channel]
 
-    dst_bm.to_mesh(dst_mesh)
 
-
-def map_image_to_vertex_weights(obj, mat, image, vertex_group, func):
-    width = image.size[0]
-    height = image.size[1]
+def sample_image(values, uvs, interpolation = "CLOSEST"):
+    """Samples the [height, width] image values at the [n, 2] uvs, wrapped into 0 - 1."""
+    height, width = values.shape
     wmo = width - 1
     hmo = height - 1
-    uhw = 1 / (wmo * 2)
-    vhw = 1 / (hmo * 2)
-    pixels = image.pixels[:]
+    u = uvs[:, 0] - np.trunc(uvs[:, 0])
+    v = uvs[:, 1] - np.trunc(uvs[:, 1])
+    if interpolation == "LINEAR":
+        x = np.clip(u * wmo, 0, wmo)
+        y = np.clip(v * hmo, 0, hmo)
+        x0 = np.floor(x).astype(np.int64)
+        y0 = np.floor(y).astype(np.int64)
+        x1 = np.minimum(x0 + 1, wmo)
+        y1 = np.minimum(y0 + 1, hmo)
+        fx = (x - x0).astype(np.float32)
+        fy = (y - y0).astype(np.float32)
+        top = values[y0, x0] * (1 - fx) + values[y0, x1] * fx
+        bottom = values[y1, x0] * (1 - fx) + values[y1, x1] * fx
+        return top * (1 - fy) + bottom * fy
+    else:
+        # nearest pixel
+        x = np.clip(((u + 1 / (wmo * 2)) * wmo).astype(np.int64), 0, wmo)
+        y = np.clip(((v + 1 / (hmo * 2)) * hmo).astype(np.int64), 0, hmo)
+        return values[y, x]
+
+
+def apply_weight_func(func, values):
+    """Applies the weight mapping function to all the values at once, or per value if it can't."""
+    if func is None:
+        return values
+    try:
+        weights = np.asarray(func(values), dtype=np.float32)
+        if weights.shape == values.shape:
+            return weights
+    except:
+        pass
+    return np.fromiter((func(float(value)) for value in values), dtype=np.float32, count=len(values))
+
+
+def set_vertex_group_weights(vertex_group : bpy.types.VertexGroup, vert_indices, weights):
+    """Sets (replaces) the weights of the vertices in bulk, one add() per distinct weight."""
+    unique_weights, inverse = np.unique(weights, return_inverse=True)
+    order = np.argsort(inverse, kind="stable")
+    splits = np.flatnonzero(np.diff(inverse[order])) + 1
+    for weight, indices in zip(unique_weights, np.split(vert_indices[order], splits)):
+        vertex_group.add(indices.tolist(), float(weight), "REPLACE")
+
+
+def get_sparse_vertex_weights(mesh : bpy.types.Mesh, group_map):
+    """Returns the (num_verts, N) group and weight arrays of the vertex weights in the mapped groups,
+       where N is the most influences on any vertex. Unused entries have group -1 and weight 0."""
+    rows = []
+    groups = []
+    weights = []
+    for vert in mesh.vertices:
+        for g in vert.groups:
+            if g.group in group_map and g.weight > 0.0:
+                rows.append(vert.index)
+                groups.append(group_map[g.group])
+                weights.append(g.weight)
+    num_verts = len(mesh.vertices)
+    rows = np.array(rows, dtype=np.int64)
+    counts = np.bincount(rows, minlength=num_verts)
+    n = max(1, int(counts.max())) if num_verts else 1
+    slots = np.arange(len(rows), dtype=np.int64) - (np.cumsum(counts) - counts)[rows]
+    vert_groups = np.full((num_verts, n), -1, dtype=np.int64)
+    vert_weights = np.zeros((num_verts, n), dtype=np.float64)
+    vert_groups[rows, slots] = groups
+    vert_weights[rows, slots] = weights
+    return vert_groups, vert_weights
+
+
+def get_mesh_triangles(mesh : bpy.types.Mesh):
+    mesh.calc_loop_triangles()
+    tris = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("vertices", tris)
+    return tris.reshape(-1, 3).astype(np.int64)
+
+
+def get_world_co(obj, co):
+    M = np.array(obj.matrix_world, dtype=np.float64)
+    return co @ M[:3, :3].T + M[:3, 3]
+
+
+def get_barycentric_weights(points, a, b, c):
+    """Returns the barycentric weights of the points in the triangles (a, b, c), clamped to the triangle."""
+    v0 = b - a
+    v1 = c - a
+    v2 = points - a
+    d00 = np.einsum("ij,ij->i", v0, v0)
+    d01 = np.einsum("ij,ij->i", v0, v1)
+    d11 = np.einsum("ij,ij->i", v1, v1)
+    d20 = np.einsum("ij,ij->i", v2, v0)
+    d21 = np.einsum("ij,ij->i", v2, v1)
+    denom = d00 * d11 - d01 * d01
+    degenerate = np.abs(denom) < 1e-12
+    denom[degenerate] = 1.0
+    v = (d11 * d20 - d01 * d21) / denom
+    w = (d00 * d21 - d01 * d20) / denom
+    bary = np.clip(np.stack((1.0 - v - w, v, w), axis=1), 0.0, 1.0)
+    bary[degenerate] = 1.0
+    return bary / bary.sum(axis=1)[:, None]
+
+
+def interpolate_sparse_weights(corner_verts, bary, vert_groups, vert_weights, num_groups, max_influences):
+    """Blends the sparse weights of the triangle corners by the barycentric weights,
+       keeping only the strongest max_influences groups of each row, normalized.
+       Returns the (row, group, weight) of each remaining influence, sorted by row."""
+    num_rows = len(corner_verts)
+    n = vert_groups.shape[1] * 3
+    groups = vert_groups[corner_verts].reshape(num_rows, n)
+    weights = (vert_weights[corner_verts] * bary[:, :, None]).reshape(num_rows, n)
+    rows = np.repeat(np.arange(num_rows, dtype=np.int64), n)
+    groups = groups.ravel()
+    weights = weights.ravel()
+    used = (groups >= 0) & (weights > 0.0)
+    keys = rows[used] * num_groups + groups[used]
+    unique_keys, inverse = np.unique(keys, return_inverse=True)
+    weights = np.bincount(inverse, weights[used])
+    rows = unique_keys // num_groups
+    groups = unique_keys % num_groups
+    # strongest influences first in each row
+    order = np.lexsort((-weights, rows))
+    rows = rows[order]
+    groups = groups[order]
+    weights = weights[order]
+    rank = np.arange(len(rows)) - np.searchsorted(rows, rows)
+    keep = rank < max_influences
+    rows = rows[keep]
+    groups = groups[keep]
+    weights = weights[keep]
+    totals = np.bincount(rows, weights, minlength=num_rows)
+    weights /= totals[rows]
+    return rows, groups, weights
+
+
+def get_armature_deformed_world_co(obj):
+    """Returns the world space positions of the basis vertices deformed only by the object's armature modifiers.
+       (The other modifiers and the shape keys are disabled while evaluating.)"""
+    show_only_shape_key = obj.show_only_shape_key
+    active_shape_key_index = obj.active_shape_key_index
+    hidden_mods = [ mod for mod in obj.modifiers if mod.type != "ARMATURE" and mod.show_viewport ]
+    if obj.data.shape_keys:
+        obj.show_only_shape_key = True
+        obj.active_shape_key_index = 0
+    for mod in hidden_mods:
+        mod.show_viewport = False
+    try:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        obj_eval = obj.evaluated_get(depsgraph)
+        mesh_eval = obj_eval.to_mesh()
+        try:
+            co = get_world_co(obj_eval, get_mesh_co(mesh_eval).astype(np.float64))
+        finally:
+            obj_eval.to_mesh_clear()
+    finally:
+        for mod in hidden_mods:
+            mod.show_viewport = True
+        if obj.data.shape_keys:
+            obj.show_only_shape_key = show_only_shape_key
+            obj.active_shape_key_index = active_shape_key_index
+    return co
+
+
+def get_nearest_surface_weights(src_obj, dst_co, group_names, max_influences):
+    """Returns the (hit vertex indices, (vertex index, group index, weight)) of the vertex group weights
+       of the nearest surface of the (evaluated) source object to the world space positions,
+       keeping only the strongest max_influences groups of each vertex, normalized."""
+    group_map = { src_obj.vertex_groups[name].index: i for i, name in enumerate(group_names)
+                  if name in src_obj.vertex_groups }
+    if not group_map or len(dst_co) == 0:
+        return None
+
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    src_eval = src_obj.evaluated_get(depsgraph)
+    src_mesh = src_eval.to_mesh()
+    try:
+        src_co = get_world_co(src_eval, get_mesh_co(src_mesh).astype(np.float64))
+        src_tris = get_mesh_triangles(src_mesh)
+        vert_groups, vert_weights = get_sparse_vertex_weights(src_mesh, group_map)
+    finally:
+        src_eval.to_mesh_clear()
+
+    if len(src_tris) == 0:
+        return None
+
+    bvh = BVHTree.FromPolygons(src_co.tolist(), src_tris.tolist(), all_triangles=True)
+    num_verts = len(dst_co)
+    locations = np.empty((num_verts, 3), dtype=np.float64)
+    tri_indices = np.full(num_verts, -1, dtype=np.int64)
+    for i, co in enumerate(dst_co.tolist()):
+        location, normal, index, distance = bvh.find_nearest(co)
+        if index is not None:
+            locations[i] = location
+            tri_indices[i] = index
+
+    hits = np.flatnonzero(tri_indices >= 0)
+    corner_verts = src_tris[tri_indices[hits]]
+    bary = get_barycentric_weights(locations[hits], src_co[corner_verts[:, 0]],
+                                   src_co[corner_verts[:, 1]], src_co[corner_verts[:, 2]])
+    rows, groups, weights = interpolate_sparse_weights(corner_verts, bary, vert_groups, vert_weights,
+                                                       len(group_names), max_influences)
+    return hits, (hits[rows], groups, weights)
+
+
+def set_skin_weights(dst_obj, group_names, hits, skin_weights):
+    """Replaces the weights of the hit vertices in all the named vertex groups with the skin weights."""
+    dst_verts, groups, weights = skin_weights
+    order = np.argsort(groups, kind="stable")
+    splits = np.flatnonzero(np.diff(groups[order])) + 1
+    group_verts = { int(groups[idx[0]]): idx for idx in np.split(order, splits) if len(idx) }
+    hit_list = hits.tolist()
+    for i, name in enumerate(group_names):
+        idx = group_verts.get(i)
+        if name in dst_obj.vertex_groups:
+            dst_vg = dst_obj.vertex_groups[name]
+            dst_vg.remove(hit_list)
+        elif idx is not None:
+            dst_vg = dst_obj.vertex_groups.new(name=name)
+        else:
+            continue
+        if idx is not None:
+            set_vertex_group_weights(dst_vg, dst_verts[idx], weights[idx])
+
+
+def get_unposed_positions(arm, obj, posed_co, group_names, skin_weights):
+    """Returns the object space rest positions of the vertices which the armature deforms,
+       with the skin weights, to the world space posed positions (the inverse of the armature modifier)."""
+    dst_verts, groups, weights = skin_weights
+    num_groups = len(group_names)
+    bone_matrices = np.tile(np.identity(4), (num_groups, 1, 1))
+    for i, name in enumerate(group_names):
+        if name in arm.pose.bones:
+            pose_bone = arm.pose.bones[name]
+            bone_matrices[i] = np.array(pose_bone.matrix @ pose_bone.bone.matrix_local.inverted())
+    num_verts = len(posed_co)
+    blended = np.zeros((num_verts, 4, 4), dtype=np.float64)
+    np.add.at(blended, dst_verts, weights[:, None, None] * bone_matrices[groups])
+    # unweighted vertices are not deformed
+    totals = np.bincount(dst_verts, weights, minlength=num_verts)
+    blended[totals <= 0.0] = np.identity(4)
+    arm_world = np.array(arm.matrix_world, dtype=np.float64)
+    to_arm = np.linalg.inv(arm_world)
+    to_obj = np.linalg.inv(np.array(obj.matrix_world, dtype=np.float64)) @ arm_world
+    co = np.concatenate((posed_co, np.ones((num_verts, 1))), axis=1) @ to_arm.T
+    co = np.einsum("nij,nj->ni", np.linalg.inv(blended), co)
+    return (co @ to_obj.T)[:, :3]
+
+
+@utils.profiled("Native Weight Transfer")
+def transfer_skin_weights(src_obj, dst_obj, group_names = None, max_influences = 4, arm = None):
+    """Transfers the vertex group weights of the nearest surface of the (evaluated) source object
+       to the vertices of the destination object (as deformed by its armature), replacing the weights in the named groups.
+       Only the strongest max_influences groups are kept on each vertex and normalized.
+       If an armature is given, the rest positions of the vertices are moved so that the armature,
+       with the new weights, deforms them to where they are now."""
+
+    if group_names is None:
+        group_names = [ vg.name for vg in src_obj.vertex_groups ]
+
+    dst_co = get_armature_deformed_world_co(dst_obj)
+
+    result = get_nearest_surface_weights(src_obj, dst_co, group_names, max_influences)
+    if result is None:
+        return False
+    hits, skin_weights = result
+
+    set_skin_weights(dst_obj, group_names, hits, skin_weights)
+    if arm:
+        rest_co = get_unposed_positions(arm, dst_obj, dst_co, group_names, skin_weights)
+        set_vert_positions(dst_obj, np.arange(len(rest_co)), rest_co.astype(np.float32))
+
+    utils.log_info(f"Transferred skin weights: {src_obj.name} -> {dst_obj.name} ({len(hits)} verts)")
+    return True
+
+
+def map_image_to_vertex_weights(obj, mat, image, vertex_group, func, interpolation = "CLOSEST"):
     if vertex_group in obj.vertex_groups:
         vg = obj.vertex_groups[vertex_group]
     else:
         vg = obj.vertex_groups.new(name=vertex_group)
-    vg_index = vg.index
 
     mat_index = -1
     for i, slot in enumerate(obj.material_slots):
@@ -349,28 +721,19 @@ def map_image_to_vertex_weights(obj, mat, image, vertex_group, func):
             break
 
     mesh = obj.data
-    bm = bmesh.new()
-    bm.from_mesh(mesh)
-    bm.faces.ensure_lookup_table()
-    bm.verts.ensure_lookup_table()
+    loop_indices, loop_faces, loop_materials = get_face_loops(mesh)
+    loop_verts, uvs = get_loop_verts_and_uvs(mesh)
+    loop_indices = loop_indices[loop_materials == mat_index]
+    if len(loop_indices) == 0:
+        return
 
-    ul = bm.loops.layers.uv[0]
-    bm.verts.layers.deform.verify()
-    dl = bm.verts.layers.deform.active
-    for face in bm.faces:
-        if face.material_index == mat_index:
-            for loop in face.loops:
-                uv = loop[ul].uv
-                uv.x -= int(uv.x)
-                uv.y -= int(uv.y)
-                vert = bm.verts[loop.vert.index]
-                x = int((uv.x + uhw) * wmo)
-                y = int((uv.y + vhw) * hmo)
-                pixel_value = pixels[x * 4 + y * width * 4]
-                weight = func(pixel_value)
-                vert[dl][vg_index] = weight
+    # sample the red channel of the image at every loop of the material
+    values = sample_image(get_image_channel(image), uvs[loop_indices], interpolation)
+    weights = apply_weight_func(func, values)
 
-    bm.to_mesh(mesh)
+    # the last loop of each vertex sets the weight
+    vert_indices, vert_weights = last_by_index(loop_verts[loop_indices], weights)
+    set_vertex_group_weights(vg, vert_indices, vert_weights)
 
 
 def remove_vertex_groups_from_selected(obj, vertex_groups):
@@ -442,7 +805,7 @@ def parse_island_non_recursive(bm, face_indices, faces_left, island, face_map, v
                 connected_faces = vert_map[uv_id]
                 if connected_faces:
                     for cf_index in connected_faces:
-                        if cf_index not in island:
+                        if cf_index in faces_left:
                             next_indices.add(cf_index)
         face_indices = next_indices
 
@@ -465,7 +828,6 @@ def get_uv_islands(bm, uv_layer, use_selected = True):
     """Return a list of faces in each distinct uv island."""
     face_map = {}
     vert_map = {}
-    uv_map = {}
     ul = bm.loops.layers.uv[uv_layer]
 
     if use_selected:
@@ -476,7 +838,6 @@ def get_uv_islands(bm, uv_layer, use_selected = True):
     for face in faces:
         for loop in face.loops:
             uv_id = loop[ul].uv.to_tuple(5), loop.vert.index
-            uv_map[loop.vert.index] = loop[ul].uv
             if face.index not in face_map:
                 face_map[face.index] = set()
             if uv_id not in vert_map:
@@ -489,15 +850,137 @@ def get_uv_islands(bm, uv_layer, use_selected = True):
 
     while len(faces_left) > 0:
         current_island = []
-        face_index = list(faces_left)[0]
-        face_indices = set()
-        face_indices.add(face_index)
-        parse_island_non_recursive(bm, face_indices, faces_left, current_island, face_map, vert_map)
+        face_index = next(iter(faces_left))
+        faces_left.remove(face_index)
+        face_indices = [face_index]
+        # breadth first, faces are removed from faces_left as they are queued
+        while face_indices:
+            next_indices = []
+            for face_index in face_indices:
+                current_island.append(face_index)
+                for uv_id in face_map[face_index]:
+                    for cf_index in vert_map[uv_id]:
+                        if cf_index in faces_left:
+                            faces_left.remove(cf_index)
+                            next_indices.append(cf_index)
+            face_indices = next_indices
         islands.append(current_island)
 
     return islands
 
 
+def label_connected_faces(loop_faces, loop_ids, num_faces, num_ids):
+    """Labels the faces connected by shared loop ids (e.g. UV ids) with the lowest face index in each component.
+       Min-label propagation with pointer jumping, each pass is O(loops)."""
+    labels = np.arange(num_faces, dtype=np.int64)
+    while True:
+        id_labels = np.full(num_ids, num_faces, dtype=np.int64)
+        np.minimum.at(id_labels, loop_ids, labels[loop_faces])
+        new_labels = labels.copy()
+        np.minimum.at(new_labels, loop_faces, id_labels[loop_ids])
+        # hook the previous roots to the new labels
+        np.minimum.at(new_labels, labels, new_labels)
+        # pointer jumping
+        while True:
+            jumped = new_labels[new_labels]
+            if np.array_equal(jumped, new_labels):
+                break
+            new_labels = jumped
+        if np.array_equal(new_labels, labels):
+            return labels
+        labels = new_labels
+
+
+class UVIslands():
+    """The UV islands of the mesh, read with foreach_get and labelled once.
+       islands: list of face index arrays, one per island,
+       bounds: list of (uv_min, uv_max) Vectors, one per island,
+       adjacent: number of adjacent faces (across edges) of each face in the mesh.
+       Be in object mode."""
+    islands: list = None
+    bounds: list = None
+    adjacent = None
+
+    def __init__(self, mesh : bpy.types.Mesh, uv_layer = 0, use_selected = True):
+        num_faces = len(mesh.polygons)
+        num_loops = len(mesh.loops)
+        self.islands = []
+        self.bounds = []
+        self.adjacent = np.zeros(num_faces, dtype=np.int64)
+        if num_faces == 0 or not mesh.uv_layers:
+            return
+
+        loop_starts = np.empty(num_faces, dtype=np.int32)
+        loop_totals = np.empty(num_faces, dtype=np.int32)
+        hidden = np.empty(num_faces, dtype=bool)
+        mesh.polygons.foreach_get("loop_start", loop_starts)
+        mesh.polygons.foreach_get("loop_total", loop_totals)
+        mesh.polygons.foreach_get("hide", hidden)
+        valid = ~hidden
+        if use_selected:
+            selected = np.empty(num_faces, dtype=bool)
+            mesh.polygons.foreach_get("select", selected)
+            valid &= selected
+
+        loop_verts = np.empty(num_loops, dtype=np.int32)
+        loop_edges = np.empty(num_loops, dtype=np.int32)
+        uvs = np.empty(num_loops * 2, dtype=np.float32)
+        mesh.loops.foreach_get("vertex_index", loop_verts)
+        mesh.loops.foreach_get("edge_index", loop_edges)
+        mesh.uv_layers[uv_layer].data.foreach_get("uv", uvs)
+        uvs = uvs.reshape(-1, 2)
+
+        # face and loop index of each face corner
+        loop_faces = np.repeat(np.arange(num_faces, dtype=np.int64), loop_totals)
+        loop_indices = (np.repeat(loop_starts - np.cumsum(loop_totals) + loop_totals, loop_totals) +
+                        np.arange(num_loops, dtype=np.int64))
+
+        # number of faces sharing each edge, less this face, summed per face
+        edge_faces = np.bincount(loop_edges, minlength=len(mesh.edges))
+        np.add.at(self.adjacent, loop_faces, edge_faces[loop_edges[loop_indices]] - 1)
+
+        # only the loops of the valid faces
+        valid_loops = valid[loop_faces]
+        loop_faces = loop_faces[valid_loops]
+        loop_indices = loop_indices[valid_loops]
+        if len(loop_faces) == 0:
+            return
+
+        # uv id: uv coordinates (to 5 decimal places) and vertex index
+        loop_uvs = uvs[loop_indices]
+        uv_keys = np.round(loop_uvs.astype(np.float64) * 100000).astype(np.int64)
+        vert_keys = loop_verts[loop_indices]
+        order = np.lexsort((uv_keys[:, 1], uv_keys[:, 0], vert_keys))
+        new_key = np.empty(len(order), dtype=bool)
+        new_key[0] = True
+        new_key[1:] = ((vert_keys[order[1:]] != vert_keys[order[:-1]]) |
+                       np.any(uv_keys[order[1:]] != uv_keys[order[:-1]], axis=1))
+        loop_ids = np.empty(len(order), dtype=np.int64)
+        loop_ids[order] = np.cumsum(new_key) - 1
+
+        labels = label_connected_faces(loop_faces, loop_ids, num_faces, int(loop_ids.max()) + 1)
+
+        # group the valid faces by island, islands in order of their first face
+        faces = np.flatnonzero(valid)
+        face_labels = labels[faces]
+        order = np.argsort(face_labels, kind="stable")
+        faces = faces[order]
+        splits = np.flatnonzero(np.diff(face_labels[order])) + 1
+        self.islands = np.split(faces, splits)
+
+        # uv bounds of each island
+        loop_labels = labels[loop_faces]
+        order = np.argsort(loop_labels, kind="stable")
+        loop_uvs = loop_uvs[order]
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(loop_labels[order])) + 1))
+        uv_min = np.minimum.reduceat(loop_uvs, starts, axis=0)
+        uv_max = np.maximum.reduceat(loop_uvs, starts, axis=0)
+        self.bounds = [ (Vector(uv_min[i]), Vector(uv_max[i])) for i in range(len(starts)) ]
+
+    def __len__(self):
+        return len(self.islands)
+
+
 def get_uv_aligned_edges(bm, island, card_dir, uv_map, get_non_aligned = False, dir_threshold = 0.9):
     edge : bmesh.types.BMEdge
     face : bmesh.types.BMFace
@@ -576,15 +1059,20 @@ def get_uv_bounds(uv_map):
 
 
 
-def is_island_grid(bm : bmesh.types.BMesh, island : list):
-    """island: list of face indices"""
+def is_island_grid(bm : bmesh.types.BMesh, island : list, adjacent = None):
+    """island: list of face indices,
+       adjacent: optional array of the adjacent face count of each face (from UVIslands)"""
     adjacent_count = {}
-    for face_index in island:
-        face = bm.faces[face_index]
-        count = count_adjacent_faces(face)
-        if count not in adjacent_count:
-            adjacent_count[count] = 0
-        adjacent_count[count] += 1
+    if adjacent is not None:
+        counts, totals = np.unique(adjacent[island], return_counts=True)
+        adjacent_count = { int(count): int(total) for count, total in zip(counts, totals) }
+    else:
+        for face_index in island:
+            face = bm.faces[face_index]
+            count = count_adjacent_faces(face)
+            if count not in adjacent_count:
+                adjacent_count[count] = 0
+            adjacent_count[count] += 1
 
     num_faces = len(island)
 
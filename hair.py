@@ -206,6 +206,10 @@ def add_poly_spline(points, curve):
 def card_dir_from_uv_map(card_dirs, uv_map):
     # analyse uv bounds
     uv_min, uv_max = geom.get_uv_bounds(uv_map)
+    return card_dir_from_uv_bounds(card_dirs, uv_min, uv_max)
+
+
+def card_dir_from_uv_bounds(card_dirs, uv_min, uv_max):
     uv_extent = uv_max - uv_min
     uv_aspect = uv_extent.x / uv_extent.y
 
@@ -339,13 +343,16 @@ def sort_lateral_card(obj, bm, loops, uv_map, dir):
     return card
 
 
-def grid_to_loops(obj, bm, island, card_dirs, one_loop_per_card):
+def grid_to_loops(obj, bm, island, card_dirs, one_loop_per_card, uv_bounds = None):
     props = vars.props()
 
     # each island has a unique UV map
     uv_map = geom.get_uv_island_map(bm, 0, island)
 
-    card_dir = card_dir_from_uv_map(card_dirs, uv_map)
+    if uv_bounds:
+        card_dir = card_dir_from_uv_bounds(card_dirs, *uv_bounds)
+    else:
+        card_dir = card_dir_from_uv_map(card_dirs, uv_map)
 
     # get all edges aligned with the card dir in the island
     edges = geom.get_uv_aligned_edges(bm, island, card_dir, uv_map, dir_threshold=props.hair_card_dir_threshold)
@@ -491,13 +498,16 @@ def project_boundary_loop(src_loop, dst_loop):
     return loop
 
 
-def mesh_to_loops(obj, bm, island, card_dirs):
+def mesh_to_loops(obj, bm, island, card_dirs, uv_bounds = None):
     props = vars.props()
 
     # each island has a unique UV map
     uv_map = geom.get_uv_island_map(bm, 0, island)
 
-    card_dir = card_dir_from_uv_map(card_dirs, uv_map)
+    if uv_bounds:
+        card_dir = card_dir_from_uv_bounds(card_dirs, *uv_bounds)
+    else:
+        card_dir = card_dir_from_uv_map(card_dirs, uv_map)
 
     # find the boundary edges
     boundary_edges = geom.get_boundary_edges(bm, island)
@@ -552,27 +562,27 @@ def selected_cards_to_length_loops(chr_cache, obj, card_dirs, one_loop_per_card
     mesh = obj.data
     bm = geom.get_bmesh(mesh)
 
-    # get lists of the faces in each selected island
-    islands = geom.get_uv_islands(bm, 0, use_selected=True)
+    # get arrays of the faces in each selected island
+    uv_islands = geom.UVIslands(mesh, 0, use_selected=True)
 
-    utils.log_info(f"{len(islands)} islands selected.")
+    utils.log_info(f"{len(uv_islands)} islands selected.")
 
     all_loops = []
     cards = []
 
-    for island in islands:
+    for island, uv_bounds in zip(uv_islands.islands, uv_islands.bounds):
 
         utils.log_info(f"Processing island, faces: {len(island)}")
         utils.log_indent()
 
-        is_grid = geom.is_island_grid(bm, island)
+        is_grid = geom.is_island_grid(bm, island, uv_islands.adjacent)
         loops = None
         if is_grid:
-            loops = grid_to_loops(obj, bm, island, card_dirs, one_loop_per_card)
+            loops = grid_to_loops(obj, bm, island, card_dirs, one_loop_per_card, uv_bounds)
 
         if not loops:
             is_grid = False
-            loops = mesh_to_loops(obj, bm, island, card_dirs)
+            loops = mesh_to_loops(obj, bm, island, card_dirs, uv_bounds)
 
         if is_grid:
             utils.log_info("Grid")
@@ -1113,14 +1123,14 @@ def get_hair_cards_lateral(chr_cache, obj, card_dirs, card_selection_mode):
     mesh = obj.data
     bm = geom.get_bmesh(mesh)
 
-    # get lists of the faces in each selected island
-    islands = geom.get_uv_islands(bm, 0, use_selected=True)
+    # get arrays of the faces in each selected island
+    uv_islands = geom.UVIslands(mesh, 0, use_selected=True)
 
-    utils.log_info(f"{len(islands)} islands selected.")
+    utils.log_info(f"{len(uv_islands)} islands selected.")
 
     cards = []
 
-    for island in islands:
+    for island, uv_bounds in zip(uv_islands.islands, uv_islands.bounds):
 
         utils.log_info(f"Processing island, faces: {len(island)}")
         utils.log_indent()
@@ -1128,7 +1138,7 @@ def get_hair_cards_lateral(chr_cache, obj, card_dirs, card_selection_mode):
         # each island has a unique UV map
         uv_map = geom.get_uv_island_map(bm, 0, island)
 
-        card_dir = card_dir_from_uv_map(card_dirs, uv_map)
+        card_dir = card_dir_from_uv_bounds(card_dirs, *uv_bounds)
 
         # get all edges NOT aligned with the card dir in the island, i.e. the lateral edges
         edges = geom.get_uv_aligned_edges(bm, island, card_dir, uv_map,
@@ -15,6 +15,9 @@
 # along with CC/iC Blender Tools.  If not, see <https://www.gnu.org/licenses/>.
 
 import os
+import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 import bpy
 
 from . import colorspace, nodeutils, params, utils, vars
@@ -48,7 +51,209 @@ def check_max_size(image):
         image.scale(min(width, prefs.max_texture_size), min(height, prefs.max_texture_size))
 
 
+# normalized file path -> bpy.data.images name, rebuilt when the image count changes or a cached name is stale,
+# images with reassigned file paths are added with add_image_path()
+IMAGE_PATH_INDEX = { "count": -1, "paths": {} }
+# normalized file path -> [size, mtime_ns, hash], persisted in the user config folder
+IMAGE_HASH_CACHE = { "loaded": False, "dirty": False, "hashes": {} }
+IMAGE_HASH_CACHE_FILE = "image_hash_cache.json"
+IMAGE_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def normalize_image_path(filepath):
+    return os.path.normpath(bpy.path.abspath(filepath))
+
+
+def index_image_paths():
+    paths = {}
+    for image in bpy.data.images:
+        if image.type == "IMAGE" and image.filepath != "":
+            path = normalize_image_path(image.filepath)
+            if path not in paths:
+                paths[path] = image.name
+    IMAGE_PATH_INDEX["paths"] = paths
+    IMAGE_PATH_INDEX["count"] = len(bpy.data.images)
+
+
+def add_image_path(image):
+    """Adds a newly loaded image, or an image with a reassigned file path, to the path index."""
+    if IMAGE_PATH_INDEX["count"] >= 0 and image and image.filepath != "":
+        IMAGE_PATH_INDEX["paths"].setdefault(normalize_image_path(image.filepath), image.name)
+        # the index only accounts for this one new image, any others are found by the next rebuild
+        count = len(bpy.data.images)
+        if IMAGE_PATH_INDEX["count"] == count - 1:
+            IMAGE_PATH_INDEX["count"] = count
+
+
+def find_image_by_path(filename):
+    """Returns the first existing image loaded from the file, or None."""
+    path = os.path.normpath(os.path.abspath(filename))
+    for rebuild in [IMAGE_PATH_INDEX["count"] != len(bpy.data.images), True]:
+        if rebuild:
+            index_image_paths()
+        name = IMAGE_PATH_INDEX["paths"].get(path)
+        if name is None:
+            return None
+        image = bpy.data.images.get(name)
+        if image and image.type == "IMAGE" and image.filepath != "" and normalize_image_path(image.filepath) == path:
+            return image
+    return None
+
+
+def get_image_hash_cache_path():
+    try:
+        cache_dir = bpy.utils.user_resource("CONFIG", path="cc_blender_tools", create=True)
+        return os.path.join(cache_dir, IMAGE_HASH_CACHE_FILE)
+    except:
+        return None
+
+
+def load_image_hash_cache():
+    if not IMAGE_HASH_CACHE["loaded"]:
+        IMAGE_HASH_CACHE["loaded"] = True
+        cache_path = get_image_hash_cache_path()
+        if cache_path and os.path.exists(cache_path):
+            try:
+                with open(cache_path, "r") as cache_file:
+                    IMAGE_HASH_CACHE["hashes"] = json.load(cache_file)
+            except Exception as e:
+                utils.log_error("Unable to read image hash cache", e)
+    return IMAGE_HASH_CACHE["hashes"]
+
+
+def save_image_hash_cache():
+    if IMAGE_HASH_CACHE["dirty"]:
+        IMAGE_HASH_CACHE["dirty"] = False
+        cache_path = get_image_hash_cache_path()
+        if cache_path:
+            # drop entries for files that no longer exist
+            hashes = { path: entry for path, entry in IMAGE_HASH_CACHE["hashes"].items() if os.path.exists(path) }
+            IMAGE_HASH_CACHE["hashes"] = hashes
+            try:
+                with open(cache_path, "w") as cache_file:
+                    json.dump(hashes, cache_file)
+            except Exception as e:
+                utils.log_error("Unable to write image hash cache", e)
+
+
+def get_image_file_hash(filename):
+    """Content hash (BLAKE2b) of the file, cached per path, size and modification time."""
+    path = os.path.normpath(os.path.abspath(filename))
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    hashes = load_image_hash_cache()
+    entry = hashes.get(path)
+    if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+        return entry[2]
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(IMAGE_HASH_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    file_hash = hasher.hexdigest()
+    hashes[path] = [stat.st_size, stat.st_mtime_ns, file_hash]
+    IMAGE_HASH_CACHE["dirty"] = True
+    return file_hash
+
+
+IMAGE_PREFETCH_THREADS = 8
+IMAGE_PREFETCH_JSON_SECTIONS = [ ["Textures"], ["Custom Shader", "Image"], ["Wrinkle", "Textures"] ]
+
+
+def get_json_texture_file(import_dir, tex_json):
+    """Resolves the texture path in the json the same way as find_material_image."""
+    if tex_json and "Texture Path" in tex_json and tex_json["Texture Path"]:
+        tex_path: str = utils.fix_texture_rel_path(tex_json["Texture Path"])
+        if os.path.isabs(tex_path):
+            return os.path.normpath(tex_path)
+        image_file = os.path.normpath(os.path.join(import_dir, tex_path))
+        if os.path.exists(image_file):
+            return image_file
+        image_file = utils.local_path(tex_path)
+        if image_file:
+            return image_file
+    return None
+
+
+def get_character_texture_files(chr_json, import_dir):
+    """Returns all the (unique) texture files referenced by the materials in the character json."""
+    files = {}
+    if chr_json and "Meshes" in chr_json:
+        for obj_json in chr_json["Meshes"].values():
+            if "Materials" not in obj_json:
+                continue
+            for mat_json in obj_json["Materials"].values():
+                for section in IMAGE_PREFETCH_JSON_SECTIONS:
+                    textures_json = mat_json
+                    for key in section:
+                        textures_json = textures_json.get(key) if type(textures_json) is dict else None
+                    if type(textures_json) is dict:
+                        for tex_json in textures_json.values():
+                            if type(tex_json) is dict:
+                                image_file = get_json_texture_file(import_dir, tex_json)
+                                if image_file:
+                                    files[image_file] = True
+    return list(files)
+
+
+def prefetch_image_file(image_file, deduplicate):
+    """Reads the whole file so the main thread image load and hash come from the OS file cache."""
+    try:
+        if deduplicate:
+            # hashing reads the whole file, unless the hash is already cached
+            entry = IMAGE_HASH_CACHE["hashes"].get(os.path.normpath(os.path.abspath(image_file)))
+            if not entry:
+                get_image_file_hash(image_file)
+                return True
+        with open(image_file, "rb") as f:
+            while f.read(IMAGE_HASH_CHUNK_SIZE):
+                pass
+        return True
+    except OSError:
+        return False
+
+
+@utils.profiled("Prefetch Textures")
+def prefetch_character_textures(chr_json, import_dir, deduplicate):
+    """Reads (and hashes) all the texture files of the character in parallel,
+       before the materials are built on the main thread."""
+    image_files = [ f for f in get_character_texture_files(chr_json, import_dir) if os.path.isfile(f) ]
+    if image_files:
+        # load the hash cache on the main thread first
+        load_image_hash_cache()
+        utils.log_info(f"Prefetching {len(image_files)} texture files...")
+        with ThreadPoolExecutor(max_workers=min(IMAGE_PREFETCH_THREADS, len(image_files))) as executor:
+            results = list(executor.map(prefetch_image_file, image_files, [deduplicate] * len(image_files)))
+        failed = results.count(False)
+        if failed:
+            utils.log_warn(f"Unable to prefetch {failed} texture files.")
+
+
+class ImageRegistry():
+    """Images processed during an import / build, by file content hash, for de-duplication."""
+    images: dict = None
+
+    def __init__(self):
+        self.images = {}
+
+    def find(self, file_hash):
+        if file_hash in self.images:
+            image = self.images[file_hash]
+            try:
+                if image.name:
+                    return image
+            except ReferenceError:
+                del self.images[file_hash]
+        return None
+
+    def add(self, file_hash, image):
+        if file_hash and image and file_hash not in self.images:
+            self.images[file_hash] = image
+
+
 # load an image from a file, but try to find it in the existing images first
+@utils.profiled("Load Image")
 def load_image(filename, color_space, processed_images = None, reuse_existing = True):
 
     i: bpy.types.Image = None
@@ -56,54 +261,55 @@ def load_image(filename, color_space, processed_images = None, reuse_existing =
     #       (but then the rebuild won't work...)
     #       or only consider images with the characters folder as a common path...
 
+    processed_images: ImageRegistry
+
     if reuse_existing:
 
-        for i in bpy.data.images:
-            if i.type == "IMAGE" and i.filepath != "":
-
-                if os.path.normpath(bpy.path.abspath(i.filepath)) == os.path.normpath(os.path.abspath(filename)):
-                    utils.log_info("Using existing image: " + i.filepath)
-                    found = False
-                    image_md5 = None
-                    image_path = bpy.path.abspath(i.filepath)
-                    if processed_images is not None and os.path.exists(image_path):
-                        image_md5 = utils.md5sum(image_path)
-                        for p in processed_images:
-                            if p[0] == image_md5:
-                                utils.log_info("Skipping duplicate existing image, reusing: " + p[1].filepath)
-                                i = p[1]
-                                found = True
-                    if i.depth == 32 and i.alpha_mode != "CHANNEL_PACKED":
-                        i.alpha_mode = "CHANNEL_PACKED"
-                    if processed_images is not None and i and image_md5 and not found:
-                        processed_images.append([image_md5, i])
-                        if not i.is_dirty:
-                            utils.log_detail(f"Reloading image: {i.name}")
-                            try:
-                                i.reload()
-                            except:
-                                utils.log_detail(f"Unable to reload image: {i.name}")
-                        else:
-                            utils.log_info(f"Image {i.name} has been modified, keeping in-memory image.")
-                    colorspace.set_image_color_space(i, color_space)
-                    return i
+        i = find_image_by_path(filename)
+        if i:
+            utils.log_info("Using existing image: " + i.filepath)
+            found = False
+            image_hash = None
+            image_path = bpy.path.abspath(i.filepath)
+            if processed_images is not None and os.path.exists(image_path):
+                image_hash = get_image_file_hash(image_path)
+                p = processed_images.find(image_hash)
+                if p:
+                    utils.log_info("Skipping duplicate existing image, reusing: " + p.filepath)
+                    i = p
+                    found = True
+            if i.depth == 32 and i.alpha_mode != "CHANNEL_PACKED":
+                i.alpha_mode = "CHANNEL_PACKED"
+            if processed_images is not None and i and image_hash and not found:
+                processed_images.add(image_hash, i)
+                if not i.is_dirty:
+                    utils.log_detail(f"Reloading image: {i.name}")
+                    try:
+                        i.reload()
+                    except:
+                        utils.log_detail(f"Unable to reload image: {i.name}")
+                else:
+                    utils.log_info(f"Image {i.name} has been modified, keeping in-memory image.")
+            colorspace.set_image_color_space(i, color_space)
+            return i
 
     try:
-        image_md5 = None
+        image_hash = None
         if processed_images is not None and os.path.exists(filename):
-            image_md5 = utils.md5sum(filename)
-            for p in processed_images:
-                if p[0] == image_md5:
-                    utils.log_info("Skipping duplicate image, reusing: " + p[1].filepath)
-                    return p[1]
+            image_hash = get_image_file_hash(filename)
+            p = processed_images.find(image_hash)
+            if p:
+                utils.log_info("Skipping duplicate image, reusing: " + p.filepath)
+                return p
         utils.log_info("Loading new image: " + filename)
         image = bpy.data.images.load(filename)
+        add_image_path(image)
         colorspace.set_image_color_space(image, color_space)
         if image.depth == 32:
             image.alpha_mode = "CHANNEL_PACKED"
         #check_max_size(image)
-        if processed_images is not None and image and image_md5:
-            processed_images.append([image_md5, image])
+        if processed_images is not None and image and image_hash:
+            processed_images.add(image_hash, image)
         return image
     except Exception as e:
         utils.log_error("Unable to load image: " + filename, e)
@@ -124,7 +330,7 @@ def find_image_file(base_dir, dirs, mat, texture_type):
                 dir = utils.local_repath(dir, base_dir)
 
             dir = os.path.normpath(dir)
-            if dir and os.path.exists(dir):
+            if dir:
                 if last != dir:
                     last = dir
                     for suffix in suffix_list:
@@ -136,18 +342,44 @@ def find_image_file(base_dir, dirs, mat, texture_type):
     return None
 
 
+# directory -> [mtime_ns, { lower case file name without extension: file path }]
+DIRECTORY_INDEX = {}
+
+
+def clear_directory_index():
+    DIRECTORY_INDEX.clear()
+
+
+def get_directory_index(search_dir):
+    """Returns the lower case file name (without extension) -> path index of the directory,
+       listed once and re-listed only when the directory modification time changes."""
+    try:
+        mtime = os.stat(search_dir).st_mtime_ns
+    except OSError:
+        DIRECTORY_INDEX.pop(search_dir, None)
+        return None
+    entry = DIRECTORY_INDEX.get(search_dir)
+    if entry and entry[0] == mtime:
+        return entry[1]
+    index = {}
+    try:
+        for f in os.listdir(search_dir):
+            name, ext = os.path.splitext(f)
+            name = name.lower()
+            if name not in index:
+                index[name] = os.path.join(search_dir, f)
+    except OSError:
+        return None
+    DIRECTORY_INDEX[search_dir] = [mtime, index]
+    return index
+
+
 def find_file_by_name(search_dir, search):
     """Find the file by the name (without extension)."""
 
-    search = search.lower()
-    if os.path.exists(search_dir):
-        files = os.listdir(search_dir)
-        for f in files:
-            dir, file = os.path.split(f)
-            name, ext = os.path.splitext(file)
-            name = name.lower()
-            if name == search:
-                return os.path.join(search_dir, f)
+    index = get_directory_index(search_dir)
+    if index:
+        return index.get(search.lower())
     return None
 
 
@@ -348,6 +580,7 @@ def get_custom_image(image_name, size, alpha = False, data = True, float = False
 
     if path:
         image.filepath_raw = path
+        add_image_path(image)
         image.save()
 
     return image
@@ -389,5 +622,6 @@ def save_image_to_format_dir(img, format, dir, name):
     utils.log_info(f"   Path: {full_path}")
     os.makedirs(full_dir, exist_ok=True)
     img.filepath_raw = full_path
+    add_image_path(img)
     img.save()
     return img
\ No newline at end of file
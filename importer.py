@@ -34,6 +34,7 @@ def delete_import(chr_cache):
     utils.clean_up_unused()
 
 
+@utils.profiled("Process Material")
 def process_material(chr_cache, obj, mat, obj_json, processed_images):
     props = vars.props()
     prefs = vars.prefs()
@@ -121,6 +122,7 @@ def process_material(chr_cache, obj, mat, obj_json, processed_images):
                     channel_mixer.rebuild_mixers(chr_cache, mat, mixer_settings)
 
 
+@utils.profiled("Process Object")
 def process_object(chr_cache, obj : bpy.types.Object, objects_processed, chr_json, processed_materials, processed_images):
     props = vars.props()
     prefs = vars.prefs()
@@ -182,7 +184,7 @@ def process_object(chr_cache, obj : bpy.types.Object, objects_processed, chr_jso
                         utils.log_info(f"Found duplicate material, re-using {first.name} instead.")
                         slot.material = first
                     else:
-                        processed_materials.append(mat)
+                        processed_materials.add(chr_cache, mat)
 
                 utils.log_recess()
                 objects_processed.append(mat)
@@ -447,6 +449,7 @@ def process_root_bones(arm, json_data, name):
                 pose_bone["root_type"] = type
 
 
+@utils.profiled("Process Import")
 def process_rl_import(file_path, import_flags, armatures, rl_armatures, objects: list,
                       actions, json_data, report, link_id, action_name_prefix=""):
     props = vars.props()
@@ -503,7 +506,7 @@ def process_rl_import(file_path, import_flags, armatures, rl_armatures, objects:
             utils.log_info(f"Generating Character Data: {character_name}")
             utils.log_indent()
 
-            chr_cache = props.import_cache.add()
+            chr_cache = props.add_character_cache()
             chr_cache.import_file = file_path
             chr_cache.import_flags = import_flags
             # display name of character
@@ -596,7 +599,7 @@ def process_rl_import(file_path, import_flags, armatures, rl_armatures, objects:
             utils.log_info(f"Generating Scene/Prop Data: {character_name}")
             utils.log_indent()
 
-            chr_cache = props.import_cache.add()
+            chr_cache = props.add_character_cache()
             chr_cache.import_file = file_path
             chr_cache.import_flags = import_flags
             # display name of character
@@ -668,7 +671,7 @@ def process_rl_import(file_path, import_flags, armatures, rl_armatures, objects:
         utils.log_info(f"Generating Character Data: {character_name}")
         utils.log_indent()
 
-        chr_cache = props.import_cache.add()
+        chr_cache = props.add_character_cache()
         chr_cache.import_file = file_path
         chr_cache.import_flags = import_flags
         # display name of character
@@ -796,6 +799,7 @@ class CC3Import(bpy.types.Operator):
     import_flags: ImportFlags = ImportFlags.NONE
 
 
+    @utils.profiled("Read Json")
     def read_json_data(self, file_path, stage = 0):
 
         # if not fbx, return no json without error
@@ -826,11 +830,12 @@ class CC3Import(bpy.types.Operator):
         return json_data
 
 
+    @utils.profiled("Import Model")
     def import_character(self):
         props = vars.props()
         prefs = vars.prefs()
 
-        utils.start_timer()
+        start_time = utils.start_timer()
 
         utils.log_info("")
         utils.log_info("Importing Character Model:")
@@ -860,12 +865,14 @@ class CC3Import(bpy.types.Operator):
             # But the mesh is really all we need, so just keep going...
             if colorspace.is_aces():
                 try:
-                    bpy.ops.import_scene.fbx(filepath=self.filepath, directory=dir, use_anim=import_anim, use_image_search=False)
+                    with utils.profile("FBX Import"):
+                        bpy.ops.import_scene.fbx(filepath=self.filepath, directory=dir, use_anim=import_anim, use_image_search=False)
                 except:
                     utils.log_warn("FBX Import Error: This may be due to color space differences. Continuing...")
             else:
                 try:
-                    bpy.ops.import_scene.fbx(filepath=self.filepath, directory=dir, use_anim=import_anim, use_image_search=False)
+                    with utils.profile("FBX Import"):
+                        bpy.ops.import_scene.fbx(filepath=self.filepath, directory=dir, use_anim=import_anim, use_image_search=False)
                 except:
                     utils.log_error("FBX Import Error due to bad mesh?")
 
@@ -891,7 +898,7 @@ class CC3Import(bpy.types.Operator):
                     # remove the colliders for now (only needed for spring bones)
                     rigidbody.remove_rigid_body_colliders(chr_cache.get_armature())
 
-            utils.log_timer("Done .Fbx Import.")
+            utils.log_timer("Done .Fbx Import.", start=start_time)
 
         elif ImportFlags.OBJ in self.import_flags:
 
@@ -920,13 +927,14 @@ class CC3Import(bpy.types.Operator):
             #        reconstruct_obj_materials(obj)
             #        pass
 
-            utils.log_timer("Done .Obj Import.")
+            utils.log_timer("Done .Obj Import.", start=start_time)
 
         elif ImportFlags.GLB in self.import_flags:
 
             # invoke the GLTF importer
             utils.tag_images()
-            bpy.ops.import_scene.gltf(filepath = self.filepath)
+            with utils.profile("GLTF Import"):
+                bpy.ops.import_scene.gltf(filepath = self.filepath)
             imported = bpy.context.selected_objects.copy()
             self.imported_images = utils.untagged_images()
 
@@ -934,7 +942,7 @@ class CC3Import(bpy.types.Operator):
                 chr_cache = characters.convert_generic_to_non_standard(imported, self.filepath)
                 self.imported_characters = [ chr_cache ]
 
-            utils.log_timer("Done .GLTF Import.")
+            utils.log_timer("Done .GLTF Import.", start=start_time)
 
         elif ImportFlags.VRM in self.import_flags:
 
@@ -945,7 +953,8 @@ class CC3Import(bpy.types.Operator):
 
             # invoke the GLTF importer
             utils.tag_images()
-            bpy.ops.import_scene.gltf(filepath = self.filepath, bone_heuristic="TEMPERANCE")
+            with utils.profile("GLTF Import"):
+                bpy.ops.import_scene.gltf(filepath = self.filepath, bone_heuristic="TEMPERANCE")
             imported = bpy.context.selected_objects.copy()
             self.imported_images = utils.untagged_images()
 
@@ -960,13 +969,14 @@ class CC3Import(bpy.types.Operator):
                 chr_cache = characters.convert_generic_to_non_standard(imported, self.filepath)
                 self.imported_characters = [ chr_cache ]
 
-            utils.log_timer("Done .vrm Import.")
+            utils.log_timer("Done .vrm Import.", start=start_time)
 
         elif ImportFlags.USD in self.import_flags:
 
             # invoke the USD importer
             utils.tag_images()
-            bpy.ops.wm.usd_import(filepath=self.filepath)
+            with utils.profile("USD Import"):
+                bpy.ops.wm.usd_import(filepath=self.filepath)
             imported = bpy.context.selected_objects.copy()
             self.imported_images = utils.untagged_images()
 
@@ -974,15 +984,16 @@ class CC3Import(bpy.types.Operator):
                 chr_cache = characters.convert_generic_to_non_standard(imported, self.filepath)
                 self.imported_characters = [ chr_cache ]
 
-            utils.log_timer("Done .USD Import?")
+            utils.log_timer("Done .USD Import?", start=start_time)
 
 
+    @utils.profiled("Build Materials", operation=True)
     def build_materials(self, context):
         objects_processed = []
         props: properties.CC3ImportProps = vars.props()
         prefs = vars.prefs()
 
-        utils.start_timer()
+        start_time = utils.start_timer()
 
         utils.log_info("")
         utils.log_info("Building Character Materials:")
@@ -1011,9 +1022,14 @@ class CC3Import(bpy.types.Operator):
             if self.param == "BUILD":
                 chr_cache.check_material_types(chr_json)
 
+            imageutils.clear_directory_index()
+
+            if prefs.import_prefetch_textures:
+                imageutils.prefetch_character_textures(chr_json, chr_cache.get_import_dir(), prefs.import_deduplicate)
+
             if prefs.import_deduplicate:
-                processed_images = []
-                processed_materials = []
+                processed_images = imageutils.ImageRegistry()
+                processed_materials = materials.MaterialRegistry()
             else:
                 processed_images = None
                 processed_materials = None
@@ -1031,6 +1047,8 @@ class CC3Import(bpy.types.Operator):
                     if obj and obj in bpy.context.selected_objects:
                         process_object(chr_cache, obj, objects_processed, chr_json, processed_materials, processed_images)
 
+            imageutils.save_image_hash_cache()
+
             # setup default physics
             if props.physics_mode:
                 utils.log_info("")
@@ -1058,7 +1076,7 @@ class CC3Import(bpy.types.Operator):
 
             chr_cache.build_count += 1
 
-        utils.log_timer("Done Build.", "s")
+        utils.log_timer("Done Build.", "s", start=start_time)
 
 
     def detect_import_mode_from_files(self):
@@ -1153,6 +1171,7 @@ class CC3Import(bpy.types.Operator):
         self.import_report = []
 
 
+    @utils.profiled("Import Character", operation=True)
     def run_import(self, context):
         self.import_character()
         self.imported = True
@@ -1441,7 +1460,8 @@ class CC3ImportAnimations(bpy.types.Operator):
         utils.tag_images()
         utils.tag_actions()
         utils.tag_materials()
-        bpy.ops.import_scene.fbx(filepath=path, directory=dir, use_anim=True, use_image_search=False)
+        with utils.profile("FBX Import"):
+            bpy.ops.import_scene.fbx(filepath=path, directory=dir, use_anim=True, use_image_search=False)
         objects = utils.untagged_objects()
         actions = utils.untagged_actions()
         images = utils.untagged_images()
@@ -1496,7 +1516,7 @@ class CC3ImportAnimations(bpy.types.Operator):
         props = vars.props()
         prefs = vars.prefs()
 
-        utils.start_timer()
+        start_time = utils.start_timer()
 
         utils.log_info("")
         utils.log_info("Importing FBX Animations:")
@@ -1509,7 +1529,7 @@ class CC3ImportAnimations(bpy.types.Operator):
             dir, file = os.path.split(self.filepath)
             self.import_animation_fbx(dir, file)
 
-        utils.log_timer("Done Build.", "s")
+        utils.log_timer("Done Build.", "s", start=start_time)
 
         return {"FINISHED"}
 
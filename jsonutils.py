@@ -20,9 +20,193 @@ import bpy
 
 from . import utils
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JsonKeyIndex():
+    """Lower case key and value identity indexes of a json dictionary (meshes, materials, ...).
+       The index is rebuilt when the number of entries changes, or when invalidated by renaming a key."""
+    container: dict = None
+    names: dict = None
+    values: dict = None
+    size: int = -1
+
+    def __init__(self, container: dict):
+        self.container = container
+        self.rebuild()
+
+    def rebuild(self):
+        self.names = {}
+        self.values = {}
+        for key, value in self.container.items():
+            self.names.setdefault(key.lower(), key)
+            self.values.setdefault(id(value), key)
+        self.size = len(self.container)
+
+    def invalidate(self):
+        self.size = -1
+
+    def validate(self):
+        if self.size != len(self.container):
+            self.rebuild()
+
+    def find_key(self, name):
+        """Case insensitive key lookup."""
+        self.validate()
+        name = name.lower()
+        key = self.names.get(name)
+        if key is not None and key not in self.container:
+            # keys replaced without changing the number of entries
+            self.rebuild()
+            key = self.names.get(name)
+        return key
+
+    def find_value_key(self, value):
+        """Reverse lookup of the key of a value in the dictionary."""
+        self.validate()
+        key = self.values.get(id(value))
+        if key is not None and key in self.container and self.container[key] is value:
+            return key
+        # the value may have replaced another under the same key
+        for key, v in self.container.items():
+            if v is value:
+                self.values[id(value)] = key
+                return key
+        return None
+
+
+class CharacterJson():
+    """Key indexes for the mesh, material and physics dictionaries of a character json."""
+    chr_json: dict = None
+    indexes: dict = None
+
+    def __init__(self, chr_json: dict):
+        self.chr_json = chr_json
+        self.indexes = {}
+        try:
+            meshes_json = chr_json["Meshes"]
+            self.index(meshes_json)
+            for obj_json in meshes_json.values():
+                self.index(obj_json["Materials"])
+        except:
+            pass
+        try:
+            soft_physics_json = chr_json["Physics"]["Soft Physics"]["Meshes"]
+            self.index(soft_physics_json)
+            for physics_mesh_json in soft_physics_json.values():
+                self.index(physics_mesh_json["Materials"])
+        except:
+            pass
+
+    def index(self, container: dict) -> JsonKeyIndex:
+        key_index = self.indexes.get(id(container))
+        if key_index is None or key_index.container is not container:
+            key_index = JsonKeyIndex(container)
+            self.indexes[id(container)] = key_index
+        return key_index
+
+
+# id(chr_json) -> CharacterJson, cleared when new json data is read
+CHARACTER_JSON = {}
+
+
+def get_indexed_character_json(chr_json) -> CharacterJson:
+    character_json = CHARACTER_JSON.get(id(chr_json))
+    if character_json is None or character_json.chr_json is not chr_json:
+        character_json = CharacterJson(chr_json)
+        CHARACTER_JSON[id(chr_json)] = character_json
+    return character_json
+
+
+def get_json_index(container: dict) -> JsonKeyIndex:
+    """Returns the key index of the dictionary, if it belongs to an indexed character json."""
+    for character_json in CHARACTER_JSON.values():
+        key_index = character_json.indexes.get(id(container))
+        if key_index and key_index.container is container:
+            return key_index
+    return None
+
+
+def find_json_key(container: dict, name):
+    key_index = get_json_index(container)
+    if key_index:
+        return key_index.find_key(name)
+    name = name.lower()
+    for key in container.keys():
+        if key.lower() == name:
+            return key
+    return None
+
+
+def find_json_value_key(container: dict, value):
+    key_index = get_json_index(container)
+    if key_index:
+        return key_index.find_value_key(value)
+    for key, v in container.items():
+        if v == value:
+            return key
+    return None
+
+
+def clear_json_index():
+    CHARACTER_JSON.clear()
+
+
+# json path -> [size, mtime_ns, file bytes, parsed json data]
+JSON_CACHE = {}
+MAX_JSON_CACHE = 8
+
+
+def parse_json(data: bytes):
+    # json files outputted from Visual Studio projects start with a byte mark order block (3 bytes EF BB BF)
+    if data[0:3] == b"\xEF\xBB\xBF":
+        data = data[3:]
+    if orjson:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (e.g. NaN / Infinity), fall back to the json module
+            pass
+    return json.loads(data.decode("utf-8"))
+
+
+def read_json_file(json_path, copy = False):
+    """Returns the parsed json file, re-using the cached document if the file has not changed.
+       The cached document is shared: callers that modify the json data must request a copy."""
+    stat = os.stat(json_path)
+    entry = JSON_CACHE.get(json_path)
+    if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+        utils.log_detail("Using cached Json data: " + json_path)
+        if copy:
+            return parse_json(entry[2])
+        return entry[3]
+    with open(json_path, "rb") as file:
+        data = file.read()
+    json_data = parse_json(data)
+    clear_json_index()
+    JSON_CACHE.pop(json_path, None)
+    while len(JSON_CACHE) >= MAX_JSON_CACHE:
+        JSON_CACHE.pop(next(iter(JSON_CACHE)))
+    JSON_CACHE[json_path] = [stat.st_size, stat.st_mtime_ns, data, json_data]
+    utils.log_info("Json data successfully parsed: " + json_path)
+    if copy:
+        return parse_json(data)
+    return json_data
+
+
+def clear_json_cache(json_path = None):
+    if json_path:
+        JSON_CACHE.pop(os.path.normpath(json_path), None)
+    else:
+        JSON_CACHE.clear()
+
 
-def read_json(fbx_path, errors):
+def read_json(fbx_path, errors, copy = False):
     json_file_exists = False
+    json_path = None
     try:
         fbx_file = os.path.basename(fbx_path)
         fbx_folder = os.path.dirname(fbx_path)
@@ -34,31 +218,14 @@ def read_json(fbx_path, errors):
 
         if json_path and os.path.exists(json_path):
             json_file_exists = True
-
-            # determine start of json text data
-            file_bytes = open(json_path, "rb")
-            bytes = file_bytes.read(3)
-            file_bytes.close()
-            start = 0
-            # json files outputted from Visual Studio projects start with a byte mark order block (3 bytes EF BB BF)
-            if bytes[0] == 0xEF and bytes[1] == 0xBB and bytes[2] == 0xBF:
-                start = 3
-
-            # read json text
-            file = open(json_path, "rt")
-            file.seek(start)
-            text_data = file.read()
-            json_data = json.loads(text_data)
-            file.close()
-            utils.log_info("Json data successfully parsed: " + json_path)
-            return json_data
+            return read_json_file(os.path.normpath(json_path), copy)
 
         utils.log_info("No Json data to parse, using defaults...")
         if errors:
             errors.append("NO_JSON")
         return None
     except:
-        utils.log_warn("Failed to read Json data: " + json_path)
+        utils.log_warn(f"Failed to read Json data: {json_path}")
         if errors:
             if json_file_exists:
                 errors.append("CORRUPT")
@@ -67,6 +234,7 @@ def read_json(fbx_path, errors):
         return None
 
 
+@utils.profiled("Write Json")
 def write_json(json_data, path, is_fbx_path = False):
     if is_fbx_path:
         file = os.path.basename(path)
@@ -76,6 +244,7 @@ def write_json(json_data, path, is_fbx_path = False):
     json_object = json.dumps(json_data, indent = 4)
     with open(path, "w") as write_file:
         write_file.write(json_object)
+    clear_json_cache(path)
 
 
 def get_all_object_keys(chr_json):
@@ -129,6 +298,7 @@ def get_character_json(json_data, character_id):
     try:
         chr_json = json_data[character_id]["Object"][character_id]
         utils.log_detail("Character Json data found for: " + character_id)
+        get_indexed_character_json(chr_json)
         return chr_json
     except:
         utils.log_warn("Failed to get character Json data!")
@@ -163,12 +333,11 @@ def get_object_json(chr_json, obj):
     if not chr_json:
         return None
     try:
-        name = utils.strip_name(obj.name).lower()
         meshes_json = chr_json["Meshes"]
-        for object_name in meshes_json.keys():
-            if object_name.lower() == name:
-                utils.log_detail("Object Json data found for: " + obj.name)
-                return meshes_json[object_name]
+        object_name = find_json_key(meshes_json, utils.strip_name(obj.name))
+        if object_name is not None:
+            utils.log_detail("Object Json data found for: " + obj.name)
+            return meshes_json[object_name]
     except:
         utils.log_warn("Failed to get object Json data!")
         return None
@@ -180,10 +349,7 @@ def get_object_json_key(chr_json, obj_json):
     if obj_json is None:
         return None
     meshes_json: dict = chr_json["Meshes"]
-    for key, value in meshes_json.items():
-        if value == obj_json:
-            return key
-    return None
+    return find_json_value_key(meshes_json, obj_json)
 
 
 def get_physics_json(chr_json):
@@ -195,15 +361,13 @@ def get_physics_json(chr_json):
 
 def get_soft_physics_json(physics_json, obj, mat):
     try:
-        obj_name = utils.strip_name(obj.name).lower()
-        mat_name = utils.strip_name(mat.name).lower()
         soft_physics_mesh_json = physics_json["Soft Physics"]["Meshes"]
-        for object_name in soft_physics_mesh_json:
-            if object_name.lower() == obj_name:
-                materials_json = soft_physics_mesh_json[object_name]["Materials"]
-                for material_name in materials_json:
-                    if material_name.lower() == mat_name:
-                        return materials_json[material_name]
+        object_name = find_json_key(soft_physics_mesh_json, utils.strip_name(obj.name))
+        if object_name is not None:
+            materials_json = soft_physics_mesh_json[object_name]["Materials"]
+            material_name = find_json_key(materials_json, utils.strip_name(mat.name))
+            if material_name is not None:
+                return materials_json[material_name]
         return None
     except:
         utils.log_warn("Failed to get soft physics material Json data!")
@@ -214,11 +378,10 @@ def get_physics_mesh_json(soft_physics_json, obj):
     if not soft_physics_json:
         return None
     try:
-        name = utils.strip_name(obj.name).lower()
-        for object_name in soft_physics_json.keys():
-            if object_name.lower() == name:
-                utils.log_detail("Physics Object Json data found for: " + obj.name)
-                return soft_physics_json[object_name]
+        object_name = find_json_key(soft_physics_json, utils.strip_name(obj.name))
+        if object_name is not None:
+            utils.log_detail("Physics Object Json data found for: " + obj.name)
+            return soft_physics_json[object_name]
     except:
         utils.log_warn("Failed to get physics object Json data!")
         return None
@@ -229,10 +392,7 @@ def get_physics_mesh_json_key(soft_physics_json, physics_mesh_json):
         return None
     if physics_mesh_json is None:
         return None
-    for key, value in soft_physics_json.items():
-        if value == physics_mesh_json:
-            return key
-    return None
+    return find_json_value_key(soft_physics_json, physics_mesh_json)
 
 
 def get_custom_shader(mat_json):
@@ -249,12 +409,11 @@ def get_material_json(obj_json, material):
     if not obj_json:
         return None
     try:
-        name = utils.strip_name(material.name).lower()
         materials_json = obj_json["Materials"]
-        for material_name in materials_json.keys():
-            if material_name.lower() == name:
-                utils.log_detail("Material Json data found for: " + material.name)
-                return materials_json[material_name]
+        material_name = find_json_key(materials_json, utils.strip_name(material.name))
+        if material_name is not None:
+            utils.log_detail("Material Json data found for: " + material.name)
+            return materials_json[material_name]
     except:
         utils.log_warn("Failed to get material Json data!")
         return None
@@ -266,22 +425,18 @@ def get_material_json_key(obj_json, mat_json):
     if mat_json is None:
         return None
     materials_json: dict = obj_json["Materials"]
-    for key, value in materials_json.items():
-        if value == mat_json:
-            return key
-    return None
+    return find_json_value_key(materials_json, mat_json)
 
 
 def get_physics_material_json(physics_mesh_json, material):
     if not physics_mesh_json:
         return None
     try:
-        name = utils.strip_name(material.name).lower()
         materials_json = physics_mesh_json["Materials"]
-        for material_name in materials_json.keys():
-            if material_name.lower() == name:
-                utils.log_detail("Physics Material Json data found for: " + material.name)
-                return materials_json[material_name]
+        material_name = find_json_key(materials_json, utils.strip_name(material.name))
+        if material_name is not None:
+            utils.log_detail("Physics Material Json data found for: " + material.name)
+            return materials_json[material_name]
     except:
         utils.log_warn("Failed to get physics material Json data!")
         return None
@@ -293,10 +448,7 @@ def get_physics_material_json_key(physics_mesh_json, physics_mat_json):
     if physics_mat_json is None:
         return None
     materials_json: dict = physics_mesh_json["Materials"]
-    for key, value in materials_json.items():
-        if value == physics_mat_json:
-            return key
-    return None
+    return find_json_value_key(materials_json, physics_mat_json)
 
 
 def get_texture_info(mat_json, texture_id):
@@ -437,11 +589,12 @@ def set_sss_var(mat_json, var_name, value):
 
 
 def convert_to_color(json_var):
+    # returns a new list, the json data may be a shared cached document
     if type(json_var) == list:
-        for i in range(0, len(json_var)):
-            json_var[i] /= 255.0
-        if len(json_var) == 3:
-            json_var.append(1)
+        color = [ v / 255.0 for v in json_var ]
+        if len(color) == 3:
+            color.append(1)
+        return color
     return json_var
 
 
@@ -522,6 +675,9 @@ def add_json_path(json_data, path):
 def rename_json_key(json_data, old_name, new_name):
     if old_name in json_data.keys():
         json_data[new_name] = json_data.pop(old_name)
+        key_index = get_json_index(json_data)
+        if key_index:
+            key_index.invalidate()
         return True
     return False
 
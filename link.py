@@ -3,10 +3,11 @@ import bpy #, bpy_extras
 import atexit
 import traceback
 from enum import IntEnum
-import os, socket, time, select, struct, json
+import os, socket, time, select, struct, json, threading, queue, zlib
 #import subprocess
+import numpy as np
 from mathutils import Vector, Quaternion, Matrix
-from . import importer, exporter, bones, geom, colorspace, rigging, rigutils, modifiers, jsonutils, utils, vars
+from . import importer, exporter, bones, geom, colorspace, rigging, rigutils, modifiers, jsonutils, properties, utils, vars
 
 
 BLENDER_PORT = 9334
@@ -16,11 +17,31 @@ HANDSHAKE_TIMEOUT_S = 60
 KEEPALIVE_TIMEOUT_S = 300
 PING_INTERVAL_S = 120
 TIMER_INTERVAL = 1/30
-MAX_CHUNK_SIZE = 32768
+MIN_RECV_BUFFER_SIZE = 32768
 SERVER_ONLY = False
 CLIENT_ONLY = True
 CHARACTER_TEMPLATE: list = None
 MAX_RECEIVE = 30
+MAX_RECEIVE_QUEUE = 120
+RECEIVER_POLL_S = 0.1
+# pose frame encodings (negotiated in HELLO)
+POSE_ENCODINGS = ["COMPACT", "ZLIB"]
+POSE_FRAME_COMPACT = 0x80000000
+POSE_FRAME_ZLIB = 0x40000000
+POSE_FRAME_COUNT_MASK = 0x0000FFFF
+POSE_ACTOR_KEY = 0x01
+QUAT_SCALE = 32767 * 1.41421356
+POSE_DELTA_EPSILON = 1e-5
+# morph delta encodings (negotiated in HELLO)
+MORPH_ENCODINGS = ["DELTA", "ZLIB"]
+MORPH_DELTA_ZLIB = 0x40000000
+MORPH_DELTA_COUNT_MASK = 0x0000FFFF
+MORPH_MESH_KEY = 0x01
+# bulk sequence export
+SEQUENCE_WINDOW = 30
+SEQUENCE_EVAL_BATCH = 10
+SEQUENCE_SAMPLE_BATCH = 100
+SEQUENCE_ACK_TIMEOUT_S = 1.0
 USE_PING = False
 USE_KEEPALIVE = False
 SOCKET_TIMEOUT = 5.0
@@ -36,6 +57,7 @@ class OpCodes(IntEnum):
     SAVE = 60
     MORPH = 90
     MORPH_UPDATE = 91
+    MORPH_DELTA = 92
     REPLACE_MESH = 95
     MATERIALS = 96
     CHARACTER = 100
@@ -104,6 +126,7 @@ class LinkActor():
     cache: dict = None
     alias: list = None
     shape_keys: dict = None
+    rig_bone_order = None
 
     def __init__(self, chr_cache):
         self.chr_cache = chr_cache
@@ -118,6 +141,7 @@ class LinkActor():
         self.cache = None
         self.alias = []
         self.shape_keys = {}
+        self.rig_bone_order = None
         return
 
     def get_chr_cache(self):
@@ -156,6 +180,7 @@ class LinkActor():
             if link_id not in self.alias and actor_link_id != link_id:
                 utils.log_info(f"Assigning actor alias: {chr_cache.character_name}: {link_id}")
                 self.alias.append(link_id)
+                vars.props().add_character_alias(link_id, chr_cache)
                 return
 
     @staticmethod
@@ -195,6 +220,15 @@ class LinkActor():
                 actor.add_alias(link_id)
                 return actor
 
+        # last of all, link id's previously resolved by name or fallback
+        # (only as a last resort, as link id's can be reused after a reload)
+        chr_cache = props.find_character_by_link_id(link_id, use_alias=True)
+        if chr_cache:
+            if not search_type or LinkActor.chr_cache_type(chr_cache) == search_type:
+                actor = LinkActor(chr_cache)
+                utils.log_detail(f"Chr found by alias: {actor.name} / {chr_cache.link_id} -> {link_id}")
+                return actor
+
         utils.log_info(f"LinkActor not found: {search_name} {link_id} {search_type}")
         return actor
 
@@ -256,6 +290,7 @@ class LinkActor():
         self.expressions = expressions
         self.visemes = self.remap_visemes(visemes)
         self.morphs = morphs
+        self.rig_bone_order = None
         rig = self.get_armature()
         skin_meshes = {}
         # rename pivot bones
@@ -300,6 +335,24 @@ class LinkActor():
 
     def clear_template(self):
         self.bones = None
+        self.rig_bone_order = None
+
+    def get_rig_bone_order(self, datalink_rig):
+        """Returns the index into the template bones for each pose bone in the datalink rig,
+           so the whole bone block can be written with foreach_set in pose bone order."""
+        pose_bones = datalink_rig.pose.bones
+        if self.rig_bone_order is not None and len(self.rig_bone_order) == len(pose_bones):
+            return self.rig_bone_order
+        bone_indices = { bone_name: i for i, bone_name in enumerate(self.rig_bones) }
+        order = []
+        pose_bone: bpy.types.PoseBone
+        for pose_bone in pose_bones:
+            if pose_bone.name not in bone_indices:
+                return None
+            pose_bone.rotation_mode = "QUATERNION"
+            order.append(bone_indices[pose_bone.name])
+        self.rig_bone_order = np.array(order, dtype=np.int32)
+        return self.rig_bone_order
 
     def set_cache(self, cache):
         self.cache = cache
@@ -412,6 +465,61 @@ class LinkData():
 
 LINK_DATA = LinkData()
 
+
+class LinkObjectIndex():
+    """link_id -> object name index of the scene objects created by the DataLink (lights, cameras).
+       Rebuilt lazily after undo / file load or when objects are added or removed."""
+    valid: bool = False
+    object_count: int = -1
+    objects: dict = None
+
+    def __init__(self):
+        self.objects = {}
+
+    def invalidate(self):
+        self.valid = False
+
+    def check_objects(self):
+        if len(bpy.data.objects) != self.object_count:
+            self.valid = False
+
+    def rebuild(self):
+        self.objects = {}
+        for obj in bpy.data.objects:
+            if "link_id" in obj and obj["link_id"] not in self.objects:
+                self.objects[obj["link_id"]] = obj.name
+        self.object_count = len(bpy.data.objects)
+        self.valid = True
+
+    def add(self, obj, link_id):
+        if self.valid:
+            self.objects[link_id] = obj.name
+            self.object_count = len(bpy.data.objects)
+
+    def find(self, link_id):
+        for rebuild in [not self.valid, True]:
+            if rebuild:
+                self.rebuild()
+            name = self.objects.get(link_id)
+            if name is None:
+                return None
+            obj = bpy.data.objects.get(name)
+            if obj and "link_id" in obj and obj["link_id"] == link_id:
+                return obj
+        return None
+
+
+LINK_OBJECTS = LinkObjectIndex()
+
+
+def invalidate_link_index(clear_alias=False):
+    LINK_OBJECTS.invalidate()
+    properties.invalidate_character_index(clear_alias)
+
+
+def update_link_index():
+    LINK_OBJECTS.check_objects()
+
 def get_link_data():
     global LINK_DATA
     return LINK_DATA
@@ -424,7 +532,7 @@ def encode_from_json(json_data) -> bytearray:
 
 
 def decode_to_json(data) -> dict:
-    text = data.decode("utf-8")
+    text = str(data, "utf-8")
     json_data = json.loads(text)
     return json_data
 
@@ -439,9 +547,285 @@ def pack_string(s) -> bytearray:
 def unpack_string(buffer, offset=0):
     length = struct.unpack_from("!I", buffer, offset)[0]
     offset += 4
-    string: bytearray = buffer[offset:offset+length]
+    string = str(buffer[offset:offset+length], "utf-8")
     offset += length
-    return offset, string.decode(encoding="utf-8")
+    return offset, string
+
+
+def unpack_transforms(buffer, offset, count):
+    """Unpacks a block of count big-endian transforms (t.xyz, r.xyzw, s.xyz)
+       in one call into a native float32 array of shape [count, 10]."""
+    if count <= 0:
+        return offset, np.zeros((0, 10), dtype=np.float32)
+    block = np.frombuffer(buffer, dtype=">f4", count=count*10, offset=offset)
+    offset += count * 40
+    return offset, block.astype(np.float32).reshape((count, 10))
+
+
+def unpack_weights(buffer, offset):
+    """Unpacks a counted block of big-endian float weights into a native float32 array."""
+    count = struct.unpack_from("!I", buffer, offset)[0]
+    offset += 4
+    if count <= 0:
+        return offset, np.zeros(0, dtype=np.float32)
+    weights = np.frombuffer(buffer, dtype=">f4", count=count, offset=offset)
+    offset += count * 4
+    return offset, weights.astype(np.float32)
+
+
+def pack_weights16(weights) -> bytes:
+    weights = np.asarray(weights, dtype=np.float32)
+    return struct.pack("!I", len(weights)) + weights.astype(">f2").tobytes()
+
+
+def unpack_weights16(buffer, offset):
+    count = struct.unpack_from("!I", buffer, offset)[0]
+    offset += 4
+    weights = np.frombuffer(buffer, dtype=">f2", count=count, offset=offset).astype(np.float32)
+    offset += count * 2
+    return offset, weights
+
+
+def quantize_quaternions(rot):
+    """Smallest three quaternion quantization of [n, 4] (x, y, z, w) quaternions:
+       returns the index of the dropped (largest) component and the other three as int16."""
+    rot = rot / np.maximum(np.linalg.norm(rot, axis=1), 1e-12)[:, None]
+    largest = np.argmax(np.abs(rot), axis=1).astype(np.uint8)
+    rows = np.arange(len(rot))
+    rot[rot[rows, largest] < 0] *= -1
+    keep = np.ones(rot.shape, dtype=bool)
+    keep[rows, largest] = False
+    small = rot[keep].reshape((-1, 3))
+    values = np.clip(np.round(small * QUAT_SCALE), -32767, 32767).astype(np.int16)
+    return largest, values
+
+
+def dequantize_quaternions(largest, values):
+    small = values.astype(np.float32) / QUAT_SCALE
+    rows = np.arange(len(small))
+    rot = np.empty((len(small), 4), dtype=np.float32)
+    keep = np.ones(rot.shape, dtype=bool)
+    keep[rows, largest] = False
+    rot[keep] = small.ravel()
+    rot[rows, largest] = np.sqrt(np.maximum(0.0, 1.0 - np.sum(small * small, axis=1)))
+    return rot
+
+
+class PoseFrameCodec():
+    """Compact pose frame bone encoding: a changed bone bitmask, delta-from-previous
+       translations, smallest three 16-bit quaternions and full scales for the changed bones.
+
+       Keeps the last reconstructed bone block per actor (link_id) on both sides,
+       so the encoder deltas against exactly what the decoder will reconstruct."""
+    previous: dict = None
+
+    def __init__(self):
+        self.previous = {}
+
+    def reset(self):
+        self.previous.clear()
+
+    def pack_bones(self, link_id, block) -> bytes:
+        block = np.asarray(block, dtype=np.float32)
+        num_bones = len(block)
+        previous = self.previous.get(link_id)
+        is_key = previous is None or len(previous) != num_bones
+        largest, values = quantize_quaternions(block[:, 3:7])
+        rot = dequantize_quaternions(largest, values)
+        if is_key:
+            changed = np.ones(num_bones, dtype=bool)
+            base = np.zeros((num_bones, 3), dtype=np.float32)
+            current = np.empty((num_bones, 10), dtype=np.float32)
+        else:
+            changed = ((np.abs(block[:, 0:3] - previous[:, 0:3]) > POSE_DELTA_EPSILON).any(axis=1) |
+                       (np.abs(rot - previous[:, 3:7]) > 0).any(axis=1) |
+                       (np.abs(block[:, 7:10] - previous[:, 7:10]) > POSE_DELTA_EPSILON).any(axis=1))
+            base = previous[:, 0:3]
+            current = previous.copy()
+        delta = (block[changed, 0:3] - base[changed]).astype(np.float32)
+        # reconstruct exactly as the decoder will
+        current[changed, 0:3] = base[changed] + delta
+        current[changed, 3:7] = rot[changed]
+        current[changed, 7:10] = block[changed, 7:10]
+        self.previous[link_id] = current
+        data = bytearray()
+        data += struct.pack("!BII", POSE_ACTOR_KEY if is_key else 0, num_bones, int(np.count_nonzero(changed)))
+        data += np.packbits(changed).tobytes()
+        data += delta.astype(">f4").tobytes()
+        data += largest[changed].tobytes()
+        data += values[changed].astype(">i2").tobytes()
+        data += block[changed, 7:10].astype(">f4").tobytes()
+        return data
+
+    def unpack_bones(self, link_id, buffer, offset):
+        flags, num_bones, num_changed = struct.unpack_from("!BII", buffer, offset)
+        offset += 9
+        mask_size = (num_bones + 7) // 8
+        mask = np.frombuffer(buffer, dtype=np.uint8, count=mask_size, offset=offset)
+        offset += mask_size
+        changed = np.unpackbits(mask, count=num_bones).astype(bool)
+        delta = np.frombuffer(buffer, dtype=">f4", count=num_changed * 3, offset=offset).astype(np.float32).reshape((-1, 3))
+        offset += num_changed * 12
+        largest = np.frombuffer(buffer, dtype=np.uint8, count=num_changed, offset=offset)
+        offset += num_changed
+        values = np.frombuffer(buffer, dtype=">i2", count=num_changed * 3, offset=offset).reshape((-1, 3))
+        offset += num_changed * 6
+        sca = np.frombuffer(buffer, dtype=">f4", count=num_changed * 3, offset=offset).astype(np.float32).reshape((-1, 3))
+        offset += num_changed * 12
+        previous = self.previous.get(link_id)
+        if flags & POSE_ACTOR_KEY or previous is None or len(previous) != num_bones:
+            current = np.zeros((num_bones, 10), dtype=np.float32)
+            current[:, 6] = 1.0
+            current[:, 7:10] = 1.0
+            base = np.zeros((num_changed, 3), dtype=np.float32)
+        else:
+            current = previous.copy()
+            base = previous[changed, 0:3]
+        current[changed, 0:3] = base + delta
+        current[changed, 3:7] = dequantize_quaternions(largest, values)
+        current[changed, 7:10] = sca
+        self.previous[link_id] = current
+        return offset, current
+
+
+class PoseFrameActor():
+    name: str = None
+    character_type: str = None
+    link_id: str = None
+    transform: tuple = None
+    bones = None
+    meshes = None
+    expressions = None
+    visemes = None
+
+    def __init__(self, name, character_type, link_id):
+        self.name = name
+        self.character_type = character_type
+        self.link_id = link_id
+
+
+class PoseFrame():
+    frame: int = 0
+    actors: list = None
+
+    def __init__(self, frame):
+        self.frame = frame
+        self.actors = []
+
+
+def decode_pose_frame(pose_data, codec: PoseFrameCodec = None) -> PoseFrame:
+    """Decodes a POSE_FRAME / SEQUENCE_FRAME payload into native arrays.
+       Does not touch any Blender data, so it can run on the receiver thread."""
+    flags, frame = struct.unpack_from("!II", pose_data, 0)
+    count = flags & POSE_FRAME_COUNT_MASK
+    is_compact = (flags & POSE_FRAME_COMPACT) != 0
+    pose_frame = PoseFrame(RLFA(frame))
+    offset = 8
+    if flags & POSE_FRAME_ZLIB:
+        pose_data = zlib.decompress(pose_data[offset:])
+        offset = 0
+    if is_compact and codec is None:
+        codec = PoseFrameCodec()
+    for i in range(0, count):
+        offset, name = unpack_string(pose_data, offset)
+        offset, character_type = unpack_string(pose_data, offset)
+        offset, link_id = unpack_string(pose_data, offset)
+        frame_actor = PoseFrameActor(name, character_type, link_id)
+        frame_actor.transform = struct.unpack_from("!ffffffffff", pose_data, offset)
+        offset += 40
+        if is_compact:
+            offset, frame_actor.bones = codec.unpack_bones(link_id, pose_data, offset)
+        else:
+            num_bones = struct.unpack_from("!I", pose_data, offset)[0]
+            offset += 4
+            offset, frame_actor.bones = unpack_transforms(pose_data, offset, num_bones)
+        num_meshes = struct.unpack_from("!I", pose_data, offset)[0]
+        offset += 4
+        offset, frame_actor.meshes = unpack_transforms(pose_data, offset, num_meshes)
+        if is_compact:
+            offset, frame_actor.expressions = unpack_weights16(pose_data, offset)
+            offset, frame_actor.visemes = unpack_weights16(pose_data, offset)
+        else:
+            offset, frame_actor.expressions = unpack_weights(pose_data, offset)
+            offset, frame_actor.visemes = unpack_weights(pose_data, offset)
+        pose_frame.actors.append(frame_actor)
+    return pose_frame
+
+
+class MorphDeltaMesh():
+    name: str = None
+    shape_key_name: str = None
+    num_verts: int = 0
+    indices = None
+    positions = None
+
+    def __init__(self, name, shape_key_name, num_verts):
+        self.name = name
+        self.shape_key_name = shape_key_name
+        self.num_verts = num_verts
+
+
+class MorphDeltaActor():
+    name: str = None
+    character_type: str = None
+    link_id: str = None
+    meshes: list = None
+
+    def __init__(self, name, character_type, link_id):
+        self.name = name
+        self.character_type = character_type
+        self.link_id = link_id
+        self.meshes = []
+
+
+def unpack_morph_mesh(buffer, offset):
+    """A mesh is either a key (all the vertex positions) or the indices and new positions of only
+       the changed vertices. Positions are absolute float32 in the mesh space of the Blender object."""
+    offset, name = unpack_string(buffer, offset)
+    offset, shape_key_name = unpack_string(buffer, offset)
+    flags, num_verts = struct.unpack_from("!BI", buffer, offset)
+    offset += 5
+    morph_mesh = MorphDeltaMesh(name, shape_key_name, num_verts)
+    if flags & MORPH_MESH_KEY:
+        num_changed = num_verts
+    else:
+        num_changed = struct.unpack_from("!I", buffer, offset)[0]
+        offset += 4
+        morph_mesh.indices = np.frombuffer(buffer, dtype=">u4", count=num_changed, offset=offset).astype(np.int64)
+        offset += num_changed * 4
+    morph_mesh.positions = np.frombuffer(buffer, dtype=">f4", count=num_changed * 3, offset=offset).astype(np.float32).reshape((-1, 3))
+    offset += num_changed * 12
+    return offset, morph_mesh
+
+
+def decode_morph_delta(data) -> list:
+    """Decodes a MORPH_DELTA payload into native arrays.
+       Does not touch any Blender data, so it can run on the receiver thread."""
+    flags = struct.unpack_from("!I", data, 0)[0]
+    count = flags & MORPH_DELTA_COUNT_MASK
+    offset = 4
+    if flags & MORPH_DELTA_ZLIB:
+        data = zlib.decompress(data[offset:])
+        offset = 0
+    actors = []
+    for i in range(0, count):
+        offset, name = unpack_string(data, offset)
+        offset, character_type = unpack_string(data, offset)
+        offset, link_id = unpack_string(data, offset)
+        morph_actor = MorphDeltaActor(name, character_type, link_id)
+        num_meshes = struct.unpack_from("!I", data, offset)[0]
+        offset += 4
+        for j in range(0, num_meshes):
+            offset, morph_mesh = unpack_morph_mesh(data, offset)
+            morph_actor.meshes.append(morph_mesh)
+        actors.append(morph_actor)
+    return actors
+
+
+def get_pose_frame(data, codec: PoseFrameCodec = None) -> PoseFrame:
+    if isinstance(data, PoseFrame):
+        return data
+    return decode_pose_frame(data, codec)
 
 
 def get_local_data_path():
@@ -518,6 +902,7 @@ def make_datalink_import_rig(actor: LinkActor):
             while len(datalink_rig.data.edit_bones) > 0:
                 datalink_rig.data.edit_bones.remove(datalink_rig.data.edit_bones[0])
             actor.rig_bones = actor.bones.copy()
+            actor.rig_bone_order = None
             for i, sk_bone_name in enumerate(actor.bones):
                 edit_bone = arm.edit_bones.new(sk_bone_name)
                 actor.rig_bones[i] = edit_bone.name
@@ -586,6 +971,28 @@ def remove_datalink_import_rig(actor: LinkActor):
         utils.object_mode_to(chr_rig)
 
 
+def set_datalink_rig_pose(actor: LinkActor, datalink_rig, bone_block):
+    """Writes a [bones, 10] transform block (t.xyz, r.xyzw, s.xyz) into the datalink rig pose bones."""
+    loc = bone_block[:, 0:3] * 0.01
+    rot = bone_block[:, [6, 3, 4, 5]]
+    sca = bone_block[:, 7:10]
+    order = actor.get_rig_bone_order(datalink_rig)
+    if order is not None and len(order) == len(bone_block):
+        pose_bones = datalink_rig.pose.bones
+        pose_bones.foreach_set("location", loc[order].ravel())
+        pose_bones.foreach_set("rotation_quaternion", rot[order].ravel())
+        pose_bones.foreach_set("scale", sca[order].ravel())
+        datalink_rig.update_tag()
+    else:
+        pose_bone: bpy.types.PoseBone
+        for i, bone_name in enumerate(actor.rig_bones[:len(bone_block)]):
+            pose_bone = datalink_rig.pose.bones[bone_name]
+            pose_bone.rotation_mode = "QUATERNION"
+            pose_bone.rotation_quaternion = Quaternion(rot[i])
+            pose_bone.location = Vector(loc[i])
+            pose_bone.scale = Vector(sca[i])
+
+
 def set_actor_expression_weight(objects, expression_name, weight):
     global LINK_DATA
     if objects and LINK_DATA.preview_shape_keys:
@@ -640,20 +1047,285 @@ def reset_action(chr_cache):
             action.fcurves.clear()
 
 
-def create_fcurves_cache(count, indices, defaults):
-    curves = []
+# bone channel layout in the keyframe cache: loc.xyz, rot.wxyz, sca.xyz
+BONE_CHANNELS = 10
+BONE_CHANNEL_DEFAULTS = [0,0,0, 1,0,0,0, 1,1,1]
+
+
+def create_keyframe_cache(count, start_frame, bone_names, expression_names, viseme_names):
+    """Preallocates one contiguous float32 block per channel type for the whole sequence:
+       bones: [frames, bones, 10], expressions: [frames, expressions], visemes: [frames, visemes]"""
+    bone_data = np.empty((count, len(bone_names), BONE_CHANNELS), dtype=np.float32)
+    bone_data[:] = BONE_CHANNEL_DEFAULTS
     cache = {
         "count": count,
-        "indices": indices,
-        "curves": curves,
+        "frames": np.arange(start_frame, start_frame + count, dtype=np.float32),
+        "bones": bone_names,
+        "bone_data": bone_data,
+        "expressions": expression_names,
+        "expression_data": np.zeros((count, len(expression_names)), dtype=np.float32),
+        "visemes": viseme_names,
+        "viseme_data": np.zeros((count, len(viseme_names)), dtype=np.float32),
     }
-    for i in range(0, indices):
-        d = defaults[i]
-        cache_data = [d]*(count*2)
-        curves.append(cache_data)
     return cache
 
 
+def get_cache_index(cache, frame):
+    index = frame - cache["start"]
+    if index < 0 or index >= cache["count"]:
+        return -1
+    return index
+
+
+def create_rest_pose_table(rig, bone_names):
+    """Precomputes the constant rest pose data needed to convert the cached bones
+       from object space into local space in one batched operation per frame."""
+    pose_bones = rig.pose.bones
+    pose_bone_indices = { pose_bone.name: i for i, pose_bone in enumerate(pose_bones) }
+    num_bones = len(bone_names)
+    rest = np.empty((num_bones, 4, 4), dtype=np.float64)
+    index = np.empty(num_bones, dtype=np.int32)
+    parent = np.full(num_bones, -1, dtype=np.int32)
+    use_local_location = np.empty(num_bones, dtype=bool)
+    use_inherit_rotation = np.empty(num_bones, dtype=bool)
+    pose_bone: bpy.types.PoseBone
+    for i, bone_name in enumerate(bone_names):
+        pose_bone = pose_bones[bone_name]
+        # bone rest pose matrix inverted @ parent rest pose matrix
+        R: Matrix = pose_bone.bone.matrix_local.inverted()
+        if pose_bone.parent:
+            R = R @ pose_bone.parent.bone.matrix_local
+            parent[i] = pose_bone_indices[pose_bone.parent.name]
+        rest[i] = R
+        index[i] = pose_bone_indices[bone_name]
+        use_local_location[i] = pose_bone.bone.use_local_location
+        use_inherit_rotation[i] = pose_bone.bone.use_inherit_rotation
+    table = {
+        "count": len(pose_bones),
+        "rest": rest,
+        "index": index,
+        "parent": parent,
+        "has_parent": parent >= 0,
+        "use_local_location": use_local_location,
+        "use_inherit_rotation": use_inherit_rotation,
+        "matrices": np.empty(len(pose_bones) * 16, dtype=np.float32),
+    }
+    return table
+
+
+def matrices_to_quaternions(M):
+    """Converts the rotation part of [n, 4, 4] matrices into [n, 4] (w, x, y, z) quaternions,
+       with the same canonical form as Matrix.to_quaternion() (scale removed, w >= 0)."""
+    R = M[:, :3, :3] / np.maximum(np.linalg.norm(M[:, :3, :3], axis=1), 1e-12)[:, None, :]
+    negative = np.linalg.det(R) < 0
+    R[negative] = -R[negative]
+    m00, m01, m02 = R[:, 0, 0], R[:, 0, 1], R[:, 0, 2]
+    m10, m11, m12 = R[:, 1, 0], R[:, 1, 1], R[:, 1, 2]
+    m20, m21, m22 = R[:, 2, 0], R[:, 2, 1], R[:, 2, 2]
+    traces = np.stack((1 + m00 + m11 + m22,
+                       1 + m00 - m11 - m22,
+                       1 - m00 + m11 - m22,
+                       1 - m00 - m11 + m22), axis=1)
+    case = np.argmax(traces, axis=1)
+    s = 2.0 * np.sqrt(np.maximum(traces[np.arange(len(R)), case], 1e-12))
+    q = np.empty((len(R), 4), dtype=np.float64)
+    c = case == 0
+    q[c] = np.stack((s[c] / 4, (m21 - m12)[c] / s[c], (m02 - m20)[c] / s[c], (m10 - m01)[c] / s[c]), axis=1)
+    c = case == 1
+    q[c] = np.stack(((m21 - m12)[c] / s[c], s[c] / 4, (m01 + m10)[c] / s[c], (m02 + m20)[c] / s[c]), axis=1)
+    c = case == 2
+    q[c] = np.stack(((m02 - m20)[c] / s[c], (m01 + m10)[c] / s[c], s[c] / 4, (m12 + m21)[c] / s[c]), axis=1)
+    c = case == 3
+    q[c] = np.stack(((m10 - m01)[c] / s[c], (m02 + m20)[c] / s[c], (m12 + m21)[c] / s[c], s[c] / 4), axis=1)
+    q /= np.linalg.norm(q, axis=1)[:, None]
+    q[q[:, 0] < 0] *= -1
+    return q
+
+
+def transforms_from_matrices(T, translation_scale=1):
+    """Converts [n, 4, 4] matrices into a [n, 10] (t.xyz, r.xyzw, s.xyz) transform block."""
+    block = np.empty((len(T), 10), dtype=np.float32)
+    block[:, 0:3] = T[:, :3, 3] * translation_scale
+    q = matrices_to_quaternions(T)
+    block[:, 3:6] = q[:, 1:4]
+    block[:, 6] = q[:, 0]
+    block[:, 7:10] = np.linalg.norm(T[:, :3, :3], axis=1)
+    return block
+
+
+def sample_fcurve(fcurve: bpy.types.FCurve, frames):
+    """Samples the fcurve at all the frames. Reads the keyframe points directly when that gives
+       the exact result (all frames on keys, or all keys linear), otherwise evaluates each frame."""
+    count = len(fcurve.keyframe_points)
+    if count == 0:
+        return None
+    if len(fcurve.modifiers) == 0 and fcurve.extrapolation == "CONSTANT":
+        co = np.empty(count * 2, dtype=np.float32)
+        fcurve.keyframe_points.foreach_get("co", co)
+        keys = co[0::2]
+        values = co[1::2]
+        inside = (frames > keys[0]) & (frames < keys[-1])
+        exact = np.isin(frames[inside], keys).all()
+        if not exact:
+            exact = all(key.interpolation == "LINEAR" for key in fcurve.keyframe_points)
+        if exact:
+            return np.interp(frames, keys, values).astype(np.float32)
+    return np.array([ fcurve.evaluate(frame) for frame in frames ], dtype=np.float32)
+
+
+def get_fcurve_bone_channel(data_path: str):
+    """Returns the (bone name, property) of a pose bone fcurve data path, or (None, None)."""
+    if data_path.startswith("pose.bones[\"") and "\"]." in data_path:
+        i = data_path.rindex("\"].")
+        bone_name = data_path[12:i].replace("\\\"", "\"")
+        return bone_name, data_path[i + 3:]
+    return None, None
+
+
+def can_sample_rig_fcurves(rig, objects):
+    """The rig pose can be calculated directly from the action fcurves if there are no constraints,
+       drivers, NLA tracks or object animation and all bones use quaternions and default inheritance.
+       The rig's world transform must also be constant: no object constraints and no animated,
+       driven or constrained parents."""
+    anim = rig.animation_data
+    action = utils.safe_get_action(rig)
+    if not anim or not action:
+        return False
+    if len(anim.drivers) > 0 or anim.use_tweak_mode:
+        return False
+    if len(rig.constraints) > 0:
+        return False
+    parent = rig.parent
+    while parent:
+        if len(parent.constraints) > 0:
+            return False
+        parent_anim = parent.animation_data
+        if parent_anim and (parent_anim.action or len(parent_anim.drivers) > 0 or
+                            any(not track.mute for track in parent_anim.nla_tracks)):
+            return False
+        parent = parent.parent
+    for track in anim.nla_tracks:
+        if not track.mute:
+            return False
+    pose_bone: bpy.types.PoseBone
+    for pose_bone in rig.pose.bones:
+        bone = pose_bone.bone
+        if (len(pose_bone.constraints) > 0 or pose_bone.rotation_mode != "QUATERNION" or
+            not bone.use_inherit_rotation or not bone.use_local_location or
+            getattr(bone, "inherit_scale", "FULL") != "FULL"):
+            return False
+    for fcurve in action.fcurves:
+        bone_name, prop = get_fcurve_bone_channel(fcurve.data_path)
+        if bone_name is None:
+            # only custom properties allowed outside of the pose bones
+            if not fcurve.data_path.startswith("["):
+                return False
+        elif prop not in ["location", "rotation_quaternion", "scale"] and not prop.startswith("["):
+            return False
+    for obj in objects:
+        if obj.data.shape_keys and obj.data.shape_keys.animation_data:
+            if len(obj.data.shape_keys.animation_data.drivers) > 0:
+                return False
+    return True
+
+
+class RigPoseSampler():
+    """Calculates the armature space pose bone matrices of a rig for a range of frames
+       directly from the rig action fcurves, without evaluating the scene.
+       Only valid for rigs that pass can_sample_rig_fcurves()."""
+    channels = None
+    relative_rest = None
+    parents = None
+    order = None
+
+    def __init__(self, rig, frames):
+        pose_bones = rig.pose.bones
+        num_bones = len(pose_bones)
+        pose_bone_indices = { pose_bone.name: i for i, pose_bone in enumerate(pose_bones) }
+        # sample the local channels (loc.xyz, rot.wxyz, sca.xyz), unanimated channels keep their current value
+        current = np.empty((num_bones, 10), dtype=np.float32)
+        values = np.empty(num_bones * 4, dtype=np.float32)
+        pose_bones.foreach_get("location", values[:num_bones * 3])
+        current[:, 0:3] = values[:num_bones * 3].reshape((-1, 3))
+        pose_bones.foreach_get("rotation_quaternion", values)
+        current[:, 3:7] = values.reshape((-1, 4))
+        pose_bones.foreach_get("scale", values[:num_bones * 3])
+        current[:, 7:10] = values[:num_bones * 3].reshape((-1, 3))
+        self.channels = np.repeat(current[None, :, :], len(frames), axis=0)
+        offsets = { "location": 0, "rotation_quaternion": 3, "scale": 7 }
+        for fcurve in utils.safe_get_action(rig).fcurves:
+            bone_name, prop = get_fcurve_bone_channel(fcurve.data_path)
+            if bone_name in pose_bone_indices and prop in offsets:
+                samples = sample_fcurve(fcurve, frames)
+                if samples is not None:
+                    self.channels[:, pose_bone_indices[bone_name], offsets[prop] + fcurve.array_index] = samples
+        # rest pose relative to the parent rest pose and the parent first evaluation order
+        rest = np.array([ np.array(pose_bone.bone.matrix_local) for pose_bone in pose_bones ]).reshape((-1, 4, 4))
+        self.parents = np.array([ pose_bone_indices[pose_bone.parent.name] if pose_bone.parent else -1
+                                  for pose_bone in pose_bones ], dtype=np.int32)
+        self.relative_rest = rest.copy()
+        has_parent = self.parents >= 0
+        self.relative_rest[has_parent] = np.linalg.inv(rest[self.parents[has_parent]]) @ rest[has_parent]
+        depth = [ len(pose_bone.parent_recursive) for pose_bone in pose_bones ]
+        self.order = np.argsort(depth, kind="stable")
+
+    def get_pose_matrices(self, first, count):
+        """Returns the [count, bones, 4, 4] armature space pose matrices for count frames from first."""
+        channels = self.channels[first:first + count].astype(np.float64)
+        num_frames, num_bones = channels.shape[0:2]
+        q = channels[:, :, 3:7]
+        q = q / np.maximum(np.linalg.norm(q, axis=2), 1e-12)[:, :, None]
+        w, x, y, z = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+        basis = np.zeros((num_frames, num_bones, 4, 4), dtype=np.float64)
+        basis[..., 0, 0] = 1 - 2 * (y * y + z * z)
+        basis[..., 0, 1] = 2 * (x * y - z * w)
+        basis[..., 0, 2] = 2 * (x * z + y * w)
+        basis[..., 1, 0] = 2 * (x * y + z * w)
+        basis[..., 1, 1] = 1 - 2 * (x * x + z * z)
+        basis[..., 1, 2] = 2 * (y * z - x * w)
+        basis[..., 2, 0] = 2 * (x * z - y * w)
+        basis[..., 2, 1] = 2 * (y * z + x * w)
+        basis[..., 2, 2] = 1 - 2 * (x * x + y * y)
+        basis[..., :3, :3] *= channels[:, :, None, 7:10]
+        basis[..., :3, 3] = channels[:, :, 0:3]
+        basis[..., 3, 3] = 1
+        # pose = parent pose @ (parent rest inverted @ rest) @ basis
+        local = self.relative_rest[None, :, :, :] @ basis
+        pose = np.empty_like(local)
+        for i in self.order:
+            p = self.parents[i]
+            if p >= 0:
+                pose[:, i] = pose[:, p] @ local[:, i]
+            else:
+                pose[:, i] = local[:, i]
+        return pose
+
+
+def sample_shape_key_weights(shape_keys: dict, frames):
+    """Samples the shape key values for all frames from the shape key actions: [frames, keys]"""
+    weights = np.empty((len(frames), len(shape_keys)), dtype=np.float32)
+    key_fcurves = {}
+    key: bpy.types.ShapeKey
+    for i, key in enumerate(shape_keys.values()):
+        key_data = key.id_data
+        if key_data not in key_fcurves:
+            action = utils.safe_get_action(key_data)
+            key_fcurves[key_data] = { fcurve.data_path: fcurve for fcurve in action.fcurves } if action else {}
+        fcurve = key_fcurves[key_data].get(key.path_from_id("value"))
+        samples = sample_fcurve(fcurve, frames) if fcurve else None
+        weights[:, i] = key.value if samples is None else samples
+    return weights
+
+
+def add_fcurve_keyframes(fcurve: bpy.types.FCurve, frames, values, co):
+    """Writes all the keyframes of a cached channel into the fcurve in one foreach_set,
+       co is a reusable [frames, 2] buffer to interleave the frame/value pairs into."""
+    co[:, 0] = frames
+    co[:, 1] = values
+    fcurve.keyframe_points.add(len(co))
+    fcurve.keyframe_points.foreach_set("co", co.ravel())
+
+
 def get_datalink_rig_action(rig, action_id=None):
     if not action_id:
         action_id = "Datalink"
@@ -758,40 +1430,17 @@ def prep_rig(actor: LinkActor, start_frame, end_frame):
 
             # create keyframe cache for animation sequences
             count = end_frame - start_frame + 1
-            bone_cache = {}
-            expression_cache = {}
-            viseme_cache = {}
-            morph_cache = {}
-            actor_cache = {
-                "rig": rig,
-                "bones": bone_cache,
-                "expressions": expression_cache,
-                "visemes": viseme_cache,
-                "morphs": morph_cache,
-                "start": start_frame,
-                "end": end_frame,
-            }
+            bone_names = []
             for pose_bone in rig.pose.bones:
-                bone_name = pose_bone.name
-                bone = rig.data.bones[bone_name]
-                if bone.select:
-                    loc_cache = create_fcurves_cache(count, 3, [0,0,0])
-                    sca_cache = create_fcurves_cache(count, 3, [1,1,1])
-                    rot_cache = create_fcurves_cache(count, 4, [1,0,0,0])
-                    bone_cache[bone_name] = {
-                        "loc": loc_cache,
-                        "sca": sca_cache,
-                        "rot": rot_cache,
-                    }
-
-            for expression_name in actor.expressions:
-                expression_cache[expression_name] = create_fcurves_cache(count, 1, [0])
-
-            for viseme_name in actor.visemes:
-                viseme_cache[viseme_name] = create_fcurves_cache(count, 1, [0])
-
-            for morph_name in actor.morphs:
-                pass
+                if pose_bone.bone.select:
+                    bone_names.append(pose_bone.name)
+            actor_cache = create_keyframe_cache(count, start_frame, bone_names,
+                                                list(actor.expressions), list(actor.visemes))
+            actor_cache["rig"] = rig
+            actor_cache["rest"] = create_rest_pose_table(rig, bone_names)
+            actor_cache["morphs"] = {}
+            actor_cache["start"] = start_frame
+            actor_cache["end"] = end_frame
 
             actor.set_cache(actor_cache)
 
@@ -820,48 +1469,39 @@ def store_bone_cache_keyframes(actor: LinkActor, frame):
         return
 
     rig = actor.get_armature()
-    start_frame = actor.cache["start"]
-    cache_index = (frame - start_frame) * 2
-    bone_cache = actor.cache["bones"]
-    for bone_name in bone_cache:
-        loc_cache = bone_cache[bone_name]["loc"]
-        sca_cache = bone_cache[bone_name]["sca"]
-        rot_cache = bone_cache[bone_name]["rot"]
-        pose_bone: bpy.types.PoseBone = rig.pose.bones[bone_name]
-        L: Matrix   # local space matrix we want
-        NL: Matrix  # non-local space matrix we want (if not using local location or inherit rotation)
-        M: Matrix = pose_bone.matrix # object space matrix of the pose bone after contraints and drivers
-        R: Matrix = pose_bone.bone.matrix_local # bone rest pose matrix
-        RI: Matrix = R.inverted() # bone rest pose matrix inverted
-        if pose_bone.parent:
-            PI: Matrix = pose_bone.parent.matrix.inverted() # parent object space matrix inverted (after contraints and drivers)
-            PR: Matrix = pose_bone.parent.bone.matrix_local # parent rest pose matrix
-            L = RI @ (PR @ (PI @ M))
-            NL = PI @ M
-        else:
-            L = RI @ M
-            NL = M
-        if not pose_bone.bone.use_local_location:
-            loc = NL.to_translation()
-        else:
-            loc = L.to_translation()
-        sca = L.to_scale()
-        if not pose_bone.bone.use_inherit_rotation:
-            rot = NL.to_quaternion()
-        else:
-            rot = L.to_quaternion()
-        for i in range(0, 3):
-            curve = loc_cache["curves"][i]
-            curve[cache_index] = frame
-            curve[cache_index + 1] = loc[i]
-        for i in range(0, 3):
-            curve = sca_cache["curves"][i]
-            curve[cache_index] = frame
-            curve[cache_index + 1] = sca[i]
-        for i in range(0, 4):
-            curve = rot_cache["curves"][i]
-            curve[cache_index] = frame
-            curve[cache_index + 1] = rot[i]
+    cache_index = get_cache_index(actor.cache, frame)
+    if cache_index < 0:
+        utils.log_error(f"Frame {frame} outside of actor cache: {actor.name}")
+        return
+    rest = actor.cache["rest"]
+    if len(rest["index"]) == 0:
+        return
+    if len(rig.pose.bones) != rest["count"]:
+        rest = create_rest_pose_table(rig, actor.cache["bones"])
+        actor.cache["rest"] = rest
+    # object space pose bone matrices of the whole rig (after constraints and drivers)
+    matrices = rest["matrices"]
+    rig.pose.bones.foreach_get("matrix", matrices)
+    P = matrices.reshape((-1, 4, 4)).transpose((0, 2, 1)).astype(np.float64)
+    M = P[rest["index"]]
+    # parent object space matrices inverted (identity for root bones)
+    has_parent = rest["has_parent"]
+    PI = np.broadcast_to(np.identity(4), M.shape).copy()
+    if has_parent.any():
+        try:
+            PI[has_parent] = np.linalg.inv(P[rest["parent"][has_parent]])
+        except np.linalg.LinAlgError:
+            PI[has_parent] = np.linalg.pinv(P[rest["parent"][has_parent]])
+    # NL: non-local space matrix (if not using local location or inherit rotation)
+    NL = PI @ M
+    # L: local space matrix: rest inverted @ parent rest @ parent pose inverted @ pose
+    L = rest["rest"] @ NL
+    loc = np.where(rest["use_local_location"][:, None], L[:, :3, 3], NL[:, :3, 3])
+    sca = np.linalg.norm(L[:, :3, :3], axis=1)
+    rot = np.where(rest["use_inherit_rotation"][:, None],
+                   matrices_to_quaternions(L), matrices_to_quaternions(NL))
+    actor.cache["bone_data"][cache_index] = np.concatenate((loc, rot, sca), axis=1)
+    actor.cache["frames"][cache_index] = frame
 
 
 def store_shape_key_cache_keyframes(actor: LinkActor, frame, expression_weights, viseme_weights, morph_weights):
@@ -869,20 +1509,20 @@ def store_shape_key_cache_keyframes(actor: LinkActor, frame, expression_weights,
         utils.log_error(f"No actor cache: {actor.name}")
         return
 
-    start_frame = actor.cache["start"]
-    cache_index = (frame - start_frame) * 2
+    cache_index = get_cache_index(actor.cache, frame)
+    if cache_index < 0:
+        utils.log_error(f"Frame {frame} outside of actor cache: {actor.name}")
+        return
+
+    expression_data = actor.cache["expression_data"]
+    num_weights = min(len(expression_weights), expression_data.shape[1])
+    expression_data[cache_index, :num_weights] = expression_weights[:num_weights]
 
-    expression_cache = actor.cache["expressions"]
-    for i, expression_name in enumerate(expression_cache):
-        curve = expression_cache[expression_name]["curves"][0]
-        curve[cache_index] = frame
-        curve[cache_index + 1] = expression_weights[i]
+    viseme_data = actor.cache["viseme_data"]
+    num_weights = min(len(viseme_weights), viseme_data.shape[1])
+    viseme_data[cache_index, :num_weights] = viseme_weights[:num_weights]
 
-    viseme_cache = actor.cache["visemes"]
-    for i, viseme_name in enumerate(viseme_cache):
-        curve = viseme_cache[viseme_name]["curves"][0]
-        curve[cache_index] = frame
-        curve[cache_index + 1] = viseme_weights[i]
+    actor.cache["frames"][cache_index] = frame
 
 
 def write_sequence_actions(actor: LinkActor, num_frames):
@@ -890,55 +1530,48 @@ def write_sequence_actions(actor: LinkActor, num_frames):
         rig = actor.cache["rig"]
         rig_action = utils.safe_get_action(rig)
         objects = actor.get_sequence_objects()
-        set_count = num_frames * 2
+        num_frames = min(num_frames, actor.cache["count"])
+        frames = actor.cache["frames"][:num_frames]
+        co = np.empty((num_frames, 2), dtype=np.float32)
 
         if rig_action:
             rig_action.fcurves.clear()
-            bone_cache = actor.cache["bones"]
-            for bone_name in bone_cache:
+            bone_data = actor.cache["bone_data"]
+            for b, bone_name in enumerate(actor.cache["bones"]):
                 pose_bone: bpy.types.PoseBone = rig.pose.bones[bone_name]
-                loc_cache = bone_cache[bone_name]["loc"]
-                sca_cache = bone_cache[bone_name]["sca"]
-                rot_cache = bone_cache[bone_name]["rot"]
+                channels = bone_data[:num_frames, b]
                 fcurve: bpy.types.FCurve
+                data_path = pose_bone.path_from_id("location")
                 for i in range(0, 3):
-                    data_path = pose_bone.path_from_id("location")
                     fcurve = rig_action.fcurves.new(data_path, index=i, action_group="Location")
-                    fcurve.keyframe_points.add(num_frames)
-                    fcurve.keyframe_points.foreach_set('co', loc_cache["curves"][i][:set_count])
+                    add_fcurve_keyframes(fcurve, frames, channels[:, i], co)
+                data_path = pose_bone.path_from_id("scale")
                 for i in range(0, 3):
-                    data_path = pose_bone.path_from_id("scale")
                     fcurve = rig_action.fcurves.new(data_path, index=i, action_group="Scale")
-                    fcurve.keyframe_points.add(num_frames)
-                    fcurve.keyframe_points.foreach_set('co', sca_cache["curves"][i][:set_count])
+                    add_fcurve_keyframes(fcurve, frames, channels[:, 7 + i], co)
+                data_path = pose_bone.path_from_id("rotation_quaternion")
                 for i in range(0, 4):
-                    data_path = pose_bone.path_from_id("rotation_quaternion")
                     fcurve = rig_action.fcurves.new(data_path, index=i, action_group="Rotation Quaternion")
-                    fcurve.keyframe_points.add(num_frames)
-                    fcurve.keyframe_points.foreach_set('co', rot_cache["curves"][i][:set_count])
+                    add_fcurve_keyframes(fcurve, frames, channels[:, 3 + i], co)
 
-        expression_cache = actor.cache["expressions"]
-        viseme_cache = actor.cache["visemes"]
+        expression_data = actor.cache["expression_data"]
+        viseme_data = actor.cache["viseme_data"]
         for obj in objects:
             obj_action = utils.safe_get_action(obj.data.shape_keys)
             if obj_action:
                 obj_action.fcurves.clear()
-                for expression_name in expression_cache:
+                for i, expression_name in enumerate(actor.cache["expressions"]):
                     if expression_name in obj.data.shape_keys.key_blocks:
-                        key_cache = expression_cache[expression_name]
                         key = obj.data.shape_keys.key_blocks[expression_name]
                         data_path = key.path_from_id("value")
                         fcurve = obj_action.fcurves.new(data_path, action_group="Expression")
-                        fcurve.keyframe_points.add(num_frames)
-                        fcurve.keyframe_points.foreach_set('co', key_cache["curves"][0][:set_count])
-                for viseme_name in viseme_cache:
+                        add_fcurve_keyframes(fcurve, frames, expression_data[:num_frames, i], co)
+                for i, viseme_name in enumerate(actor.cache["visemes"]):
                     if viseme_name in obj.data.shape_keys.key_blocks:
-                        key_cache = viseme_cache[viseme_name]
                         key = obj.data.shape_keys.key_blocks[viseme_name]
                         data_path = key.path_from_id("value")
                         fcurve = obj_action.fcurves.new(data_path, action_group="Viseme")
-                        fcurve.keyframe_points.add(num_frames)
-                        fcurve.keyframe_points.foreach_set('co', key_cache["curves"][0][:set_count])
+                        add_fcurve_keyframes(fcurve, frames, viseme_data[:num_frames, i], co)
 
         actor.clear_cache()
 
@@ -963,6 +1596,182 @@ class Signal():
             func(*args)
 
 
+class ReceiveBuffers():
+    """Pool of preallocated receive buffers, one per message size class (powers of two),
+       reused across messages so payloads can be received in place with recv_into.
+
+       Buffers are acquired by the receiver thread and released by the main thread
+       once the message has been parsed, anything that needs to keep the data must copy it."""
+    free: dict = None
+    lock: threading.Lock = None
+
+    def __init__(self):
+        self.free = {}
+        self.lock = threading.Lock()
+
+    def acquire(self, size):
+        capacity = MIN_RECV_BUFFER_SIZE
+        while capacity < size:
+            capacity *= 2
+        with self.lock:
+            buffers = self.free.get(capacity)
+            buffer = buffers.pop() if buffers else None
+        if buffer is None:
+            buffer = bytearray(capacity)
+        return buffer, memoryview(buffer)[:size]
+
+    def release(self, buffer):
+        if buffer is not None:
+            with self.lock:
+                self.free.setdefault(len(buffer), []).append(buffer)
+
+    def clear(self):
+        with self.lock:
+            self.free.clear()
+
+
+def recv_into_view(sock: socket.socket, view: memoryview):
+    """Fills the whole view from the socket, returns False if the socket was closed."""
+    size = len(view)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:], size - received)
+        if count == 0:
+            return False
+        received += count
+    return True
+
+
+class LinkReceiver(threading.Thread):
+    """Owns the receiving side of the client socket on a background thread:
+       frames the header/body of each message, decodes pose frames and pushes
+       the messages into a bounded queue to be drained by the main thread timer.
+
+       Must not touch any Blender data (including logging, which reads the prefs)."""
+    sock: socket.socket = None
+    recv_buffers: ReceiveBuffers = None
+    messages: queue.Queue = None
+    stopping: threading.Event = None
+    pose_decoder: PoseFrameCodec = None
+
+    def __init__(self, sock, recv_buffers):
+        super().__init__(name="DataLink Receiver", daemon=True)
+        self.sock = sock
+        self.recv_buffers = recv_buffers
+        self.pose_decoder = PoseFrameCodec()
+        self.messages = queue.Queue(maxsize=MAX_RECEIVE_QUEUE)
+        self.stopping = threading.Event()
+
+    def run(self):
+        header = memoryview(bytearray(8))
+        try:
+            while not self.stopping.is_set():
+                r,w,x = select.select([self.sock], [], [], RECEIVER_POLL_S)
+                if not r:
+                    continue
+                if not recv_into_view(self.sock, header):
+                    self.lost("Socket closed by client")
+                    return
+                op_code, size = struct.unpack_from("!II", header)
+                buffer = None
+                data = None
+                if size > 0:
+                    buffer, data = self.recv_buffers.acquire(size)
+                    if not recv_into_view(self.sock, data):
+                        self.lost("Socket closed by client")
+                        return
+                    if op_code == OpCodes.POSE_FRAME or op_code == OpCodes.SEQUENCE_FRAME:
+                        data = decode_pose_frame(data, self.pose_decoder)
+                        self.recv_buffers.release(buffer)
+                        buffer = None
+                    elif op_code == OpCodes.MORPH_DELTA:
+                        data = decode_morph_delta(data)
+                        self.recv_buffers.release(buffer)
+                        buffer = None
+                self.put((op_code, data, buffer))
+        except Exception as e:
+            self.lost(f"Client socket receive failed! {e}")
+
+    def put(self, message):
+        # blocking here (queue full) back-pressures the sender through the socket
+        while not self.stopping.is_set():
+            try:
+                self.messages.put(message, timeout=RECEIVER_POLL_S)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def lost(self, reason):
+        if not self.stopping.is_set():
+            self.put((None, reason, None))
+
+    def get_message(self):
+        try:
+            return self.messages.get_nowait()
+        except queue.Empty:
+            return None
+
+    def has_messages(self):
+        return not self.messages.empty()
+
+    def stop(self):
+        self.stopping.set()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(RECEIVER_POLL_S * 5)
+
+
+class SequenceBuffer():
+    """Pre-encoded pose frames of a bulk sequence export, streamed to the remote
+       through a window of unacknowledged frames."""
+    start_frame: int = 0
+    end_frame: int = 0
+    next_frame: int = 0
+    frames: list = None
+    send_index: int = 0
+    ack_index: int = 0
+    ack_time: float = 0.0
+    probe_time: float = 0.0
+    pose_rigs: list = None
+    samplers: list = None
+    weights: list = None
+
+    def __init__(self, start_frame, end_frame):
+        self.start_frame = start_frame
+        self.end_frame = end_frame
+        self.next_frame = start_frame
+        self.frames = []
+        self.send_index = 0
+        self.ack_index = 0
+        self.ack_time = time.time()
+        self.probe_time = 0.0
+        self.pose_rigs = []
+        self.samplers = None
+        self.weights = None
+
+    def is_encoded(self):
+        return self.next_frame > self.end_frame
+
+    def is_sent(self):
+        return self.is_encoded() and self.send_index >= len(self.frames)
+
+    def can_send(self):
+        if self.send_index >= len(self.frames):
+            return False
+        if self.send_index - self.ack_index < SEQUENCE_WINDOW:
+            return True
+        # don't stall the stream if the acks stop arriving, but only probe with one frame per timeout
+        now = time.time()
+        if now - max(self.ack_time, self.probe_time) > SEQUENCE_ACK_TIMEOUT_S:
+            self.probe_time = now
+            return True
+        return False
+
+    def acknowledge(self, frame):
+        self.ack_index = max(self.ack_index, frame - self.start_frame + 1)
+        self.ack_time = time.time()
+
+
 class LinkService():
     timer = None
     server_sock: socket.socket = None
@@ -1007,10 +1816,20 @@ class LinkService():
     remote_path: str = None
     remote_exe: str = None
     link_data: LinkData = None
+    recv_buffers: ReceiveBuffers = None
+    receiver: LinkReceiver = None
+    remote_pose_encodings: list = None
+    pose_encoder: PoseFrameCodec = None
+    # decodes the pose frames not already decoded on the receiver thread
+    pose_decoder: PoseFrameCodec = None
+    sequence_buffer: SequenceBuffer = None
 
     def __init__(self):
         global LINK_DATA
         self.link_data = LINK_DATA
+        self.recv_buffers = ReceiveBuffers()
+        self.pose_encoder = PoseFrameCodec()
+        self.pose_decoder = PoseFrameCodec()
         atexit.register(self.service_disconnect)
 
     def __enter__(self):
@@ -1095,6 +1914,7 @@ class LinkService():
                 self.keepalive_timer = KEEPALIVE_TIMEOUT_S
                 self.ping_timer = PING_INTERVAL_S
                 utils.log_info(f"connecting with data link server on {host}:{port}")
+                self.start_receiver()
                 self.send_hello()
                 self.connecting.emit()
                 self.changed.emit()
@@ -1118,16 +1938,19 @@ class LinkService():
         json_data = {
             "Application": self.local_app,
             "Version": self.local_version,
-            "Path": self.local_path
+            "Path": self.local_path,
+            "PoseEncodings": POSE_ENCODINGS,
+            "MorphEncodings": MORPH_ENCODINGS,
         }
         utils.log_info(f"Send Hello: {self.local_path}")
         self.send(OpCodes.HELLO, encode_from_json(json_data))
 
     def stop_client(self):
+        self.stop_receiver()
         if self.client_sock:
             utils.log_info(f"Closing Client Socket")
             try:
-                self.client_sock.shutdown()
+                self.client_sock.shutdown(socket.SHUT_RDWR)
                 self.client_sock.close()
             except:
                 pass
@@ -1140,6 +1963,10 @@ class LinkService():
             pass
         self.client_sock = None
         self.client_sockets = []
+        self.recv_buffers.clear()
+        self.remote_pose_encodings = None
+        self.pose_encoder.reset()
+        self.pose_decoder.reset()
         if self.listening:
             self.keepalive_timer = HANDSHAKE_TIMEOUT_S
         self.client_stopped.emit()
@@ -1151,52 +1978,40 @@ class LinkService():
         else:
             return False
 
+    def start_receiver(self):
+        self.stop_receiver()
+        if self.client_sock:
+            self.receiver = LinkReceiver(self.client_sock, self.recv_buffers)
+            self.receiver.start()
+
+    def stop_receiver(self):
+        if self.receiver:
+            self.receiver.stop()
+            self.receiver = None
+
     def recv(self):
         prefs = vars.prefs()
 
         self.is_data = False
         self.is_import = False
-        if self.has_client_sock():
-            try:
-                r,w,x = select.select(self.client_sockets, self.empty_sockets, self.empty_sockets, 0)
-            except Exception as e:
-                utils.log_error("Client socket recv:select failed!", e)
-                self.client_lost()
-                return
+        if self.has_client_sock() and self.receiver:
             count = 0
-            while r:
-                op_code = None
-                try:
-                    header = self.client_sock.recv(8)
-                    if header == 0:
-                        utils.log_always("Socket closed by client")
-                        self.client_lost()
-                        return
-                except Exception as e:
-                    utils.log_error("Client socket recv:recv header failed!", e)
+            message = self.receiver.get_message()
+            while message:
+                op_code, data, buffer = message
+                if op_code is None:
+                    utils.log_always(data)
                     self.client_lost()
                     return
-                if header and len(header) == 8:
-                    op_code, size = struct.unpack("!II", header)
-                    data = None
-                    if size > 0:
-                        data = bytearray()
-                        while size > 0:
-                            chunk_size = min(size, MAX_CHUNK_SIZE)
-                            try:
-                                chunk = self.client_sock.recv(chunk_size)
-                            except Exception as e:
-                                utils.log_error("Client socket recv:recv chunk failed!", e)
-                                self.client_lost()
-                                return
-                            data.extend(chunk)
-                            size -= len(chunk)
+                try:
                     self.parse(op_code, data)
                     self.received.emit(op_code, data)
-                    count += 1
+                finally:
+                    self.recv_buffers.release(buffer)
+                count += 1
                 self.is_data = False
                 # parse may have received a disconnect notice
-                if not self.has_client_sock():
+                if not self.has_client_sock() or not self.receiver:
                     return
                 # if preview sync every frame in sequence
                 if op_code == OpCodes.SEQUENCE_FRAME and prefs.datalink_frame_sync:
@@ -1207,16 +2022,11 @@ class LinkService():
                     self.is_data = False
                     self.is_import = True
                     return
-                try:
-                    r,w,x = select.select(self.client_sockets, self.empty_sockets, self.empty_sockets, 0)
-                except Exception as e:
-                    utils.log_error("Client socket recv:select (reselect) failed!", e)
-                    self.client_lost()
-                    return
-                if r:
+                if self.receiver.has_messages():
                     self.is_data = True
                     if count >= MAX_RECEIVE or op_code == OpCodes.NOTIFY:
                         return
+                message = self.receiver.get_message()
 
     def accept(self):
         link_props = vars.link_props()
@@ -1240,6 +2050,7 @@ class LinkService():
                 self.keepalive_timer = KEEPALIVE_TIMEOUT_S
                 self.ping_timer = PING_INTERVAL_S
                 utils.log_info(f"Incoming connection received from: {address[0]}:{address[1]}")
+                self.start_receiver()
                 self.send_hello()
                 self.accepted.emit(self.client_ip, self.client_port)
                 self.changed.emit()
@@ -1259,6 +2070,7 @@ class LinkService():
                 self.remote_version = json_data["Version"]
                 self.remote_path = json_data["Path"]
                 self.remote_exe = json_data["Exe"]
+                self.remote_pose_encodings = json_data.get("PoseEncodings", [])
                 self.link_data.remote_app = self.remote_app
                 self.link_data.remote_version = self.remote_version
                 self.link_data.remote_path = self.remote_path
@@ -1309,6 +2121,9 @@ class LinkService():
         elif op_code == OpCodes.MORPH_UPDATE:
             self.receive_morph(data, update=True)
 
+        elif op_code == OpCodes.MORPH_DELTA:
+            self.receive_morph_delta(data)
+
         elif op_code == OpCodes.CHARACTER:
             self.receive_character_import(data)
 
@@ -1505,6 +2320,7 @@ class LinkService():
 
     def stop_sequence(self):
         self.is_sequence = False
+        self.sequence_buffer = None
         self.sequence.disconnect()
 
     def update_sequence(self, count, delta_frames):
@@ -1620,6 +2436,7 @@ class LinkService():
                 return actor
         return None
 
+    @utils.profiled("DataLink Send Actor", operation=True)
     def send_actor(self):
         actors = self.get_selected_actors()
         state = utils.store_mode_selection_state()
@@ -1651,6 +2468,7 @@ class LinkService():
         utils.restore_mode_selection_state(state)
         return count
 
+    @utils.profiled("DataLink Send Morph", operation=True)
     def send_morph(self):
         actor: LinkActor = self.get_active_actor()
         self.send_notify(f"Blender Exporting: {actor.name}...")
@@ -1739,7 +2557,7 @@ class LinkService():
             export_path = self.get_export_path("Materials", f"{actor.name}.json",
                                                reuse_folder=True, reuse_file=True)
             export_dir, json_file = os.path.split(export_path)
-            json_data = chr_cache.get_json_data()
+            json_data = chr_cache.get_json_data(copy=True)
             if not json_data:
                 json_data = jsonutils.generate_character_json_data(actor.name)
                 exporter.set_character_generation(json_data, chr_cache, actor.name)
@@ -1851,70 +2669,95 @@ class LinkService():
             })
         return encode_from_json(data)
 
-    def encode_pose_frame_data(self, actors: list):
-        pose_bone: bpy.types.PoseBone
+    def get_pose_encoding(self):
+        """Returns the (compact, zlib) pose frame encoding agreed with the remote in HELLO."""
+        prefs = vars.prefs()
+        remote_encodings = self.remote_pose_encodings or []
+        compact = prefs.datalink_pose_compression != "NONE" and "COMPACT" in remote_encodings
+        use_zlib = compact and prefs.datalink_pose_compression == "ZLIB" and "ZLIB" in remote_encodings
+        return compact, use_zlib
+
+    def get_actor_pose_rig(self, actor: LinkActor):
+        """Returns the rig to read the pose from, the indices of the sent bones in the rig
+           (None for all bones) and the scale to apply to the bone translations."""
+        chr_cache = actor.get_chr_cache()
+        if chr_cache.rigified:
+            # the import retarget rig, with only the exportable deformation bones
+            if utils.object_exists_is_armature(chr_cache.rig_export_rig):
+                export_rig = chr_cache.rig_export_rig
+            else:
+                export_rig = rigging.adv_export_pair_rigs(chr_cache, link_target=True)[0]
+            pose_bone_indices = { pose_bone.name: i for i, pose_bone in enumerate(export_rig.pose.bones) }
+            bone_indices = np.array([ pose_bone_indices[bone_name] for bone_name in actor.bones ], dtype=np.int32)
+            return export_rig, bone_indices, 100
+        else:
+            # all the bones
+            rig: bpy.types.Object = chr_cache.get_armature()
+            return rig, None, 1
+
+    def get_actor_pose(self, actor: LinkActor, rig=None, bone_indices=None, translation_scale=1):
+        """Reads the current evaluated pose of the actor:
+           (object transform, [bones, 10] bone transform block, shape key weights)"""
+        if rig is None:
+            rig, bone_indices, translation_scale = self.get_actor_pose_rig(actor)
+        M: Matrix = rig.matrix_world
+        t = M.to_translation() * 100
+        r = M.to_quaternion()
+        s = M.to_scale()
+        transform = (t.x, t.y, t.z, r.x, r.y, r.z, r.w, s.x, s.y, s.z)
+        bone_block = np.zeros((0, 10), dtype=np.float32)
+        if utils.object_mode_to(rig):
+            pose_bones = rig.pose.bones
+            matrices = np.empty(len(pose_bones) * 16, dtype=np.float32)
+            pose_bones.foreach_get("matrix", matrices)
+            P = matrices.reshape((-1, 4, 4)).transpose((0, 2, 1)).astype(np.float64)
+            if bone_indices is not None:
+                P = P[bone_indices]
+            bone_block = transforms_from_matrices(np.array(M) @ P, translation_scale)
+        weights = [ key.value for key in actor.shape_keys.values() ]
+        return transform, bone_block, weights
+
+    def encode_actor_poses(self, frame, actors: list, poses: list):
+        """Encodes the actor poses (from get_actor_pose) as a pose frame, in the
+           pose encoding agreed with the remote. Frames must be encoded in send order."""
+        is_compact, use_zlib = self.get_pose_encoding()
+        flags = len(actors)
+        if is_compact:
+            flags |= POSE_FRAME_COMPACT
+        if use_zlib:
+            flags |= POSE_FRAME_ZLIB
+        header = struct.pack("!II", flags, BFA(frame))
         data = bytearray()
-        data += struct.pack("!II", len(actors), BFA(bpy.context.scene.frame_current))
         actor: LinkActor
-        for actor in actors:
+        for actor, (transform, bone_block, weights) in zip(actors, poses):
             data += pack_string(actor.name)
             data += pack_string(actor.get_type())
             data += pack_string(actor.get_link_id())
-            chr_cache = actor.get_chr_cache()
 
-            if chr_cache.rigified:
-                # add the import retarget rig
-                if utils.object_exists_is_armature(chr_cache.rig_export_rig):
-                    export_rig = chr_cache.rig_export_rig
-                else:
-                    export_rig = rigging.adv_export_pair_rigs(chr_cache, link_target=True)[0]
-                M: Matrix = export_rig.matrix_world
-
-                # pack object transform
-                T: Matrix = M
-                t = T.to_translation() * 100
-                r = T.to_quaternion()
-                s = T.to_scale()
-                data += struct.pack("!ffffffffff", t.x, t.y, t.z, r.x, r.y, r.z, r.w, s.x, s.y, s.z)
-
-                # pack all the bone data for the exportable deformation bones
-                data += struct.pack("!I", len(actor.bones))
-                if utils.object_mode_to(export_rig):
-                    for bone_name in actor.bones:
-                        pose_bone = export_rig.pose.bones[bone_name]
-                        T: Matrix = M @ pose_bone.matrix
-                        t = T.to_translation() * 100
-                        r = T.to_quaternion()
-                        s = T.to_scale()
-                        data += struct.pack("!ffffffffff", t.x, t.y, t.z, r.x, r.y, r.z, r.w, s.x, s.y, s.z)
-            else:
-                rig: bpy.types.Object = chr_cache.get_armature()
-                M: Matrix = rig.matrix_world
+            # pack object transform
+            data += struct.pack("!ffffffffff", *transform)
 
-                # pack object transform
-                T: Matrix = M
-                t = T.to_translation() * 100
-                r = T.to_quaternion()
-                s = T.to_scale()
-                data += struct.pack("!ffffffffff", t.x, t.y, t.z, r.x, r.y, r.z, r.w, s.x, s.y, s.z)
-
-                # pack all the bone data
-                data += struct.pack("!I", len(rig.pose.bones))
-                if utils.object_mode_to(rig):
-                    pose_bone: bpy.types.PoseBone
-                    for pose_bone in rig.pose.bones:
-                        T: Matrix = M @ pose_bone.matrix
-                        t = T.to_translation()
-                        r = T.to_quaternion()
-                        s = T.to_scale()
-                        data += struct.pack("!ffffffffff", t.x, t.y, t.z, r.x, r.y, r.z, r.w, s.x, s.y, s.z)
+            # pack all the bone data
+            if is_compact:
+                data += self.pose_encoder.pack_bones(actor.get_link_id(), bone_block)
+            else:
+                data += struct.pack("!I", len(bone_block))
+                data += bone_block.astype(">f4").tobytes()
 
             # pack shape_keys
-            data += struct.pack("!I", len(actor.shape_keys))
-            for shape_key, key in actor.shape_keys.items():
-                data += struct.pack("!f", key.value)
+            if is_compact:
+                data += pack_weights16(weights)
+            else:
+                data += struct.pack("!I", len(weights))
+                data += np.array(weights, dtype=">f4").tobytes()
 
-        return data
+        if use_zlib:
+            data = zlib.compress(data, 1)
+        return header + data
+
+    def encode_pose_frame_data(self, actors: list):
+        poses = [ self.get_actor_pose(actor) for actor in actors ]
+        return self.encode_actor_poses(bpy.context.scene.frame_current, actors, poses)
 
     def encode_sequence_data(self, actors):
         fps = bpy.context.scene.render.fps
@@ -1962,6 +2805,7 @@ class LinkService():
             self.send(OpCodes.TEMPLATE, template_data)
             # store the actors
             LINK_DATA.sequence_actors = actors
+            self.pose_encoder.reset()
             # force recalculate all transforms
             bpy.context.view_layer.update()
             # send pose data
@@ -1974,6 +2818,7 @@ class LinkService():
             count += len(actors)
         return count
 
+    @utils.profiled("DataLink Send Animation", operation=True)
     def send_animation(self):
         return
 
@@ -1986,6 +2831,7 @@ class LinkService():
         self.send_sequence_end()
 
     def send_sequence(self):
+        prefs = vars.prefs()
         global LINK_DATA
 
         # get actors
@@ -2004,8 +2850,14 @@ class LinkService():
             self.send(OpCodes.TEMPLATE, template_data)
             # store the actors
             LINK_DATA.sequence_actors = actors
+            self.pose_encoder.reset()
             # start the sending sequence
-            self.start_sequence(self.send_sequence_frame)
+            if prefs.datalink_bulk_sequence:
+                self.prep_bulk_sequence(actors)
+                self.start_sequence(self.send_bulk_sequence_frames)
+                self.sequence_send_count = 1
+            else:
+                self.start_sequence(self.send_sequence_frame)
 
     def send_sequence_frame(self):
         global LINK_DATA
@@ -2027,6 +2879,79 @@ class LinkService():
         LINK_DATA.sequence_current_frame = next_frame(current_frame)
 
 
+    def prep_bulk_sequence(self, actors):
+        """Prepares a bulk sequence export of the whole frame range. Rigs without constraints
+           or drivers are sampled directly from their fcurves, otherwise the frames are evaluated
+           through the depsgraph in batches."""
+        scene = bpy.context.scene
+        buffer = SequenceBuffer(scene.frame_start, scene.frame_end)
+        buffer.pose_rigs = [ self.get_actor_pose_rig(actor) for actor in actors ]
+        can_sample = True
+        actor: LinkActor
+        for actor, (rig, bone_indices, translation_scale) in zip(actors, buffer.pose_rigs):
+            if bone_indices is not None or not can_sample_rig_fcurves(rig, actor.get_mesh_objects()):
+                can_sample = False
+        if can_sample:
+            frames = np.arange(buffer.start_frame, buffer.end_frame + 1, dtype=np.float32)
+            buffer.samplers = [ RigPoseSampler(rig, frames) for rig, bone_indices, translation_scale in buffer.pose_rigs ]
+            buffer.weights = [ sample_shape_key_weights(actor.shape_keys, frames) for actor in actors ]
+        utils.log_info(f"Bulk sequence: {buffer.start_frame} to {buffer.end_frame}, " \
+                       f"{'sampling fcurves' if can_sample else 'evaluating frames'}")
+        self.sequence_buffer = buffer
+
+    def encode_sequence_batch(self, buffer: SequenceBuffer):
+        global LINK_DATA
+        actors = LINK_DATA.sequence_actors
+        if buffer.samplers:
+            first = buffer.next_frame - buffer.start_frame
+            count = min(SEQUENCE_SAMPLE_BATCH, buffer.end_frame - buffer.next_frame + 1)
+            actor_poses = []
+            for actor, (rig, bone_indices, translation_scale), sampler, weights in zip(actors, buffer.pose_rigs, buffer.samplers, buffer.weights):
+                M: Matrix = rig.matrix_world
+                t = M.to_translation() * 100
+                r = M.to_quaternion()
+                s = M.to_scale()
+                transform = (t.x, t.y, t.z, r.x, r.y, r.z, r.w, s.x, s.y, s.z)
+                pose = np.array(M) @ sampler.get_pose_matrices(first, count)
+                blocks = transforms_from_matrices(pose.reshape((-1, 4, 4)), translation_scale).reshape((count, -1, 10))
+                actor_poses.append([ (transform, blocks[i], weights[first + i].tolist()) for i in range(0, count) ])
+            for i in range(0, count):
+                poses = [ poses[i] for poses in actor_poses ]
+                buffer.frames.append(self.encode_actor_poses(buffer.next_frame, actors, poses))
+                buffer.next_frame += 1
+        else:
+            scene = bpy.context.scene
+            for i in range(0, SEQUENCE_EVAL_BATCH):
+                if buffer.is_encoded():
+                    break
+                scene.frame_set(buffer.next_frame)
+                poses = [ self.get_actor_pose(actor, *pose_rig) for actor, pose_rig in zip(actors, buffer.pose_rigs) ]
+                buffer.frames.append(self.encode_actor_poses(buffer.next_frame, actors, poses))
+                buffer.next_frame += 1
+
+    def send_bulk_sequence_frames(self):
+        global LINK_DATA
+        buffer = self.sequence_buffer
+        if not buffer:
+            return
+        # evaluate and encode the next batch of frames ahead of sending
+        if not buffer.is_encoded():
+            self.encode_sequence_batch(buffer)
+        # stream the encoded frames through the window of unacknowledged frames
+        while buffer.can_send():
+            self.send(OpCodes.SEQUENCE_FRAME, buffer.frames[buffer.send_index])
+            buffer.frames[buffer.send_index] = None
+            LINK_DATA.sequence_current_frame = buffer.start_frame + buffer.send_index
+            buffer.send_index += 1
+            if not self.sequence_buffer:
+                return
+        update_link_status(f"Sequence Frame: {LINK_DATA.sequence_current_frame}")
+        # check for end
+        if buffer.is_sent():
+            bpy.context.scene.frame_current = buffer.end_frame
+            self.stop_sequence()
+            self.send_sequence_end()
+
     def send_sequence_end(self):
         sequence_data = self.encode_sequence_data(LINK_DATA.sequence_actors)
         self.send(OpCodes.SEQUENCE_END, sequence_data)
@@ -2043,27 +2968,22 @@ class LinkService():
         # send sequence ack
         self.send(OpCodes.SEQUENCE_ACK, data)
 
-    def decode_pose_frame_header(self, pose_data):
-        count, frame = struct.unpack_from("!II", pose_data)
-        frame = RLFA(frame)
-        LINK_DATA.sequence_current_frame = frame
-        return frame
+    def decode_pose_frame_header(self, pose_frame: PoseFrame):
+        LINK_DATA.sequence_current_frame = pose_frame.frame
+        return pose_frame.frame
 
-    def decode_pose_frame_data(self, pose_data):
+    def decode_pose_frame_data(self, pose_frame: PoseFrame):
         global LINK_DATA
         prefs = vars.prefs()
 
-        offset = 0
-        count, frame = struct.unpack_from("!II", pose_data, offset)
-        frame = RLFA(frame)
+        frame = pose_frame.frame
         ensure_current_frame(frame)
         LINK_DATA.sequence_current_frame = frame
-        offset = 8
         actors = []
-        for i in range(0, count):
-            offset, name = unpack_string(pose_data, offset)
-            offset, character_type = unpack_string(pose_data, offset)
-            offset, link_id = unpack_string(pose_data, offset)
+        frame_actor: PoseFrameActor
+        for frame_actor in pose_frame.actors:
+            name = frame_actor.name
+            link_id = frame_actor.link_id
             actor = LINK_DATA.find_sequence_actor(link_id)
             actor_ready = False
             if actor:
@@ -2076,14 +2996,8 @@ class LinkService():
                 rig = None
                 is_prop = False
 
-            # unpack rig transform
-            tx,ty,tz,rx,ry,rz,rw,sx,sy,sz = struct.unpack_from("!ffffffffff", pose_data, offset)
-            offset += 40
+            # rig transform
             if rig:
-                loc = Vector((tx, ty, tz)) * 0.01
-                rot = Quaternion((rw, rx, ry, rz))
-                sca = Vector((sx, sy, sz))
-                #
                 rig.location = Vector((0, 0, 0))
                 rig.rotation_mode = "QUATERNION"
                 rig.rotation_quaternion = Quaternion((1, 0, 0, 0))
@@ -2102,65 +3016,30 @@ class LinkService():
             else:
                 utils.log_error(f"Could not find actor: {name}/ {link_id}")
 
-            # unpack bone transforms
-            num_bones = struct.unpack_from("!I", pose_data, offset)[0]
-            offset += 4
-
-            # unpack the binary transform data directly into the datalink rig pose bones
-            for i in range(0, num_bones):
-                tx,ty,tz,rx,ry,rz,rw,sx,sy,sz = struct.unpack_from("!ffffffffff", pose_data, offset)
-                offset += 40
-                if actor and datalink_rig:
-                    bone_name = actor.rig_bones[i]
-                    pose_bone: bpy.types.PoseBone = datalink_rig.pose.bones[bone_name]
-                    loc = Vector((tx, ty, tz)) * 0.01
-                    rot = Quaternion((rw, rx, ry, rz))
-                    sca = Vector((sx, sy, sz))
-                    pose_bone.rotation_mode = "QUATERNION"
-                    pose_bone.rotation_quaternion = rot
-                    pose_bone.location = loc
-                    pose_bone.scale = sca
-
-            # unpack mesh transforms
-            num_meshes = struct.unpack_from("!I", pose_data, offset)[0]
-            offset += 4
+            # write the transform block directly into the datalink rig pose bones
+            if actor and datalink_rig and len(frame_actor.bones) > 0:
+                set_datalink_rig_pose(actor, datalink_rig, frame_actor.bones)
 
-            # unpack the binary transform data directly into the mesh transform
-            for i in range(0, num_meshes):
-                tx,ty,tz,rx,ry,rz,rw,sx,sy,sz = struct.unpack_from("!ffffffffff", pose_data, offset)
-                offset += 40
-                if actor and datalink_rig:
+            # store the mesh transforms for the skin meshes
+            if actor and datalink_rig:
+                for i, (tx,ty,tz,rx,ry,rz,rw,sx,sy,sz) in enumerate(frame_actor.meshes.tolist()):
                     mesh_name = actor.meshes[i]
                     if mesh_name in actor.skin_meshes:
-                        obj = actor.skin_meshes[mesh_name][0]
                         actor.skin_meshes[mesh_name][1] = Vector((tx, ty, tz)) * 0.01
                         actor.skin_meshes[mesh_name][2] = Quaternion((rw, rx, ry, rz))
                         actor.skin_meshes[mesh_name][3] = Vector((sx, sy, sz))
 
-
-            # unpack the expression shape keys into the mesh objects
-            num_weights = struct.unpack_from("!I", pose_data, offset)[0]
-            offset += 4
-            expression_weights = [0] * num_weights
-            for i in range(0, num_weights):
-                weight = struct.unpack_from("!f", pose_data, offset)[0]
-                offset += 4
-                if actor and objects and prefs.datalink_preview_shape_keys:
-                    expression_name = actor.expressions[i]
+            # set the expression shape keys on the mesh objects
+            expression_weights = frame_actor.expressions
+            if actor and objects and prefs.datalink_preview_shape_keys:
+                for expression_name, weight in zip(actor.expressions, expression_weights.tolist()):
                     set_actor_expression_weight(objects, expression_name, weight)
-                expression_weights[i] = weight
 
-            # unpack the viseme shape keys into the mesh objects
-            num_weights = struct.unpack_from("!I", pose_data, offset)[0]
-            offset += 4
-            viseme_weights = [0] * num_weights
-            for i in range(0, num_weights):
-                weight = struct.unpack_from("!f", pose_data, offset)[0]
-                offset += 4
-                if actor and objects and prefs.datalink_preview_shape_keys:
-                    viseme_name = actor.visemes[i]
+            # set the viseme shape keys on the mesh objects
+            viseme_weights = frame_actor.visemes
+            if actor and objects and prefs.datalink_preview_shape_keys:
+                for viseme_name, weight in zip(actor.visemes, viseme_weights.tolist()):
                     set_actor_viseme_weight(objects, viseme_name, weight)
-                viseme_weights[i] = weight
 
             # TODO: morph weights
             morph_weights = []
@@ -2184,10 +3063,7 @@ class LinkService():
                 obj.matrix_world = utils.make_transform_matrix(loc, rot, rig.scale)
 
     def find_link_id(self, link_id: str):
-        for obj in bpy.data.objects:
-            if "link_id" in obj and obj["link_id"] == link_id:
-                return obj
-        return None
+        return LINK_OBJECTS.find(link_id)
 
     def add_spot_light(self, name, container):
         bpy.ops.object.light_add(type="SPOT")
@@ -2280,6 +3156,7 @@ class LinkService():
                 else:
                     light = self.add_spot_light(light_data["name"], container)
                 light["link_id"] = light_data["link_id"]
+                LINK_OBJECTS.add(light, light_data["link_id"])
 
             light.location = utils.array_to_vector(light_data["loc"]) / 100
             light.rotation_mode = "QUATERNION"
@@ -2524,6 +3401,7 @@ class LinkService():
                 utils.set_mode("POSE")
         return rigs
 
+    @utils.profiled("DataLink Receive Pose")
     def receive_pose(self, data):
         props = vars.props()
         global LINK_DATA
@@ -2565,9 +3443,10 @@ class LinkService():
         global LINK_DATA
 
         # decode and cache pose
-        frame = self.decode_pose_frame_header(data)
+        pose_frame = get_pose_frame(data, self.pose_decoder)
+        frame = self.decode_pose_frame_header(pose_frame)
         utils.log_info(f"Receive Pose Frame: {frame}")
-        actors = self.decode_pose_frame_data(data)
+        actors = self.decode_pose_frame_data(pose_frame)
 
         # force recalculate all transforms
         bpy.context.view_layer.update()
@@ -2600,6 +3479,7 @@ class LinkService():
         LINK_DATA.sequence_actors = None
         bpy.context.scene.frame_current = frame
 
+    @utils.profiled("DataLink Receive Sequence", operation=True)
     def receive_sequence(self, data):
         props = vars.props()
         global LINK_DATA
@@ -2644,9 +3524,10 @@ class LinkService():
         global LINK_DATA
 
         # decode and cache pose
-        frame = self.decode_pose_frame_header(data)
+        pose_frame = get_pose_frame(data, self.pose_decoder)
+        frame = self.decode_pose_frame_header(pose_frame)
         utils.log_detail(f"Receive Sequence Frame: {frame}")
-        actors = self.decode_pose_frame_data(data)
+        actors = self.decode_pose_frame_data(pose_frame)
 
         # force recalculate all transforms
         bpy.context.view_layer.update()
@@ -2713,6 +3594,10 @@ class LinkService():
         json_data = decode_to_json(data)
         ack_frame = RLFA(json_data["frame"])
         server_rate = json_data["rate"]
+        if self.sequence_buffer:
+            # bulk sequences are flow controlled by the send window
+            self.sequence_buffer.acknowledge(ack_frame)
+            return
         delta_frames = LINK_DATA.sequence_current_frame - ack_frame
         if prefs.datalink_match_client_rate:
             if LINK_DATA.ack_time == 0.0:
@@ -2739,6 +3624,7 @@ class LinkService():
         else:
             self.update_sequence(5, delta_frames)
 
+    @utils.profiled("DataLink Import Character", operation=True)
     def receive_character_import(self, data):
         props = vars.props()
         global LINK_DATA
@@ -2783,6 +3669,7 @@ class LinkService():
                     #rigutils.custom_avatar_rig(arm)
             update_link_status(f"Character Imported: {actor.name}")
 
+    @utils.profiled("DataLink Import Motion", operation=True)
     def receive_motion_import(self, data):
         props = vars.props()
         global LINK_DATA
@@ -2978,6 +3865,7 @@ class LinkService():
                 actor = LinkActor.find_actor(link_id, search_name=name, search_type=character_type)
                 update_link_status(f"Morph Imported: {actor.name}")
 
+    @utils.profiled("DataLink Import Morph", operation=True)
     def import_morph_update(self, actor: LinkActor, file_path):
         utils.log_info(f"Import Morph Update: {actor.name} / {file_path}")
 
@@ -2991,6 +3879,51 @@ class LinkService():
                 geom.copy_vert_positions_by_index(source, dest)
                 utils.delete_mesh_object(source)
 
+    def find_morph_object(self, actor: LinkActor, mesh_name):
+        chr_cache = actor.get_chr_cache()
+        if not mesh_name:
+            # the body mesh
+            return chr_cache.object_cache[0].get_object()
+        objects = actor.get_mesh_objects()
+        for obj in objects:
+            if obj.name == mesh_name:
+                return obj
+        for obj in objects:
+            if utils.strip_name(obj.name) == mesh_name:
+                return obj
+        return None
+
+    @utils.profiled("DataLink Morph Delta")
+    def receive_morph_delta(self, data):
+        # decode on the receiver thread, or here if not already decoded
+        morph_actors = data if type(data) is list else decode_morph_delta(data)
+
+        morph_actor: MorphDeltaActor
+        for morph_actor in morph_actors:
+            actor = LinkActor.find_actor(morph_actor.link_id, search_name=morph_actor.name, search_type=morph_actor.character_type)
+            if not actor or not actor.get_chr_cache():
+                utils.log_warn(f"Morph Delta: Actor not found: {morph_actor.name} / {morph_actor.link_id}")
+                continue
+            morph_mesh: MorphDeltaMesh
+            for morph_mesh in morph_actor.meshes:
+                obj = self.find_morph_object(actor, morph_mesh.name)
+                if not utils.object_exists_is_mesh(obj):
+                    utils.log_warn(f"Morph Delta: Mesh not found: {actor.name} / {morph_mesh.name}")
+                    continue
+                if len(obj.data.vertices) != morph_mesh.num_verts:
+                    utils.log_warn(f"Morph Delta: Vertex count mismatch: {obj.name} {len(obj.data.vertices)} != {morph_mesh.num_verts}")
+                    continue
+                shape_key_name = geom.add_copy_shape_key(obj, morph_mesh.shape_key_name)
+                if morph_mesh.indices is None:
+                    indices = np.arange(morph_mesh.num_verts)
+                else:
+                    indices = morph_mesh.indices
+                    if len(indices) and indices.max() >= morph_mesh.num_verts:
+                        utils.log_warn(f"Morph Delta: Vertex index out of range: {obj.name}")
+                        continue
+                geom.set_vert_positions(obj, indices, morph_mesh.positions, shape_key_name)
+            update_link_status(f"Morph Updated: {actor.name}")
+
     def receive_rigify_request(self, data):
         props = vars.props()
         props.validate_and_clean_up()
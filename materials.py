@@ -483,12 +483,14 @@ def detect_embedded_textures(chr_cache, obj, obj_cache, mat, mat_cache):
                     if os.path.exists(correct_path):
                         utils.log_warn(f"Correct image path found: {correct_path}")
                         node.image.filepath = correct_path
+                        imageutils.add_image_path(node.image)
                     else:
                         correct_path = os.path.join(mat_cache.get_tex_dir(chr_cache), name)
                         utils.log_warn(f"Attempting to correct to: {correct_path}")
                         if os.path.exists(correct_path):
                             utils.log_warn(f"Correct image path found: {correct_path}")
                             node.image.filepath = correct_path
+                            imageutils.add_image_path(node.image)
                         else:
                             utils.log_error("Unable to find correct image!")
                             continue
@@ -813,28 +815,85 @@ def has_same_parameters(cache_a, cache_b):
     return False
 
 
+def get_texture_fingerprint(mat):
+    images = set()
+    if mat.node_tree:
+        for node in mat.node_tree.nodes:
+            if node.type == "TEX_IMAGE" and node.image:
+                images.add(node.image.as_pointer())
+    return frozenset(images)
+
+
+def get_parameter_fingerprint(value):
+    if hasattr(value, "to_dict"):
+        return tuple((k, get_parameter_fingerprint(v)) for k, v in value.items())
+    if hasattr(value, "to_list"):
+        return tuple(value.to_list())
+    if type(value) is list or type(value) is tuple:
+        return tuple(get_parameter_fingerprint(v) for v in value)
+    return value
+
+
+def get_material_fingerprint(chr_cache, mat):
+    """Returns a hashable fingerprint of the material base name, type, textures and parameters.
+       Materials that are duplicates of each other always have the same fingerprint."""
+    mat_cache = chr_cache.get_material_cache(mat)
+    if mat_cache:
+        try:
+            param_hash = hash(tuple((k, get_parameter_fingerprint(v)) for k, v in mat_cache.parameters.items()))
+        except TypeError:
+            param_hash = None
+        return (utils.strip_name(mat.name), mat_cache.material_type, get_texture_fingerprint(mat), param_hash)
+    return None
+
+
+class MaterialRegistry():
+    """Materials processed during an import / build, bucketed by fingerprint, for de-duplication."""
+    buckets: dict = None
+    fingerprints: dict = None
+
+    def __init__(self):
+        self.buckets = {}
+        self.fingerprints = {}
+
+    def get_fingerprint(self, chr_cache, mat):
+        key = mat.as_pointer()
+        if key not in self.fingerprints:
+            self.fingerprints[key] = get_material_fingerprint(chr_cache, mat)
+        return self.fingerprints[key]
+
+    def find(self, chr_cache, mat):
+        fingerprint = self.get_fingerprint(chr_cache, mat)
+        if fingerprint is not None:
+            for processed_mat in self.buckets.get(fingerprint, []):
+                if processed_mat != mat:
+                    yield processed_mat
+
+    def add(self, chr_cache, mat):
+        fingerprint = self.get_fingerprint(chr_cache, mat)
+        if fingerprint is not None:
+            bucket = self.buckets.setdefault(fingerprint, [])
+            if mat not in bucket:
+                bucket.append(mat)
+
+
 def find_duplicate_material(chr_cache, mat, processed_materials):
+    processed_materials: MaterialRegistry
     source_name = utils.strip_name(mat.name)
     mat_cache = chr_cache.get_material_cache(mat)
     if mat_cache and processed_materials is not None:
-        for processed_mat in processed_materials:
-            if mat != processed_mat:
-                processed_name = utils.strip_name(processed_mat.name)
-                # only consider materials with the same base name
-                if processed_name == source_name:
-                    processed_cache = chr_cache.get_material_cache(processed_mat)
-                    if processed_cache:
-                        # with the same material type
-                        if mat_cache.material_type == processed_cache.material_type:
-                            # that use the same textures
-                            if has_same_textures(mat, processed_mat):
-                                # and have the same parameters
-                                if has_same_parameters(mat_cache, processed_cache):
-                                    # if there is a matching material that is the base name,
-                                    # then set the first material name to this base name
-                                    if mat.name == source_name:
-                                        utils.force_material_name(processed_mat, source_name)
-                                    return processed_mat
+        # only materials with the same base name, material type, textures and parameters share a fingerprint
+        for processed_mat in processed_materials.find(chr_cache, mat):
+            processed_cache = chr_cache.get_material_cache(processed_mat)
+            # full comparison only on fingerprint collision
+            if (processed_cache and
+                has_same_textures(mat, processed_mat) and
+                has_same_parameters(mat_cache, processed_cache)):
+                # if there is a matching material that is the base name,
+                # then set the first material name to this base name
+                if mat.name == source_name:
+                    utils.force_material_name(processed_mat, source_name)
+                return processed_mat
     return None
 
 
@@ -17,8 +17,9 @@
 import math
 
 import bpy
+import numpy as np
 
-from . import materials, utils, vars
+from . import geom, materials, utils, vars
 
 
 def add_vertex_group(obj, name):
@@ -174,15 +175,17 @@ def generate_eye_vertex_groups(obj, mat_left, mat_right, cache_left, cache_right
 
 
 def get_material_vertex_indices(obj, mat):
-    vert_indices = []
     mesh = obj.data
-    for poly in mesh.polygons:
-        poly_mat = obj.material_slots[poly.material_index].material
-        if poly_mat == mat:
-            for vert_index in poly.vertices:
-                if vert_index not in vert_indices:
-                    vert_indices.append(vert_index)
-    return vert_indices
+    slots = [ i for i, slot in enumerate(obj.material_slots) if slot.material == mat ]
+    if not slots:
+        return []
+    loop_indices, loop_faces, loop_materials = geom.get_face_loops(mesh)
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int64)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    # vertices in the order they are first used by the material's faces
+    verts = loop_verts[loop_indices[np.isin(loop_materials, slots)]]
+    unique, first = np.unique(verts, return_index=True)
+    return verts[np.sort(first)].tolist()
 
 
 def get_material_vertices(obj, mat):
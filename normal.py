@@ -1,88 +1,122 @@
 import bpy
-from mathutils import Vector
+import numpy as np
 from . import nodeutils, utils, vars
 from .properties import CC3CharacterCache, CC3MaterialCache
 
-def normal_to_height(normal_image: bpy.types.Image, height_image: bpy.types.Image, iterations = 10):
+def get_normal_gradients(normal_image: bpy.types.Image):
+    """Returns the surface height gradients (dh/dx, dh/dy) of the tangent space normal map as [h, w] arrays."""
+    w = int(normal_image.size[0])
+    h = int(normal_image.size[1])
+    channels = normal_image.channels
+    pixels = np.empty(w * h * channels, dtype=np.float32)
+    normal_image.pixels.foreach_get(pixels)
+    pixels = pixels.reshape((h, w, channels)).astype(np.float64)
+    nx = 2 * pixels[:, :, 0] - 1
+    ny = 2 * pixels[:, :, 1] - 1
+    nz = np.maximum(2 * pixels[:, :, 2] - 1, 0.1)
+    return -nx / nz, -ny / nz
+
+
+def integrate_fft(p, q):
+    """Frankot-Chellappa: least squares integration of the gradient field in the frequency domain."""
+    h, w = p.shape
+    u = 2 * np.pi * np.fft.fftfreq(w)[None, :]
+    v = 2 * np.pi * np.fft.fftfreq(h)[:, None]
+    P = np.fft.fft2(p)
+    Q = np.fft.fft2(q)
+    denom = u * u + v * v
+    denom[0, 0] = 1
+    Z = (-1j * u * P - 1j * v * Q) / denom
+    Z[0, 0] = 0
+    return np.real(np.fft.ifft2(Z))
+
+
+def laplacian(z):
+    """5 point laplacian with Neumann (edge replicated) boundaries."""
+    zp = np.pad(z, 1, mode="edge")
+    return zp[:-2, 1:-1] + zp[2:, 1:-1] + zp[1:-1, :-2] + zp[1:-1, 2:] - 4 * z
+
+
+def smooth(z, f, count):
+    """Damped Jacobi relaxation of laplacian(z) = f."""
+    for i in range(0, count):
+        zp = np.pad(z, 1, mode="edge")
+        neighbours = zp[:-2, 1:-1] + zp[2:, 1:-1] + zp[1:-1, :-2] + zp[1:-1, 2:]
+        z = 0.2 * z + 0.8 * (neighbours - f) / 4
+    return z
+
+
+def restrict(r):
+    h, w = r.shape
+    r = np.pad(r, ((0, h % 2), (0, w % 2)), mode="edge")
+    return 0.25 * (r[0::2, 0::2] + r[1::2, 0::2] + r[0::2, 1::2] + r[1::2, 1::2])
+
+
+def prolong(e, shape):
+    return np.repeat(np.repeat(e, 2, axis=0), 2, axis=1)[:shape[0], :shape[1]]
+
+
+def multigrid_cycle(z, f, pre = 3, post = 3):
+    """One multigrid V-cycle of laplacian(z) = f, coarse grid steps are 2x the fine grid steps."""
+    if min(z.shape) <= 4:
+        return smooth(z, f, 50)
+    z = smooth(z, f, pre)
+    r = f - laplacian(z)
+    # the coarse grid laplacian is 1/4 of the fine grid laplacian
+    rc = restrict(r) * 4
+    ec = multigrid_cycle(np.zeros_like(rc), rc, pre, post)
+    z = z + prolong(ec, z.shape)
+    return smooth(z, f, post)
+
+
+def integrate_multigrid(p, q, cycles = 10):
+    """Integrates the gradient field by solving the Poisson equation laplacian(z) = div(p, q)."""
+    # backward differences of the forward difference gradients, no flux across the borders
+    p = p.copy()
+    q = q.copy()
+    p[:, -1] = 0
+    q[-1, :] = 0
+    f = np.zeros_like(p)
+    f[:, 1:] += p[:, 1:] - p[:, :-1]
+    f[:, 0] += p[:, 0]
+    f[1:, :] += q[1:, :] - q[:-1, :]
+    f[0, :] += q[0, :]
+    f -= np.mean(f)
+    z = np.zeros_like(p)
+    for i in range(0, cycles):
+        z = multigrid_cycle(z, f)
+    return z
+
+
+def normal_to_height(normal_image: bpy.types.Image, height_image: bpy.types.Image, iterations = 10, method = "FFT"):
+    """Integrates the normal map into a height map.\n
+       method: FFT (Frankot-Chellappa, periodic) or MULTIGRID (Poisson V-cycles, iterations = cycles)"""
 
-    pixels = pixels = list(normal_image.pixels)
     w = int(normal_image.size[0])
     h = int(normal_image.size[1])
-    l = w*h
-
-    N: Vector
-    D: Vector
-    T: Vector
-
-    # convert to normal vectors
-    normals = [None]*l
-    for i in range(0, l):
-        p = i*4
-        x = 2*pixels[p]-1
-        y = 2*pixels[p+1]-1
-        z = 2*pixels[p+2]-1
-        N = Vector((x,y,z))
-        #N.normalize()
-        normals[i] = N
-
-    directional_displacements = []
-
-    print("Building directional displacements")
-    for j in range(-1, 2):
-        for k in range(-1, 2):
-            D = Vector((j, -k, 0))
-
-            if k == 0 and j == 0:
-                directional_displacements.append(None)
-
-            else:
-                displacement_map = [0]*l
-                for i in range(0, l):
-                    N = normals[i]
-                    a = N.dot(D)
-                    T = D - N*a
-                    T.normalize()
-                    d = T.z * 0.5 * D.length
-                    displacement_map[i] = d
-                directional_displacements.append(displacement_map)
-
-    heights = [0]*l
-    for itx in range(0, iterations):
-        print(f"iteration: {itx}")
-        for v in range(0, h):
-            for u in range(0, w):
-                i = u+v*w
-                height = 0
-                for j in range(-1, 2, 1):
-                    uu = min(max(u+j, 0), w-1)
-                    for k in range(-1, 2, 1):
-                        if j == 0 and k == 0: continue
-                        vv = min(max(v+k, 0), h-1)
-                        ii = uu + vv*w
-                        jk = j + 3*k + 4
-                        d = directional_displacements[jk][ii] + directional_displacements[jk][i]
-                        height += heights[ii] - d
-                height /= 8
-                heights[i] = height
-
-    min_height = 999999
-    max_height = -999999
-    abs_height = 0
-    for i in range(0, l):
-        min_height = min(min_height, heights[i])
-        max_height = max(max_height, heights[i])
-        abs_height = max(abs_height, abs(heights[i]))
-
-    print(f"min: {min_height} max: {max_height} abs: {abs_height}")
-
-    pixels = list(height_image.pixels)
-    for i in range(0, l):
-        p = i * 4
-        h = min(5*0.5*heights[i]/abs_height + 0.5,1)
-        pixels[p] = h
-        pixels[p+1] = h
-        pixels[p+2] = h
-    height_image.pixels[:] = pixels
+
+    p, q = get_normal_gradients(normal_image)
+
+    utils.log_info(f"Integrating normal map: {normal_image.name} ({w}x{h}) {method}")
+    if method == "MULTIGRID":
+        heights = integrate_multigrid(p, q, iterations)
+    else:
+        heights = integrate_fft(p, q)
+    heights -= np.mean(heights)
+
+    min_height = np.min(heights)
+    max_height = np.max(heights)
+    abs_height = max(np.max(np.abs(heights)), 1e-6)
+
+    utils.log_info(f"min: {min_height} max: {max_height} abs: {abs_height}")
+
+    if height_image.size[0] != w or height_image.size[1] != h:
+        height_image.scale(w, h)
+    channels = height_image.channels
+    pixels = np.ones((h * w, channels), dtype=np.float32)
+    values = np.minimum(5 * 0.5 * heights / abs_height + 0.5, 1).ravel()
+    pixels[:, 0:min(channels, 3)] = values[:, None]
+    height_image.pixels.foreach_set(pixels.ravel())
 
 
 def build_displacement_system(chr_cache: CC3CharacterCache, mat_cache: CC3MaterialCache):
@@ -104,9 +138,7 @@ def build_displacement_system(chr_cache: CC3CharacterCache, mat_cache: CC3Materi
     else:
         height_image = bpy.data.images.new("TEST_HEIGHT", image.size[0], image.size[1], is_data=True)
 
-    height_image.pixels[0] = 0
-
-    normal_to_height(image, height_image, 5)
+    normal_to_height(image, height_image, method="FFT")
 
     return
 
@@ -726,6 +726,8 @@ class CC3CharacterSettingsPanel(bpy.types.Panel):
             col_2 = split.column()
             col_1.label(text="De-duplicate Materials")
             col_2.prop(prefs, "import_deduplicate", text="")
+            col_1.label(text="Prefetch Textures")
+            col_2.prop(prefs, "import_prefetch_textures", text="")
             col_1.label(text="Auto Convert Generic")
             col_2.prop(prefs, "import_auto_convert", text="")
             col_1.label(text="Limit Textures")
@@ -1032,6 +1034,14 @@ class CC3ObjectManagementPanel(bpy.types.Panel):
         if arm:
             column.row().prop(arm.data, "pose_position", expand=True)
 
+        split = column.split(factor=0.5)
+        split.column().label(text = "Transfer Mode")
+        split.column().prop(prefs, "weight_transfer_mode", text = "")
+        if prefs.weight_transfer_mode == "NATIVE":
+            split = column.split(factor=0.5)
+            split.column().label(text = "Max Influences")
+            split.column().prop(prefs, "weight_transfer_max_influences", text = "")
+
         row = column.row()
         row.operator("cc3.character", icon="MOD_DATA_TRANSFER", text="Transfer Weights").param = "TRANSFER_WEIGHTS"
         if not weight_transferable:
@@ -2991,6 +3001,9 @@ class CCICDataLinkPanel(bpy.types.Panel):
             col_2.prop(prefs, "datalink_hide_prop_bones", text="")
             col_1.label(text="Disable Leg Stretch")
             col_2.prop(prefs, "datalink_disable_tweak_bones", text="")
+            col_1.label(text="Bulk Sequence Export")
+            col_2.prop(prefs, "datalink_bulk_sequence", text="")
+            box.prop(prefs, "datalink_pose_compression", text="Compression")
             box.operator("cc3.setpreferences", icon="FILE_REFRESH", text="Reset").param="RESET_DATALINK"
 
         if True:
@@ -3194,6 +3207,8 @@ class CC3ToolsPipelineImportPanel(bpy.types.Panel):
             col_2 = split.column()
             col_1.label(text="De-duplicate Materials")
             col_2.prop(PREFS, "import_deduplicate", text="")
+            col_1.label(text="Prefetch Textures")
+            col_2.prop(PREFS, "import_prefetch_textures", text="")
             col_1.label(text="Auto Convert Generic")
             col_2.prop(PREFS, "import_auto_convert", text="")
             col_1.label(text="Limit Textures")
@@ -1987,41 +1987,65 @@ def get_shader_texture_socket(shader_def, tex_type):
     return None
 
 
+# lookup indexes of the shader tables, built on first use
+SHADER_INDEX = { "lookup": None, "defs": {}, "props": {} }
+
+
+def get_shader_lookup():
+    lookup = SHADER_INDEX["lookup"]
+    if lookup is None:
+        lookup = {}
+        for shader in SHADER_LOOKUP:
+            lookup.setdefault(shader[0], shader)
+        SHADER_INDEX["lookup"] = lookup
+    return lookup
+
+
 def get_shader_name(mat_cache):
     material_type = mat_cache.get_material_type()
-    for shader in SHADER_LOOKUP:
-        if shader[0] == material_type:
-            return shader[2]
+    shader = get_shader_lookup().get(material_type)
+    if shader:
+        return shader[2]
     return "rl_pbr_shader"
 
 
 def get_rl_shader_name(mat_cache):
-    material_type = mat_cache.get_material_type()
-    for shader in SHADER_LOOKUP:
-        if shader[0] == mat_cache.material_type:
-            return shader[1]
+    shader = get_shader_lookup().get(mat_cache.material_type)
+    if shader:
+        return shader[1]
     return "Pbr"
 
 
 def get_prop_matrix(prop_name):
-    matrix = []
-    for shader in SHADER_MATRIX:
-        for input in shader["inputs"]:
-            if input[1] == prop_name:
-                matrix.append([shader, input])
-    return matrix
+    matrix = SHADER_INDEX["props"].get(prop_name)
+    if matrix is None:
+        matrix = []
+        for shader in SHADER_MATRIX:
+            for input in shader["inputs"]:
+                if input[1] == prop_name:
+                    matrix.append([shader, input])
+        SHADER_INDEX["props"][prop_name] = matrix
+    return list(matrix)
 
 
 def get_shader_def(shader_name):
+    defs = SHADER_INDEX["defs"]
+    if shader_name in defs:
+        return defs[shader_name]
+    found = None
     for shader_def in SHADER_MATRIX:
         if type(shader_def["name"]) is list:
             for name in shader_def["name"]:
                 if name in shader_name:
-                    return shader_def
+                    found = shader_def
+                    break
         else:
             if shader_def["name"] in shader_name:
-                return shader_def
-    return None
+                found = shader_def
+        if found:
+            break
+    defs[shader_name] = found
+    return found
 
 
 def get_rl_shader_def(rl_shader_name):
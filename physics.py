@@ -530,6 +530,7 @@ def get_weight_map_image(chr_cache, obj, mat, create = False):
             weight_map.pixels[0] = 0.0
             weight_map.file_format = "PNG"
             weight_map.filepath_raw = os.path.join(mat_cache.get_tex_dir(chr_cache), name + ".png")
+            imageutils.add_image_path(weight_map)
             weight_map.save()
             # keep track of which weight maps we created:
             mat_cache.temp_weight_map = weight_map
@@ -785,38 +786,6 @@ def attach_material_weight_map(obj, mat, weight_map):
         utils.log_info("Weight map: " + weight_map.name + " applied to: " + obj.name + "/" + mat.name)
 
 
-def get_physx_weight_range(obj):
-    """Get the range (min, max) of weights for physics pin group"""
-
-    props = vars.props()
-    prefs = vars.prefs()
-
-    weight_min = 1.0
-    weight_max = 0.0
-
-    if obj:
-
-        vertex_group_name = prefs.physics_group + "_Pin"
-
-        if obj.type == "MESH" and vertex_group_name in obj.vertex_groups:
-
-            if utils.set_active_object(obj):
-
-                # normalize pin vertex group range
-                pin_vg = obj.vertex_groups[vertex_group_name]
-                pin_vg_index = pin_vg.index
-
-                # determine range
-                for vertex in obj.data.vertices:
-                    for vg in vertex.groups:
-                        if vg.group == pin_vg_index:
-                            w = vg.weight
-                            weight_min = min(w, weight_min)
-                            weight_max = max(w, weight_max)
-
-    return weight_min, weight_max
-
-
 def count_weightmaps(objects):
     num_maps = 0
     num_dirty = 0
@@ -1250,6 +1219,7 @@ def detect_physics(chr_cache, obj, obj_cache, mat, mat_cache, chr_json):
                 utils.log_info(f"Deactivating cloth physics on material {mat.name}")
 
 
+@utils.profiled("Physics")
 def apply_all_physics(chr_cache):
     prefs = vars.prefs()
     props = vars.props()
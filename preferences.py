@@ -58,6 +58,8 @@ def reset_datalink():
     prefs.datalink_disable_tweak_bones = True
     prefs.datalink_hide_prop_bones = True
     prefs.datalink_send_mode = "ACTIVE"
+    prefs.datalink_pose_compression = "COMPACT"
+    prefs.datalink_bulk_sequence = True
 
 
 def reset_preferences():
@@ -70,6 +72,7 @@ def reset_preferences():
     prefs.pipeline_mode = "ADVANCED"
     prefs.morph_mode = "ADVANCED"
     prefs.log_level = "ERRORS"
+    prefs.debug_profile_reports = False
     prefs.hair_hint = "hair,scalp,beard,mustache,sideburns,ponytail,braid,!bow,!band,!tie,!ribbon,!ring,!butterfly,!flower"
     prefs.hair_scalp_hint = "scalp,base,skullcap"
     prefs.debug_mode = False
@@ -89,6 +92,7 @@ def reset_preferences():
     prefs.cycles_ssr_iris_brightness = 2.0
     prefs.import_auto_convert = True
     prefs.import_deduplicate = True
+    prefs.import_prefetch_textures = True
     prefs.build_pack_texture_channels = False
     prefs.build_pack_wrinkle_diffuse_roughness = False
     prefs.build_reuse_baked_channel_packs = True
@@ -102,6 +106,8 @@ def reset_preferences():
     prefs.build_armature_edit_modifier = True
     prefs.build_armature_preserve_volume = False
     prefs.physics_weightmap_curve = 5.0
+    prefs.weight_transfer_mode = "DATA_TRANSFER"
+    prefs.weight_transfer_max_influences = 4
     prefs.rigify_build_face_rig = True
     prefs.rigify_auto_retarget = True
     prefs.convert_non_standard_type = "PROP"
@@ -193,6 +199,8 @@ class CC3ToolsAddonPreferences(bpy.types.AddonPreferences):
                         ("ERRORS","Just Errors","Log only errors to console."),
                         ("DETAILS","Details","All including details."),
                     ], default="ERRORS", name = "(Debug) Log Level")
+    debug_profile_reports: bpy.props.BoolProperty(default=False, name="(Debug) Write Profile Reports",
+                description="Write the stage profile of each import, export, bake, rigging and DataLink operation to json and folded stack files in the add-on config folder")
 
     render_target: bpy.props.EnumProperty(items=[
                         ("EEVEE","Eevee","Build shaders for Eevee rendering."),
@@ -285,6 +293,8 @@ class CC3ToolsAddonPreferences(bpy.types.AddonPreferences):
 
     import_deduplicate: bpy.props.BoolProperty(default=True, name="De-duplicate Materials",
                 description="Detects and re-uses duplicate textures and consolidates materials with same name, textures and parameters into a single material")
+    import_prefetch_textures: bpy.props.BoolProperty(default=True, name="Prefetch Textures",
+                description="Read all the character's texture files in parallel before building the materials. Speeds up imports from slow or network drives")
     import_auto_convert: bpy.props.BoolProperty(default=True, name="Auto Convert Generic",
                 description="When importing generic characters (GLTF, GLB, VRM or OBJ) automatically convert to Reallusion Non-Standard characters or props."
                 "Which sets up Reallusion import compatible materials and material parameters")
@@ -313,6 +323,13 @@ class CC3ToolsAddonPreferences(bpy.types.AddonPreferences):
     physics_weightmap_curve: bpy.props.FloatProperty(default=5.0, min=1.0, max=10.0, name="Physics Weightmap Curve",
                                                      description="Power curve used to convert PhysX weightmaps to blender vertex pin weights.")
 
+    weight_transfer_mode: bpy.props.EnumProperty(items=[
+                        ("NATIVE","Native","Transfer the skin weights by interpolating the weights of the nearest body surface, keeping only the strongest bone influences on each vertex, normalized."),
+                        ("DATA_TRANSFER","Data Transfer","Transfer the skin weights with Blender's data transfer operator. Transfers all the body vertex groups, without limiting or normalizing the bone influences."),
+                    ], default="DATA_TRANSFER", name = "Weight Transfer")
+    weight_transfer_max_influences: bpy.props.IntProperty(default=4, min=1, max=8, name="Max Bone Influences",
+                                                          description="Maximum number of bones influencing each vertex when transferring skin weights with the native weight transfer.")
+
     # rigify prefs
     rigify_preview_shape_keys: bpy.props.BoolProperty(default=True, name="Retarget Shape Keys",
                                                         description="Retarget any facial expression and viseme shape key actions on the source character rig to the current character meshes on the rigify rig")
@@ -365,12 +382,23 @@ class CC3ToolsAddonPreferences(bpy.types.AddonPreferences):
                         description="Tweak bones cause bone length stretching which is largely incompatible with CC/iC animations. This option disables the stretch constraint to leg tweak bones so that the feet target correctly")
     datalink_hide_prop_bones: bpy.props.BoolProperty(default=True,
                         description="Hide internal prop bones")
+    datalink_bulk_sequence: bpy.props.BoolProperty(default=True,
+                        description="Evaluate the animation ahead of sending it and stream the frames through a window of unacknowledged frames, " \
+                                    "instead of evaluating and sending one frame at a time. Rigs without constraints or drivers are read directly from their fcurves")
 
     datalink_send_mode: bpy.props.EnumProperty(items=[
                     ("ALL","All","Send all materials in the selected meshes", "RESTRICT_SELECT_OFF", 0),
                     ("ACTIVE","Active","Send only the active material in each of the selected meshes", "RESTRICT_SELECT_ON", 1),
                 ], default="ACTIVE",
                    name = "Datalink Send Mode")
+    datalink_pose_compression: bpy.props.EnumProperty(items=[
+                    ("NONE","None","Send pose frames as full float transforms for every bone"),
+                    ("COMPACT","Compact","Send only the changed bones in each pose frame, with 16-bit quaternions and delta translations. " \
+                                         "Only used if the connected application supports it"),
+                    ("ZLIB","Compact + Zlib","Compact pose frames, further compressed with zlib. Best for remote connections with limited bandwidth. " \
+                                             "Only used if the connected application supports it"),
+                ], default="COMPACT",
+                   name = "Pose Frame Compression")
 
     # convert
     convert_non_standard_type: bpy.props.EnumProperty(items=[
@@ -420,6 +448,7 @@ class CC3ToolsAddonPreferences(bpy.types.AddonPreferences):
 
         layout.label(text="Import:")
         layout.prop(self, "import_deduplicate")
+        layout.prop(self, "import_prefetch_textures")
         layout.prop(self, "import_auto_convert")
         layout.prop(self, "build_limit_textures")
         layout.prop(self, "build_pack_texture_channels")
@@ -481,6 +510,10 @@ class CC3ToolsAddonPreferences(bpy.types.AddonPreferences):
         layout.prop(self, "physics_group")
         layout.prop(self, "physics_weightmap_curve")
 
+        layout.label(text="Weights:")
+        layout.prop(self, "weight_transfer_mode")
+        layout.prop(self, "weight_transfer_max_influences")
+
         layout.label(text="Export:")
         layout.prop(self, "export_json_changes")
         layout.prop(self, "export_texture_changes")
@@ -496,6 +529,7 @@ class CC3ToolsAddonPreferences(bpy.types.AddonPreferences):
 
         layout.label(text="Debug Settings:")
         layout.prop(self, "log_level")
+        layout.prop(self, "debug_profile_reports")
         op = layout.operator("cc3.setpreferences", icon="FILE_REFRESH", text="Reset to Defaults")
         op.param = "RESET_PREFS"
 
@@ -125,7 +125,7 @@ def update_material_property(self, context, prop_name, update_mode=None):
         context_mat_cache = chr_cache.get_material_cache(context_mat)
         if context_mat_cache:
             try:
-                value = eval("context_mat_cache." + prop_name, None, locals())
+                value = getattr(context_mat_cache, prop_name)
                 context_mat["rl_" + prop_name] = value
             except:
                 pass
@@ -140,7 +140,7 @@ def update_object_property(self, context, prop_name, update_mode=None):
         context_obj_cache = chr_cache.get_object_cache(context_obj)
         if context_obj_cache:
             try:
-                value = eval("context_obj_cache." + prop_name, None, locals())
+                value = getattr(context_obj_cache, prop_name)
                 context_obj["rl_" + prop_name] = value
             except:
                 pass
@@ -171,15 +171,15 @@ def get_linked_material_names(mat_name):
 
 def set_linked_property(prop_name, active_mat_cache, mat_cache):
     vars.block_property_update = True
-    code = ""
 
     try:
-        parameters = mat_cache.parameters
-        active_parameters = active_mat_cache.parameters
-        code = "parameters." + prop_name + " = active_parameters." + prop_name
-        exec(code, None, locals())
+        value = shaders.get_prop_getter(prop_name)(active_mat_cache.parameters)
+        shaders.set_prop_value(mat_cache.parameters, prop_name, value)
+        # the parameters no longer match what was last applied to the shader nodes
+        if mat_cache.material:
+            clear_applied_parameters(mat_cache.material)
     except Exception as e:
-        utils.log_error("set_linked_property(): Unable to evaluate: " + code, e)
+        utils.log_error("set_linked_property(): Unable to set: parameters." + prop_name, e)
 
     vars.block_property_update = False
 
@@ -193,105 +193,109 @@ def update_shader_property(obj, mat_cache, prop_name):
 
     if mat and mat.node_tree:
         shader_name = params.get_shader_name(mat_cache)
-        bsdf_node, shader_node, mix_node = nodeutils.get_shader_nodes(mat, shader_name)
         shader_def = params.get_shader_def(shader_name)
 
         if shader_def:
+            apply_shader_bindings(obj, mat, mat_cache, shader_name, shader_def, [prop_name])
+            update_applied_parameter(mat, mat_cache, prop_name)
 
-            if "inputs" in shader_def.keys():
-                update_shader_input(shader_node, mat_cache, prop_name, shader_def["inputs"])
+        else:
+            utils.log_error("No shader definition for: " + shader_name)
+
+
+def apply_shader_bindings(obj, mat, mat_cache, shader_name, shader_def, prop_names):
+    """Updates only the shader inputs, tiling, mapping, modifiers and settings that depend on the properties."""
+    all_bindings = shaders.get_shader_bindings(shader_def)
+    bindings = {}
+    for prop_name in prop_names:
+        if prop_name in all_bindings:
+            for group, group_bindings in all_bindings[prop_name].items():
+                # bindings that depend on more than one of the properties are only applied once
+                group_dict = bindings.setdefault(group, {})
+                for binding in group_bindings:
+                    group_dict.setdefault(id(binding), binding)
+    if bindings:
+        bindings = { group: list(group_dict.values()) for group, group_dict in bindings.items() }
+
+        if "inputs" in bindings or "bsdf" in bindings:
+            bsdf_node, shader_node, mix_node = nodeutils.get_shader_nodes(mat, shader_name)
+
+            if "inputs" in bindings:
+                update_shader_input(shader_node, mat_cache, bindings["inputs"])
 
-            if "bsdf" in shader_def.keys():
+            if "bsdf" in bindings:
                 bsdf_nodes = nodeutils.get_custom_bsdf_nodes(bsdf_node)
                 for bsdf_node in bsdf_nodes:
-                    update_bsdf_input(bsdf_node, mat_cache, prop_name, shader_def["bsdf"])
+                    update_bsdf_input(bsdf_node, mat_cache, bindings["bsdf"])
 
-            if "textures" in shader_def.keys():
-                update_shader_tiling(shader_name, mat, mat_cache, prop_name, shader_def["textures"])
+        if "textures" in bindings:
+            update_shader_tiling(shader_name, mat, mat_cache, bindings["textures"])
 
-            if "mapping" in shader_def.keys():
-                update_shader_mapping(shader_name, mat, mat_cache, prop_name, shader_def["mapping"])
+        if "mapping" in bindings:
+            update_shader_mapping(shader_name, mat, mat_cache, bindings["mapping"])
 
-            if "modifiers" in shader_def.keys():
-                update_object_modifier(obj, mat_cache, prop_name, shader_def["modifiers"])
+        if "modifiers" in bindings:
+            update_object_modifier(obj, mat_cache, bindings["modifiers"])
 
-            if "settings" in shader_def.keys():
-                update_material_setting(mat, mat_cache, prop_name, shader_def["settings"])
-
-        else:
-            utils.log_error("No shader definition for: " + shader_name)
+        if "settings" in bindings:
+            update_material_setting(mat, mat_cache, bindings["settings"])
 
 
-def update_shader_input(shader_node, mat_cache, prop_name, input_defs):
+def update_shader_input(shader_node, mat_cache, input_defs):
     if shader_node:
         for input_def in input_defs:
-            if prop_name in input_def[2:]:
-                nodeutils.set_node_input_value(shader_node, input_def[0], shaders.eval_input_param(input_def, mat_cache))
+            nodeutils.set_node_input_value(shader_node, input_def[0], shaders.eval_input_param(input_def, mat_cache))
 
 
-def update_bsdf_input(bsdf_node, mat_cache, prop_name, bsdf_defs):
+def update_bsdf_input(bsdf_node, mat_cache, bsdf_defs):
     if bsdf_node:
         for input_def in bsdf_defs:
-            if prop_name in input_def[2:]:
-                nodeutils.set_node_input_value(bsdf_node,
-                                               input_def[0],
-                                               shaders.eval_input_param(input_def, mat_cache))
+            nodeutils.set_node_input_value(bsdf_node,
+                                           input_def[0],
+                                           shaders.eval_input_param(input_def, mat_cache))
 
 
-def update_shader_tiling(shader_name, mat, mat_cache, prop_name, texture_defs):
+def update_shader_tiling(shader_name, mat, mat_cache, texture_defs):
     for texture_def in texture_defs:
-        if len(texture_def) > 5:
-            tiling_props = texture_def[5:]
-            texture_type = texture_def[2]
-            if prop_name in tiling_props:
-                tiling_node = nodeutils.get_tiling_node(mat, shader_name, texture_type)
-                nodeutils.set_node_input_value(tiling_node, "Tiling", shaders.eval_tiling_param(texture_def, mat_cache))
-
-
-def update_shader_mapping(shader_name, mat, mat_cache, prop_name, mapping_defs):
-    mapping_node = None
-    for mapping_def in mapping_defs:
-        if len(mapping_def) == 1:
-            texture_type = mapping_def[0]
-            mapping_node = nodeutils.get_tiling_node(mat, shader_name, texture_type)
-        elif mapping_node:
-            tiling_props = mapping_def[3:]
-            if prop_name in tiling_props:
-                socket_name = mapping_def[1]
-                nodeutils.set_node_input_value(mapping_node, socket_name, shaders.eval_tiling_param(mapping_def, mat_cache, 2))
-
-
-def update_object_modifier(obj, mat_cache, prop_name, mod_defs):
-    for mod_def in mod_defs:
-        if mod_def[0] == prop_name:
-            material_type = mod_def[1]
-            mod_type = mod_def[2]
-            mod_name = mod_def[3]
-            code = mod_def[4]
-
-            if mat_cache.material_type == material_type:
-                mod = modifiers.get_object_modifier(obj, mod_type, mod_name)
-                if mod:
-                    try:
-                        parameters = mat_cache.parameters
-                        exec(code, None, locals())
-                    except:
-                        utils.log_error("update_object_modifier(): unable to execute: " + code)
+        texture_type = texture_def[2]
+        tiling_node = nodeutils.get_tiling_node(mat, shader_name, texture_type)
+        nodeutils.set_node_input_value(tiling_node, "Tiling", shaders.eval_tiling_param(texture_def, mat_cache))
 
 
-def update_material_setting(mat, mat_cache, prop_name, setting_defs):
-    # mat is used in the exec code expression so keep it!
-    for setting_def in setting_defs:
-        if setting_def[0] == prop_name:
-            material_type = setting_def[1]
-            code = setting_def[2]
+def update_shader_mapping(shader_name, mat, mat_cache, mapping_bindings):
+    for texture_type, mapping_def in mapping_bindings:
+        mapping_node = nodeutils.get_tiling_node(mat, shader_name, texture_type)
+        if mapping_node:
+            socket_name = mapping_def[1]
+            nodeutils.set_node_input_value(mapping_node, socket_name, shaders.eval_tiling_param(mapping_def, mat_cache, 2))
+
 
-            if mat_cache.material_type == material_type:
+def update_object_modifier(obj, mat_cache, mod_defs):
+    for mod_def in mod_defs:
+        material_type = mod_def[1]
+        mod_type = mod_def[2]
+        mod_name = mod_def[3]
+        code = mod_def[4]
+
+        if mat_cache.material_type == material_type:
+            mod = modifiers.get_object_modifier(obj, mod_type, mod_name)
+            if mod:
                 try:
-                    parameters = mat_cache.parameters
-                    exec(code, None, locals())
+                    shaders.exec_code(code, mod=mod, parameters=mat_cache.parameters)
                 except:
-                    utils.log_error("update_material_setting(): unable to execute: " + code)
+                    utils.log_error("update_object_modifier(): unable to execute: " + code)
+
+
+def update_material_setting(mat, mat_cache, setting_defs):
+    for setting_def in setting_defs:
+        material_type = setting_def[1]
+        code = setting_def[2]
+
+        if mat_cache.material_type == material_type:
+            try:
+                shaders.exec_code(code, mat=mat, parameters=mat_cache.parameters)
+            except:
+                utils.log_error("update_material_setting(): unable to execute: " + code)
 
 
 def get_linked_materials(chr_cache, context_mat, update_mode):
@@ -331,72 +335,116 @@ def reset_parameters(context = bpy.context, all=False):
         vars.block_property_update = True
         if all:
             shaders.init_character_property_defaults(chr_cache, chr_json)
+            mats = [mat_cache.material for mat_cache in chr_cache.get_all_materials_cache()]
         else:
             context_mat = utils.get_context_material(context)
             linked_mats = get_linked_materials(chr_cache, context_mat, props.update_mode)
-            if linked_mats:
-                mats = [mat_cache.material for mat_cache in linked_mats]
+            mats = [mat_cache.material for mat_cache in linked_mats]
+            if mats:
                 shaders.init_character_property_defaults(chr_cache, chr_json, only=mats)
+        # reset writes every parameter of the reset materials, including any edited in the node trees
+        for mat in mats:
+            if mat:
+                clear_applied_parameters(mat)
         basic.init_basic_default(chr_cache)
         vars.block_property_update = False
         update_all_properties(context)
 
 
+# the last applied parameter values of each material: { material pointer: (stamp, { prop_name: value }) }
+APPLIED_PARAMETERS = {}
+EYE_VERTEX_GROUP_PROPS = ["eye_iris_depth_radius", "eye_iris_scale", "eye_iris_radius"]
+
+
+def get_applied_parameter_value(mat_cache, prop_name):
+    value = shaders.get_prop_value(mat_cache, prop_name)
+    if value is not None and not isinstance(value, str) and hasattr(value, "__len__"):
+        value = tuple(value)
+    return value
+
+
+def update_applied_parameter(mat, mat_cache, prop_name):
+    """Records the value of the parameter just written to the shader nodes of the material."""
+    applied = APPLIED_PARAMETERS.get(mat.as_pointer())
+    if applied and prop_name in applied[1]:
+        applied[1][prop_name] = get_applied_parameter_value(mat_cache, prop_name)
+
+
+def clear_applied_parameters(mat):
+    """Forces all the parameters of the material to be re-applied on the next update."""
+    APPLIED_PARAMETERS.pop(mat.as_pointer(), None)
+
+
+def get_dirty_parameters(chr_cache, mat, mat_cache, shader_name, shader_def):
+    """Returns the parameters of the material that have changed since they were last applied
+       to the shader nodes, or all of them if the material or its nodes have since been rebuilt."""
+    key = mat.as_pointer()
+    stamp = (chr_cache.build_count, mat_cache.material_id, mat.node_tree.as_pointer(), len(mat.node_tree.nodes),
+             shader_name, shaders.get_parameter_prefs_stamp())
+    values = { prop_name: get_applied_parameter_value(mat_cache, prop_name)
+               for prop_name in shaders.get_shader_bindings(shader_def) }
+    applied = APPLIED_PARAMETERS.get(key)
+    if applied and applied[0] == stamp:
+        applied_values = applied[1]
+        dirty = [ prop_name for prop_name, value in values.items()
+                  if prop_name not in applied_values or applied_values[prop_name] != value ]
+    else:
+        dirty = list(values)
+    APPLIED_PARAMETERS[key] = (stamp, values)
+    return dirty
+
+
 def update_all_properties(context, update_mode = None):
     if vars.block_property_update: return
 
-    utils.start_timer()
+    start_time = utils.start_timer()
 
     props = vars.props()
     chr_cache: CC3CharacterCache = props.get_context_character_cache(context)
 
     if chr_cache:
 
-        processed = []
+        processed_objects = set()
+        processed_materials = set()
+        rebuild_eyes = False
+        num_updated = 0
 
         for obj_cache in chr_cache.object_cache:
             obj = obj_cache.get_object()
-            if not obj_cache.disabled and obj_cache.is_mesh() and obj not in processed:
+            if not obj_cache.disabled and obj_cache.is_mesh() and obj not in processed_objects:
 
-                processed.append(obj)
+                processed_objects.add(obj)
 
                 for mat in obj.data.materials:
-                    if mat and mat not in processed:
-                        processed.append(mat)
+                    if mat and mat not in processed_materials:
+                        processed_materials.add(mat)
                         mat_cache = chr_cache.get_material_cache(mat)
 
                         if chr_cache.setup_mode == "BASIC":
 
                             basic.update_basic_material(mat, mat_cache, "ALL")
 
-                        else:
+                        elif mat_cache and mat.node_tree:
 
                             shader_name = params.get_shader_name(mat_cache)
-                            bsdf_node, shader_node, mix_node = nodeutils.get_shader_nodes(mat, shader_name)
                             shader_def = params.get_shader_def(shader_name)
 
-                            shaders.apply_prop_matrix(bsdf_node, shader_node, mat_cache, shader_name)
-
-                            if "textures" in shader_def.keys():
-                                for tex_def in shader_def["textures"]:
-                                    tiling_props = tex_def[5:]
-                                    for prop_name in tiling_props:
-                                        update_shader_property(obj, mat_cache, prop_name)
+                            if shader_def:
+                                # only re-apply the parameters that have changed
+                                dirty = get_dirty_parameters(chr_cache, mat, mat_cache, shader_name, shader_def)
+                                if dirty:
+                                    num_updated += 1
+                                    apply_shader_bindings(obj, mat, mat_cache, shader_name, shader_def, dirty)
+                                    if obj_cache.is_eye() and any(p in dirty for p in EYE_VERTEX_GROUP_PROPS):
+                                        rebuild_eyes = True
 
-                            if "modifiers" in shader_def.keys():
-                                for mod_def in shader_def["modifiers"]:
-                                    prop_name = mod_def[0]
-                                    update_shader_property(obj, mat_cache, prop_name)
-
-                            if "settings" in shader_def.keys():
-                                for mat_def in shader_def["settings"]:
-                                    prop_name = mat_def[0]
-                                    update_shader_property(obj, mat_cache, prop_name)
+        # these properties will cause the eye displacement vertex group to change...
+        if rebuild_eyes:
+            meshutils.rebuild_eye_vertex_groups(chr_cache)
 
-                if obj_cache.is_eye():
-                    meshutils.rebuild_eye_vertex_groups(chr_cache)
+        utils.log_info(f"Updated {num_updated} of {len(processed_materials)} materials.")
 
-    utils.log_timer("update_all_properties()", "ms")
+    utils.log_timer("update_all_properties()", "ms", start=start_time)
 
 
 def init_material_property_defaults(obj, mat, obj_cache, mat_cache, obj_json, mat_json):
@@ -502,6 +550,46 @@ def update_link_host_ip(self, context):
             link_props.link_host = ""
 
 
+# character import cache index: link_id / alias / name -> import_cache index, rebuilt lazily
+CHARACTER_INDEX = { "valid": False, "count": -1, "link_id": {}, "name": {}, "alias": {} }
+
+
+MATERIAL_CACHE_COLLECTIONS = [ "eye_material_cache", "hair_material_cache", "head_material_cache",
+                               "skin_material_cache", "tongue_material_cache", "teeth_material_cache",
+                               "tearline_material_cache", "eye_occlusion_material_cache",
+                               "pbr_material_cache", "sss_material_cache" ]
+
+# runtime material / object cache index, rebuilt lazily:
+#   material / object pointer or id -> [ (character index, collection name, item index), ... ]
+CACHE_INDEX = { "valid": False, "props": 0, "characters": {},
+                "materials": {}, "material_ids": {}, "objects": {}, "object_ids": {} }
+
+
+def invalidate_cache_index():
+    CACHE_INDEX["valid"] = False
+
+
+def cache_index_update(self, context):
+    invalidate_cache_index()
+
+
+def invalidate_character_index(clear_alias=False):
+    CHARACTER_INDEX["valid"] = False
+    CACHE_INDEX["valid"] = False
+    if clear_alias:
+        CHARACTER_INDEX["alias"].clear()
+
+
+def character_index_update(self, context):
+    invalidate_character_index()
+
+
+def remove_cache_item(collection_prop, item):
+    """Removes the item from the collection. This shifts the items after it, so the cache index is invalidated."""
+    utils.remove_from_collection(collection_prop, item)
+    invalidate_cache_index()
+
+
 def clean_collection_property(collection_prop):
     """Remove any item.disabled items from collection property."""
     repeat = True
@@ -512,7 +600,7 @@ def clean_collection_property(collection_prop):
             if callable(valid_func):
                 if not item.is_valid():
                     repeat = True
-                    utils.remove_from_collection(collection_prop, item)
+                    remove_cache_item(collection_prop, item)
                     break
 
 
@@ -1035,8 +1123,8 @@ class CC3TextureMapping(bpy.types.PropertyGroup):
 
 
 class CC3MaterialCache:
-    material_id: bpy.props.StringProperty(default="")
-    material: bpy.props.PointerProperty(type=bpy.types.Material)
+    material_id: bpy.props.StringProperty(default="", update=cache_index_update)
+    material: bpy.props.PointerProperty(type=bpy.types.Material, update=cache_index_update)
     source_name: bpy.props.StringProperty(default="")
     material_type: bpy.props.EnumProperty(items=vars.ENUM_MATERIAL_TYPES, default="DEFAULT", update=lambda s,c: update_material_property(s,c,"material_type"))
     texture_mappings: bpy.props.CollectionProperty(type=CC3TextureMapping)
@@ -1049,7 +1137,7 @@ class CC3MaterialCache:
     alpha_mode: bpy.props.StringProperty(default="NONE") # NONE, BLEND, HASHED, OPAQUE
     culling_sides: bpy.props.IntProperty(default=0) # 0 - default, 1 - single sided, 2 - double sided
     cloth_physics: bpy.props.StringProperty(default="DEFAULT") # DEFAULT, OFF, ON
-    disabled: bpy.props.BoolProperty(default=False)
+    disabled: bpy.props.BoolProperty(default=False, update=cache_index_update)
 
     def set_texture_mapping(self, texture_type, texture_path, embedded, image, location, rotation, scale):
         mapping = self.get_texture_mapping(texture_type)
@@ -1217,8 +1305,8 @@ class CC3SSSMaterialCache(bpy.types.PropertyGroup, CC3MaterialCache):
 
 
 class CC3ObjectCache(bpy.types.PropertyGroup):
-    object_id: bpy.props.StringProperty(default="")
-    object: bpy.props.PointerProperty(type=bpy.types.Object)
+    object_id: bpy.props.StringProperty(default="", update=cache_index_update)
+    object: bpy.props.PointerProperty(type=bpy.types.Object, update=cache_index_update)
     source_name: bpy.props.StringProperty(default="")
     object_type: bpy.props.EnumProperty(items=vars.ENUM_OBJECT_TYPES, default="DEFAULT", update=lambda s,c: update_object_property(s,c,"object_type"))
     collision_physics: bpy.props.StringProperty(default="DEFAULT") # DEFAULT, OFF, ON, PROXY
@@ -1232,7 +1320,7 @@ class CC3ObjectCache(bpy.types.PropertyGroup):
     vertex_count: bpy.props.IntProperty(default=0)
     face_count: bpy.props.IntProperty(default=0)
     edge_count: bpy.props.IntProperty(default=0)
-    disabled: bpy.props.BoolProperty(default=False)
+    disabled: bpy.props.BoolProperty(default=False, update=cache_index_update)
 
     def is_body(self):
         return self.object_type == "BODY"
@@ -1359,8 +1447,8 @@ class CC3CharacterCache(bpy.types.PropertyGroup):
     import_flags: bpy.props.IntProperty(default=0)
     import_embedded: bpy.props.BoolProperty(default=False)
     # which character in the import
-    link_id: bpy.props.StringProperty(default="")
-    character_name: bpy.props.StringProperty(default="")
+    link_id: bpy.props.StringProperty(default="", update=character_index_update)
+    character_name: bpy.props.StringProperty(default="", update=character_index_update)
     generation: bpy.props.StringProperty(default="None")
     parent_object: bpy.props.PointerProperty(type=bpy.types.Object)
     # accessory parent bone selector
@@ -1468,7 +1556,7 @@ class CC3CharacterCache(bpy.types.PropertyGroup):
                         ("NONE_LEGACY","None (Legacy)","None (Legacy)"),
                     ], default="FULL", name="Set bone inherit scale")
 
-    disabled: bpy.props.BoolProperty(default=False)
+    disabled: bpy.props.BoolProperty(default=False, update=character_index_update)
 
     def select(self):
         arm = self.get_armature()
@@ -1747,48 +1835,65 @@ class CC3CharacterCache(bpy.types.PropertyGroup):
         if mat:
             for mat_cache in self.tongue_material_cache:
                 if mat_cache.material == mat:
-                    utils.remove_from_collection(self.tongue_material_cache, mat_cache)
+                    remove_cache_item(self.tongue_material_cache, mat_cache)
                     return
             for mat_cache in self.teeth_material_cache:
                 if mat_cache.material == mat:
-                    utils.remove_from_collection(self.teeth_material_cache, mat_cache)
+                    remove_cache_item(self.teeth_material_cache, mat_cache)
                     return
             for mat_cache in self.head_material_cache:
                 if mat_cache.material == mat:
-                    utils.remove_from_collection(self.head_material_cache, mat_cache)
+                    remove_cache_item(self.head_material_cache, mat_cache)
                     return
             for mat_cache in self.skin_material_cache:
                 if mat_cache.material == mat:
-                    utils.remove_from_collection(self.skin_material_cache, mat_cache)
+                    remove_cache_item(self.skin_material_cache, mat_cache)
                     return
             for mat_cache in self.tearline_material_cache:
                 if mat_cache.material == mat:
-                    utils.remove_from_collection(self.tearline_material_cache, mat_cache)
+                    remove_cache_item(self.tearline_material_cache, mat_cache)
                     return
             for mat_cache in self.eye_occlusion_material_cache:
                 if mat_cache.material == mat:
-                    utils.remove_from_collection(self.eye_occlusion_material_cache, mat_cache)
+                    remove_cache_item(self.eye_occlusion_material_cache, mat_cache)
                     return
             for mat_cache in self.eye_material_cache:
                 if mat_cache.material == mat:
-                    utils.remove_from_collection(self.eye_material_cache, mat_cache)
+                    remove_cache_item(self.eye_material_cache, mat_cache)
                     return
             for mat_cache in self.hair_material_cache:
                 if mat_cache.material == mat:
-                    utils.remove_from_collection(self.hair_material_cache, mat_cache)
+                    remove_cache_item(self.hair_material_cache, mat_cache)
                     return
             for mat_cache in self.pbr_material_cache:
                 if mat_cache.material == mat:
-                    utils.remove_from_collection(self.pbr_material_cache, mat_cache)
+                    remove_cache_item(self.pbr_material_cache, mat_cache)
                     return
             for mat_cache in self.sss_material_cache:
                 if mat_cache.material == mat:
-                    utils.remove_from_collection(self.sss_material_cache, mat_cache)
+                    remove_cache_item(self.sss_material_cache, mat_cache)
                     return
 
     def get_object_cache(self, obj, include_disabled=False, by_id=None):
         """Returns the object cache for this object.
         """
+        if obj:
+            indexed = vars.props().get_indexed_caches(self, "objects", obj.as_pointer())
+            if indexed is not None:
+                obj_cache: CC3ObjectCache
+                for chr_cache, obj_cache in indexed:
+                    if include_disabled or not obj_cache.disabled:
+                        if obj_cache.get_object() == obj:
+                            return obj_cache
+                if by_id:
+                    for chr_cache, obj_cache in vars.props().get_indexed_caches(self, "object_ids", by_id):
+                        if include_disabled or not obj_cache.disabled:
+                            if obj_cache.object_id == by_id:
+                                return obj_cache
+                return None
+        return self.search_object_cache(obj, include_disabled, by_id)
+
+    def search_object_cache(self, obj, include_disabled=False, by_id=None):
         if obj:
             # by object
             for obj_cache in self.object_cache:
@@ -1813,7 +1918,7 @@ class CC3CharacterCache(bpy.types.PropertyGroup):
             for obj_cache in self.object_cache:
                 cache_object = obj_cache.get_object()
                 if cache_object and cache_object == obj:
-                    utils.remove_from_collection(self.object_cache, obj_cache)
+                    remove_cache_item(self.object_cache, obj_cache)
                     return
 
     def has_cache_objects(self, objects, include_disabled=False):
@@ -1894,6 +1999,7 @@ class CC3CharacterCache(bpy.types.PropertyGroup):
         if obj_cache is None:
             utils.log_info(f"Creating Object Cache for: {obj.name}")
             obj_cache = self.object_cache.add()
+            invalidate_cache_index()
             obj_cache.object_id = utils.generate_random_id(20)
             if copy_from:
                 utils.log_info(f"Copying object cache from: {copy_from}")
@@ -1932,6 +2038,21 @@ class CC3CharacterCache(bpy.types.PropertyGroup):
         Fetches the material cache for the material. Returns None if the material is not in the cache.
         """
 
+        mat_cache: CC3MaterialCache
+        if mat is not None:
+            indexed = vars.props().get_indexed_caches(self, "materials", mat.as_pointer())
+            if indexed is not None:
+                for chr_cache, mat_cache in indexed:
+                    if mat_cache.material == mat:
+                        return mat_cache
+                if by_id:
+                    for chr_cache, mat_cache in vars.props().get_indexed_caches(self, "material_ids", by_id):
+                        if mat_cache.material_id == by_id:
+                            return mat_cache
+                return None
+        return self.search_material_cache(mat, by_id)
+
+    def search_material_cache(self, mat, by_id=None):
         mat_cache: CC3MaterialCache
         if mat is not None:
             for mat_cache in self.eye_material_cache:
@@ -2004,7 +2125,9 @@ class CC3CharacterCache(bpy.types.PropertyGroup):
             if collection[i].material is None:
                 utils.log_info(f"Reusing material cache: {str(i)}")
                 return collection[i]
-        return collection.add()
+        mat_cache = collection.add()
+        invalidate_cache_index()
+        return mat_cache
 
 
     def get_material_cache_collection(self, material_type):
@@ -2065,9 +2188,11 @@ class CC3CharacterCache(bpy.types.PropertyGroup):
             mat_cache.check_id()
         return mat_cache
 
-    def get_json_data(self):
+    def get_json_data(self, copy=False):
+        """Returns the (cached) json data of the character import file.
+           Request a copy if the json data will be modified."""
         errors = []
-        return jsonutils.read_json(self.import_file, errors)
+        return jsonutils.read_json(self.import_file, errors, copy=copy)
 
     def write_json_data(self, json_data):
         jsonutils.write_json(json_data, self.import_file, is_fbx_path=True)
@@ -2220,6 +2345,7 @@ class CC3CharacterCache(bpy.types.PropertyGroup):
             self.pbr_material_cache.clear()
             self.sss_material_cache.clear()
             self.proportion_editing_actions.clear()
+            invalidate_cache_index()
         else:
             clean_collection_property(self.object_cache)
             clean_collection_property(self.tongue_material_cache)
@@ -2468,6 +2594,7 @@ class CC3ImportProps(bpy.types.PropertyGroup):
 
     def add_character_cache(self, copy_from=None):
         chr_cache = self.import_cache.add()
+        invalidate_cache_index()
         if copy_from:
             exclude_list = ["*_material_cache", "object_cache"]
             utils.copy_property_group(copy_from, chr_cache, exclude=exclude_list)
@@ -2496,19 +2623,65 @@ class CC3ImportProps(bpy.types.PropertyGroup):
                         return chr_cache
         return None
 
+    def get_cache_index(self):
+        """The index is invalidated when cache items are added or removed, when the indexed
+           properties change and on undo, redo and file load (which invalidate all pointers)."""
+        index = CACHE_INDEX
+        if not index["valid"] or index["props"] != self.as_pointer():
+            characters = {}
+            materials = {}
+            material_ids = {}
+            objects = {}
+            object_ids = {}
+            for c, chr_cache in enumerate(self.import_cache):
+                characters[chr_cache.as_pointer()] = c
+                for i, obj_cache in enumerate(chr_cache.object_cache):
+                    if obj_cache.object:
+                        objects.setdefault(obj_cache.object.as_pointer(), []).append((c, "object_cache", i))
+                    if obj_cache.object_id:
+                        object_ids.setdefault(obj_cache.object_id, []).append((c, "object_cache", i))
+                for collection_name in MATERIAL_CACHE_COLLECTIONS:
+                    for i, mat_cache in enumerate(getattr(chr_cache, collection_name)):
+                        if mat_cache.material:
+                            materials.setdefault(mat_cache.material.as_pointer(), []).append((c, collection_name, i))
+                        if mat_cache.material_id:
+                            material_ids.setdefault(mat_cache.material_id, []).append((c, collection_name, i))
+            index["characters"] = characters
+            index["materials"] = materials
+            index["material_ids"] = material_ids
+            index["objects"] = objects
+            index["object_ids"] = object_ids
+            index["props"] = self.as_pointer()
+            index["valid"] = True
+        return index
+
+    def get_indexed_caches(self, chr_cache, key, value):
+        """Returns [ (chr_cache, cache), ... ] of the indexed object or material caches for the value,
+           in character order and only for chr_cache if given.
+           Returns None if the character is not in the index."""
+        index = self.get_cache_index()
+        if chr_cache:
+            c = index["characters"].get(chr_cache.as_pointer(), -1)
+            if c < 0 or self.import_cache[c] != chr_cache:
+                return None
+        caches = []
+        for c, collection_name, i in index[key].get(value, []):
+            if c < len(self.import_cache) and (chr_cache is None or self.import_cache[c] == chr_cache):
+                cache_chr = self.import_cache[c]
+                collection = getattr(cache_chr, collection_name)
+                if i < len(collection):
+                    caches.append((cache_chr, collection[i]))
+        return caches
+
     def get_character_cache(self, obj, mat):
         if obj:
-            for chr_cache in self.import_cache:
-                if not chr_cache.disabled:
-                    obj_cache = chr_cache.get_object_cache(obj)
-                    if obj_cache and not obj_cache.disabled:
-                        return chr_cache
+            for chr_cache, obj_cache in self.get_indexed_caches(None, "objects", obj.as_pointer()):
+                if not chr_cache.disabled and not obj_cache.disabled and obj_cache.get_object() == obj:
+                    return chr_cache
         if mat:
-            for chr_cache in self.import_cache:
-                if not chr_cache.disabled:
-                    mat_cache = chr_cache.get_material_cache(mat)
-                    if mat_cache and not mat_cache.disabled:
-                        return chr_cache
+            for chr_cache, mat_cache in self.get_indexed_caches(None, "materials", mat.as_pointer()):
+                if not chr_cache.disabled and not mat_cache.disabled and mat_cache.material == mat:
+                    return chr_cache
         return None
 
     def get_avatars(self):
@@ -2526,18 +2699,52 @@ class CC3ImportProps(bpy.types.PropertyGroup):
                 return chr_cache
         return None
 
+    def get_character_index(self, rebuild=False):
+        index = CHARACTER_INDEX
+        if rebuild or not index["valid"] or index["count"] != len(self.import_cache):
+            link_ids = {}
+            names = {}
+            for i, chr_cache in enumerate(self.import_cache):
+                if not chr_cache.disabled:
+                    if chr_cache.link_id and chr_cache.link_id not in link_ids:
+                        link_ids[chr_cache.link_id] = i
+                    if chr_cache.character_name and chr_cache.character_name not in names:
+                        names[chr_cache.character_name] = i
+            index["link_id"] = link_ids
+            index["name"] = names
+            index["count"] = len(self.import_cache)
+            index["valid"] = True
+        return index
+
+    def lookup_character_index(self, key, value, prop_name):
+        """Returns the indexed character cache where chr_cache.prop_name == value,
+           rebuilding the index once if the entry is stale."""
+        for rebuild in [False, True]:
+            index = self.get_character_index(rebuild)
+            i = index[key].get(value, -1)
+            if i < 0:
+                return None
+            if i < len(self.import_cache):
+                chr_cache = self.import_cache[i]
+                if not chr_cache.disabled and getattr(chr_cache, prop_name) == value:
+                    return chr_cache
+        return None
+
+    def add_character_alias(self, alias, chr_cache):
+        if alias and chr_cache.link_id and alias != chr_cache.link_id:
+            CHARACTER_INDEX["alias"][alias] = chr_cache.link_id
+
     def find_character_by_name(self, name):
         if name:
-            for chr_cache in self.import_cache:
-                if not chr_cache.disabled and chr_cache.character_name == name:
-                    return chr_cache
+            return self.lookup_character_index("name", name, "character_name")
         return None
 
-    def find_character_by_link_id(self, link_id):
+    def find_character_by_link_id(self, link_id, use_alias=False):
         if link_id:
-            for chr_cache in self.import_cache:
-                if not chr_cache.disabled and chr_cache.link_id == link_id:
-                    return chr_cache
+            chr_cache = self.lookup_character_index("link_id", link_id, "link_id")
+            if not chr_cache and use_alias and link_id in CHARACTER_INDEX["alias"]:
+                chr_cache = self.lookup_character_index("link_id", CHARACTER_INDEX["alias"][link_id], "link_id")
+            return chr_cache
         return None
 
     def get_context_character_cache(self, context = None):
@@ -2563,17 +2770,15 @@ class CC3ImportProps(bpy.types.PropertyGroup):
 
     def get_object_cache(self, obj, include_disabled=False):
         if obj:
-            for chr_cache in self.import_cache:
-                obj_cache = chr_cache.get_object_cache(obj, include_disabled=include_disabled)
-                if obj_cache:
+            for chr_cache, obj_cache in self.get_indexed_caches(None, "objects", obj.as_pointer()):
+                if (include_disabled or not obj_cache.disabled) and obj_cache.get_object() == obj:
                     return obj_cache
         return None
 
     def get_material_cache(self, mat):
         if mat:
-            for imp_cache in self.import_cache:
-                mat_cache = imp_cache.get_material_cache(mat)
-                if mat_cache:
+            for chr_cache, mat_cache in self.get_indexed_caches(None, "materials", mat.as_pointer()):
+                if mat_cache.material == mat:
                     return mat_cache
         return None
 
@@ -2638,6 +2843,7 @@ class CC3ImportProps(bpy.types.PropertyGroup):
             if not chr_cache.is_valid():
                 chr_cache.clean_up()
         clean_collection_property(self.import_cache)
+        invalidate_character_index()
 
     def validate_and_clean_up(self):
         if not self.validate():
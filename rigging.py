@@ -3218,6 +3218,7 @@ def finish_rigify_export(chr_cache, export_rig, export_actions, vertex_group_map
 #
 #
 
+@utils.profiled("Bake Rig Animation", operation=True)
 def bake_rig_animation(chr_cache, rig, action, shape_key_objects, clear_constraints, limit_view_layer, action_name = ""):
 
     armature_action = None
@@ -3439,9 +3440,10 @@ class CC3Rigifier(bpy.types.Operator):
             settings = self.rigid_body_systems[parent_mode]
             rigidbody.build_spring_rigid_body_system(chr_cache, spring_rig_prefix, spring_rig_name, settings)
 
+    @utils.profiled("Generate Meta-Rig", operation=True)
     def generate_meta_rig(self, chr_cache, advanced_mode = False):
 
-        utils.start_timer()
+        start_time = utils.start_timer()
 
         utils.log_info("")
         utils.log_info("Beginning Meta-Rig Setup:")
@@ -3458,7 +3460,7 @@ class CC3Rigifier(bpy.types.Operator):
 
                 self.report({'INFO'}, "Meta-rig generated!")
 
-        utils.log_timer("Done Meta-Rig Setup!")
+        utils.log_timer("Done Meta-Rig Setup!", start=start_time)
 
     def match_meta_rig(self, chr_cache):
         """Map the bones of the meta rig to match the CC3 rig.
@@ -3495,9 +3497,10 @@ class CC3Rigifier(bpy.types.Operator):
                 # set rigify rig params
                 set_rigify_params(self.meta_rig)
 
+    @utils.profiled("Rigify", operation=True)
     def rigify_meta_rig(self, chr_cache, advanced_mode = False):
 
-        utils.start_timer()
+        start_time = utils.start_timer()
 
         face_result = -1
 
@@ -3540,7 +3543,7 @@ class CC3Rigifier(bpy.types.Operator):
                     clean_up(chr_cache, self.cc3_rig, self.rigify_rig, self.meta_rig, remove_meta = False) #not advanced_mode)
                     #self.restore_rigify_rigid_body_systems(chr_cache)
 
-        utils.log_timer("Done Rigify Process!")
+        utils.log_timer("Done Rigify Process!", start=start_time)
 
         # keep the meta_rig data
         #chr_cache.rig_meta_rig = None
@@ -3553,9 +3556,10 @@ class CC3Rigifier(bpy.types.Operator):
             self.report({'ERROR'}, "Rigify Incomplete! Face rig weighting Failed!. See console log.")
 
 
+    @utils.profiled("Re-Rigify", operation=True)
     def re_rigify_meta_rig(self, chr_cache, advanced_mode = False):
 
-        utils.start_timer()
+        start_time = utils.start_timer()
 
         face_result = -1
 
@@ -3604,7 +3608,7 @@ class CC3Rigifier(bpy.types.Operator):
                     self.cc3_rig.hide_set(True)
                     self.meta_rig.hide_set(True)
 
-        utils.log_timer("Done Rigify Process!")
+        utils.log_timer("Done Rigify Process!", start=start_time)
 
         # keep the meta_rig data
         #chr_cache.rig_meta_rig = None
@@ -887,6 +887,7 @@ def unfix_quat(q):
     return [q[1], q[2], q[3], q[0]]
 
 
+@utils.profiled("Rigid Body Colliders")
 def build_rigid_body_colliders(chr_cache, json_data, first_import = False, bone_mapping = None):
     physics_json = None
     if json_data:
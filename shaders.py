@@ -17,19 +17,107 @@
 import bpy
 import math
 import os
+import operator
 from mathutils import Vector, Color
 
 from . import imageutils, jsonutils, meshutils, materials, wrinkle, nodeutils, params, utils, vars
 
 
+# compiled shader matrix expressions:
+#   prop_name -> attribute getter, (func, args) -> parameter function, code -> code object
+COMPILED_GETTERS = {}
+COMPILED_CODE = {}
+# id(shader_def) -> { prop_name: { "inputs": [...], "bsdf": [...], "textures": [...], ... } }
+SHADER_BINDINGS = {}
+
+
+def get_prop_getter(prop_name):
+    getter = COMPILED_GETTERS.get(prop_name)
+    if getter is None:
+        getter = operator.attrgetter(prop_name)
+        COMPILED_GETTERS[prop_name] = getter
+    return getter
+
+
+def compile_param_func(func, args):
+    """Compiles the shader matrix expression func(parameters.arg, ...) into a function of the parameters.
+       If func is empty or "=" the expression is the first parameter arg."""
+    key = (func, tuple(args))
+    getter = COMPILED_GETTERS.get(key)
+    if getter is None:
+        arg_getters = tuple(get_prop_getter(arg) for arg in args)
+        if func == "" or func == "=":
+            getter = arg_getters[0]
+        else:
+            f = globals()[func]
+            if len(arg_getters) == 1:
+                g = arg_getters[0]
+                getter = lambda parameters: f(g(parameters))
+            else:
+                getter = lambda parameters: f(*[g(parameters) for g in arg_getters])
+        COMPILED_GETTERS[key] = getter
+    return getter
+
+
+def compile_code(code):
+    code_object = COMPILED_CODE.get(code)
+    if code_object is None:
+        code_object = compile(code, "<shader matrix>", "exec")
+        COMPILED_CODE[code] = code_object
+    return code_object
+
+
+def exec_code(code, **scope):
+    exec(compile_code(code), globals(), scope)
+
+
+def get_shader_bindings(shader_def):
+    """Returns the index of the shader definition bindings affected by each parameter:
+       { prop_name: { "inputs": [input_def], "bsdf": [input_def], "textures": [texture_def],
+                      "mapping": [(texture_type, mapping_def)], "modifiers": [mod_def], "settings": [setting_def] } }"""
+    key = id(shader_def)
+    bindings = SHADER_BINDINGS.get(key)
+    if bindings is None:
+        bindings = {}
+
+        def bind(prop_names, group, binding):
+            for prop_name in dict.fromkeys(prop_names):
+                bindings.setdefault(prop_name, {}).setdefault(group, []).append(binding)
+
+        for group in ["inputs", "bsdf"]:
+            for input_def in shader_def.get(group, []):
+                bind(input_def[2:], group, input_def)
+        for texture_def in shader_def.get("textures", []):
+            if len(texture_def) > 5:
+                bind(texture_def[5:], "textures", texture_def)
+        texture_type = None
+        for mapping_def in shader_def.get("mapping", []):
+            if len(mapping_def) == 1:
+                texture_type = mapping_def[0]
+            elif texture_type:
+                bind(mapping_def[3:], "mapping", (texture_type, mapping_def))
+        for mod_def in shader_def.get("modifiers", []):
+            bind([mod_def[0]], "modifiers", mod_def)
+        for setting_def in shader_def.get("settings", []):
+            bind([setting_def[0]], "settings", setting_def)
+        SHADER_BINDINGS[key] = bindings
+    return bindings
+
+
 def get_prop_value(mat_cache, prop_name):
-    parameters = mat_cache.parameters
     try:
-        return eval("parameters." + prop_name, None, locals())
+        return get_prop_getter(prop_name)(mat_cache.parameters)
     except:
         return None
 
 
+def set_prop_value(parameters, prop_name, value):
+    path, dot, attr = prop_name.rpartition(".")
+    if path:
+        parameters = get_prop_getter(path)(parameters)
+    setattr(parameters, attr, value)
+
+
 def eval_texture_rules(tex_type):
     prefs = vars.prefs()
 
@@ -52,7 +140,7 @@ def exec_var_param(var_def, mat_cache, mat_json):
         func = var_def[2]
         args = var_def[3:]
 
-        exec_expression = str(default_value)
+        value = default_value
 
         if mat_json:
 
@@ -60,128 +148,61 @@ def exec_var_param(var_def, mat_cache, mat_json):
                 # expression is json var value
                 json_value = jsonutils.get_material_json_var(mat_json, args[0])
                 if json_value is not None:
-                    exec_expression = str(json_value)
+                    value = json_value
 
             elif func != "DEF" and not args:
-                exec_expression = func + f"({default_value})"
+                value = globals()[func](default_value)
 
             elif func != "DEF" and args:
-                # construct eval function code
-                func_expression = func + "("
-                first = True
-                missing_args = False
-                for arg in args:
-                    if not first:
-                        func_expression += ", "
-                    first = False
-                    arg_value = jsonutils.get_material_json_var(mat_json, arg)
-                    if arg_value is None:
-                        missing_args = True
-                    func_expression += str(arg_value)
-                func_expression += ")"
-                if not missing_args:
-                    exec_expression = func_expression
-
-        exec_code = "parameters." + prop_name + " = " + exec_expression
-        exec(exec_code, None, locals())
-        utils.log_info("Applying: " + exec_code)
+                # evaluate the function of the json var values
+                arg_values = [ jsonutils.get_material_json_var(mat_json, arg) for arg in args ]
+                if None not in arg_values:
+                    value = globals()[func](*arg_values)
+
+        set_prop_value(parameters, prop_name, value)
+        utils.log_info(f"Applying: parameters.{prop_name} = {value}")
     except:
-        utils.log_error("exec_var_param(): error in expression: " + exec_code)
+        utils.log_error(f"exec_var_param(): error in expression: parameters.{var_def[0]}")
         utils.log_error(str(var_def))
 
 
 def eval_input_param(input_def, mat_cache):
     try:
-        parameters = mat_cache.parameters
-
-        input_socket = input_def[0]
-        func = input_def[1]
-        args = input_def[2:]
-
-        if func == "" or func == "=":
-            # expression is mat_cache parameter
-            exec_expression = "parameters." + args[0]
-
-        else:
-            # construct eval function code
-            exec_expression = func + "("
-            first = True
-            for arg in args:
-                if not first:
-                    exec_expression += ", "
-                first = False
-                exec_expression += "parameters." + arg
-            exec_expression += ")"
-
-        return eval(exec_expression, None, locals())
+        return compile_param_func(input_def[1], input_def[2:])(mat_cache.parameters)
     except:
-        utils.log_error("eval_input_param(): error in expression: " + exec_expression)
+        utils.log_error(f"eval_input_param(): error in expression: {input_def}")
         return None
 
 
 def eval_tiling_param(texture_def, mat_cache, start_index = 4):
     try:
-        parameters = mat_cache.parameters
-
-        func = texture_def[start_index]
-        args = texture_def[start_index + 1:]
-
-        if func == "" or func == "=":
-            # expression is mat_cache parameter
-            exec_expression = "parameters." + args[0]
-
-        else:
-            # construct eval function code
-            exec_expression = func + "("
-            first = True
-            for arg in args:
-                if not first:
-                    exec_expression += ", "
-                first = False
-                exec_expression += "parameters." + arg
-            exec_expression += ")"
-
-        return eval(exec_expression, None, locals())
+        return compile_param_func(texture_def[start_index], texture_def[start_index + 1:])(mat_cache.parameters)
     except:
-        utils.log_error("eval_tiling_param(): error in expression: " + exec_expression)
+        utils.log_error(f"eval_tiling_param(): error in expression: {texture_def}")
         return None
 
 
 def eval_parameters_func(parameters, func, args, default = None):
     try:
-        # construct eval function code
-        exec_expression = func + "("
-        first = True
-        for arg in args:
-            if not first:
-                exec_expression += ", "
-            first = False
-            exec_expression += "parameters." + arg
-        exec_expression += ")"
-
-        return eval(exec_expression, None, locals())
+        return compile_param_func(func, args)(parameters)
     except:
-        utils.log_error("eval_parameters_func(): error in expression: " + exec_expression)
+        utils.log_error(f"eval_parameters_func(): error in expression: {func} {args}")
         return default
 
 
 def eval_prop(prop_name, mat_cache):
     try:
-        parameters = mat_cache.parameters
-        exec_expression = "parameters." + prop_name
-        return eval(exec_expression, None, locals())
+        return get_prop_getter(prop_name)(mat_cache.parameters)
     except:
-        utils.log_error("eval_prop(): error in expression: " + exec_expression)
+        utils.log_error("eval_prop(): error in expression: parameters." + prop_name)
         return None
 
 
 def exec_prop(prop_name, mat_cache, value):
     try:
-        parameters = mat_cache.parameters
-        exec_expression = "parameters." + prop_name + " = " + str(value)
-        exec(exec_expression, None, locals())
+        set_prop_value(mat_cache.parameters, prop_name, value)
     except:
-        utils.log_error("exec_prop(): error in expression: " + exec_expression)
+        utils.log_error(f"exec_prop(): error in expression: parameters.{prop_name} = {value}")
         return None
 
 
@@ -267,6 +288,20 @@ def apply_basic_prop_matrix(node: bpy.types.Node, mat_cache, shader_name):
 # Prop matrix eval, parameter conversion functions
 #
 
+# preferences read by the conversion functions below,
+# a change in any of these changes the evaluated shader inputs.
+PARAMETER_PREFS = [
+    "render_target", "refractive_eyes", "cycles_ssr_iris_brightness",
+    "cycles_sss_skin_b410", "cycles_sss_skin_b341", "cycles_sss_hair_b410", "cycles_sss_hair_b341",
+    "cycles_sss_teeth_b410", "cycles_sss_teeth_b341", "cycles_sss_tongue_b410", "cycles_sss_tongue_b341",
+    "cycles_sss_eyes_b410", "cycles_sss_eyes_b341", "cycles_sss_default_b410", "cycles_sss_default_b341",
+]
+
+def get_parameter_prefs_stamp():
+    prefs = vars.prefs()
+    return tuple(getattr(prefs, pref_name, None) for pref_name in PARAMETER_PREFS)
+
+
 def func_iris_brightness(v):
     prefs = vars.prefs()
     if prefs.render_target == "CYCLES" and prefs.refractive_eyes == "SSR":
@@ -18,6 +18,10 @@ import os
 import platform
 import subprocess
 import time
+import json
+import threading
+import functools
+from contextlib import contextmanager
 import difflib
 import random
 import re
@@ -82,15 +86,17 @@ def log_error(msg, e: Exception = None):
 
 
 def start_timer():
+    """Starts the timer and returns the start time, to pass to log_timer when timers are nested."""
     global timer
     timer = time.perf_counter()
+    return timer
 
 
-def log_timer(msg, unit = "s"):
+def log_timer(msg, unit = "s", start = None):
     prefs = vars.prefs()
     global timer
     if prefs.log_level == "ALL":
-        duration = time.perf_counter() - timer
+        duration = time.perf_counter() - (timer if start is None else start)
         if unit == "ms":
             duration *= 1000
         elif unit == "us":
@@ -100,6 +106,125 @@ def log_timer(msg, unit = "s"):
         print(msg + ": " + str(duration) + " " + unit)
 
 
+class ProfileStage():
+    """Aggregated call count, wall and cpu time of a profiled stage and its sub-stages."""
+    name: str = ""
+    count: int = 0
+    wall: float = 0.0
+    cpu: float = 0.0
+    children: dict = None
+
+    def __init__(self, name):
+        self.name = name
+        self.children = {}
+
+    def child(self, name):
+        stage = self.children.get(name)
+        if stage is None:
+            stage = ProfileStage(name)
+            self.children[name] = stage
+        return stage
+
+    def to_dict(self):
+        return { "name": self.name,
+                 "count": self.count,
+                 "wall": self.wall,
+                 "cpu": self.cpu,
+                 "children": [ child.to_dict() for child in self.children.values() ] }
+
+    def folded(self, lines, path = ""):
+        path = f"{path};{self.name}" if path else self.name
+        self_wall = self.wall - sum(child.wall for child in self.children.values())
+        lines.append(f"{path} {max(0, int(self_wall * 1000000))}")
+        for child in self.children.values():
+            child.folded(lines, path)
+        return lines
+
+    def log(self, depth = 0):
+        log_always(f"{'   ' * depth}{self.name}: {self.wall:.3f}s wall, {self.cpu:.3f}s cpu, {self.count} calls")
+        for child in sorted(self.children.values(), key=lambda c: c.wall, reverse=True):
+            child.log(depth + 1)
+
+
+# stack of the active profile stages, the first is the operation being profiled
+PROFILE_STACK = []
+# operation name -> the profile of its last run
+PROFILE_RESULTS = {}
+PROFILE_THREAD = threading.main_thread()
+PROFILE_DIR = "profiles"
+
+
+def get_profile_dir():
+    try:
+        profile_dir = os.path.join(bpy.utils.user_resource("CONFIG", path="cc_blender_tools", create=True), PROFILE_DIR)
+        os.makedirs(profile_dir, exist_ok=True)
+        return profile_dir
+    except:
+        return None
+
+
+def write_profile_report(stage: ProfileStage):
+    """Writes the profile of the operation as a json tree and as folded stacks (for flamegraph.pl / speedscope)."""
+    profile_dir = get_profile_dir()
+    if profile_dir:
+        file_name = re.sub(r"[^\w\-]+", "_", stage.name).strip("_") or "profile"
+        try:
+            with open(os.path.join(profile_dir, file_name + ".json"), "w") as report_file:
+                json.dump(stage.to_dict(), report_file, indent=2)
+            with open(os.path.join(profile_dir, file_name + ".folded"), "w") as report_file:
+                report_file.write("\n".join(stage.folded([])) + "\n")
+        except Exception as e:
+            log_error(f"Unable to write profile report: {file_name}", e)
+
+
+def end_profile(stage: ProfileStage):
+    """Keeps the profile of the finished operation, logs it and writes the report files if enabled."""
+    prefs = vars.prefs()
+    PROFILE_RESULTS[stage.name] = stage
+    if prefs.log_level == "ALL" or prefs.log_level == "DETAILS":
+        stage.log()
+    if prefs.debug_profile_reports:
+        write_profile_report(stage)
+
+
+@contextmanager
+def profile(name, operation = False):
+    """Profiles the enclosed block as a stage of the current operation.
+       Stages outside of an operation are not profiled. An operation not nested in another
+       operation keeps its profile (and writes the report if enabled) when it ends. Only the main thread is profiled."""
+    if (not PROFILE_STACK and not operation) or threading.current_thread() is not PROFILE_THREAD:
+        yield None
+        return
+    if PROFILE_STACK:
+        stage = PROFILE_STACK[-1].child(name)
+    else:
+        stage = ProfileStage(name)
+    PROFILE_STACK.append(stage)
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    try:
+        yield stage
+    finally:
+        stage.wall += time.perf_counter() - wall
+        stage.cpu += time.process_time() - cpu
+        stage.count += 1
+        PROFILE_STACK.pop()
+        if not PROFILE_STACK:
+            end_profile(stage)
+
+
+def profiled(name = None, operation = False):
+    """Decorator to profile every call to the function as a stage (or operation)."""
+    def decorator(func):
+        stage_name = name or func.__name__
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with profile(stage_name, operation):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
 def message_box(message = "", title = "Info", icon = 'INFO'):
     def draw(self, context):
         self.layout.label(text = message)